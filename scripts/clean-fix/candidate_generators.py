@@ -10,6 +10,13 @@ judges each one (violation / exception) and never enumerates.
 the agent its closed list) and `record-unit` (to verify every candidate got a
 disposition), so generators must be deterministic and read-only.
 
+Parse-based generators read source through `source_corpus`: each `.rs` file is
+read, masked and scanned once per process, and the result is kept in an
+on-disk cache keyed by path, mtime_ns and size so unchanged files are not
+re-masked between helper invocations. When many files need scanning at once,
+`enumerate_candidates` fans the scans out over a process pool first; the
+corpus it builds is the same as the serial one.
+
 Superset rule: a mechanical exclude that can suppress a real violation is
 wrong even when it shrinks the list. Deliberate volume excludes (e.g. the
 COMMON_TYPES list in the field-naming generators) are documented inline; the
@@ -18,10 +25,18 @@ design doc's "generator drift" mitigation covers the residual risk.
 
 from __future__ import annotations
 
+import hashlib
+import json
+import os
 import re
 import subprocess
 import tomllib
+from bisect import bisect_right
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import asdict
 from dataclasses import dataclass
+from functools import cached_property
 from pathlib import Path
 from typing import Callable
 from typing import cast
@@ -30,6 +45,23 @@ from typing import cast
 # dirty project — refuse loudly instead of flooding the agent prompt.
 MAX_CANDIDATES = 150
 
+# Parsed-source cache, one JSON file per project root. Bump the version when
+# masking or any scanner below changes what it produces for the same text.
+CORPUS_CACHE_DIR = Path(os.environ.get("CANDIDATES_CORPUS_CACHE_DIR", "/tmp/claude/candidate-corpus"))
+CORPUS_CACHE_VERSION = 3
+
+# Files left to scan after the cache is consulted fan out over a process pool
+# once there are at least this many; below it, worker start-up costs more than
+# the scans. Each worker takes files in chunks of PARALLEL_SCAN_CHUNK.
+PARALLEL_SCAN_MIN_FILES = 64
+PARALLEL_SCAN_CHUNK = 16
+SCAN_WORKERS = os.cpu_count() or 1
+
+# Part of every enumeration memo key (`enumeration_key`). Bump it when a
+# generator changes what it returns for the same spec and files, so lists
+# memoized under the old code are not reused.
+ENUMERATION_KEY_VERSION = 1
+
 
 @dataclass(frozen=True)
 class Candidate:
@@ -143,14 +175,143 @@ class StringLiteral:
     kind: str  # "string" | "char"
 
 
+class LineIndex:
+    """Offsets into `"\\n".join(lines)` mapped to 1-based lines and back."""
+
+    def __init__(self, lines: list[str]) -> None:
+        starts = [0]
+        offset = 0
+        for line in lines[:-1]:
+            offset += len(line) + 1
+            starts.append(offset)
+        self.starts: list[int] = starts
+
+    def line(self, offset: int) -> int:
+        return bisect_right(self.starts, offset)
+
+    def col(self, offset: int) -> int:
+        return offset - self.starts[self.line(offset) - 1]
+
+    def offset(self, line: int, col: int) -> int:
+        return self.starts[line - 1] + col
+
+
+_BRACE_RE = re.compile(r"[{}]")
+
+
 @dataclass(frozen=True)
 class MaskedSource:
     lines: list[str]  # masked text, parallel to the original lines
     strings: list[StringLiteral]
 
+    # Derived views shared by the structural scanners and generators; each is
+    # built on first use, once per file.
+
+    @cached_property
+    def text(self) -> str:
+        return "\n".join(self.lines)
+
+    @cached_property
+    def line_index(self) -> LineIndex:
+        return LineIndex(self.lines)
+
+    @cached_property
+    def line_depths(self) -> list[int]:
+        """Brace depth at the start of each line (not clamped at zero)."""
+        depths: list[int] = []
+        depth = 0
+        for line in self.lines:
+            depths.append(depth)
+            depth += line.count("{") - line.count("}")
+        return depths
+
+    @cached_property
+    def brace_pairs(self) -> dict[int, int]:
+        """Offset of each `{` in `text` -> offset of its matching `}`."""
+        pairs: dict[int, int] = {}
+        open_braces: list[int] = []
+        for brace in _BRACE_RE.finditer(self.text):
+            if brace.group() == "{":
+                open_braces.append(brace.start())
+            elif open_braces:
+                pairs[open_braces.pop()] = brace.start()
+        return pairs
+
+    def depth_at(self, line_idx: int, col: int) -> int:
+        """Brace depth just before column `col` of 0-based line `line_idx`."""
+        head = self.lines[line_idx][:col]
+        return self.line_depths[line_idx] + head.count("{") - head.count("}")
+
+    def closing_line(self, open_line: int, open_col: int) -> int | None:
+        """0-based line of the `}` matching the `{` at (open_line, open_col)."""
+        close = self.brace_pairs.get(self.line_index.offset(open_line + 1, open_col))
+        return None if close is None else self.line_index.line(close) - 1
+
+    def block_lines(self, open_line: int, open_col: int) -> range:
+        """Lines after the `{` at (open_line, open_col) through its `}` line.
+
+        An unclosed block runs to the end of the file.
+        """
+        close_line = self.closing_line(open_line, open_col)
+        return range(open_line + 1, (len(self.lines) - 1 if close_line is None else close_line) + 1)
+
+
+# One alternative per lexical event the masker acts on. The leading character
+# class lets the regex engine skip plain code in C; each alternative then
+# checks which character it consumed and takes the rest of the token where a
+# regex can: line comments, terminated strings and char literals. A `'` that is
+# neither char form is a lifetime and stays code. Block comments (nesting),
+# unterminated strings and raw strings (a `"` preceded by `r#*`) are finished
+# by hand.
+_MASK_EVENT_RE = re.compile(
+    r"""
+    [/"']
+    (?:
+      (?<=/) (?P<line>/[^\n]*)
+    | (?<=/) (?P<block>\*)
+    | (?<=") (?P<string>(?P<string_text>[^"\\]*(?:\\.[^"\\]*)*)")
+    | (?<=") (?P<string_open>)
+    | (?<=') (?P<char>(?P<char_text>\\[^']{0,10}|[^\\])')
+    )
+    """,
+    re.DOTALL | re.VERBOSE,
+)
+_BLOCK_COMMENT_TOKEN_RE = re.compile(r"/\*|\*/")
+_IDENT_CHARS = frozenset("ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789_")
+
+
+def _blanked(segment: str) -> str:
+    if "\n" not in segment:
+        return " " * len(segment)
+    return "\n".join(" " * len(part) for part in segment.split("\n"))
+
+
+def _block_comment_end(text: str, start: int) -> int:
+    """End (exclusive) of the nested block comment opened at `start`, or EOF."""
+    depth = 1
+    for token in _BLOCK_COMMENT_TOKEN_RE.finditer(text, start + 2):
+        depth += 1 if token.group() == "/*" else -1
+        if not depth:
+            return token.end()
+    return len(text)
 
-_RAW_OPEN_RE = re.compile(r'b?r(#*)"')
-_IDENT_CHAR_RE = re.compile(r"[A-Za-z0-9_]")
+
+def _raw_string_start(text: str, quote: int) -> int | None:
+    """Start of the `r#*"` / `br#*"` opener ending at `quote`, if it is one.
+
+    The `b` or `r` must not continue an identifier (`for"` is not an opener).
+    """
+    start = quote
+    while start and text[start - 1] == "#":
+        start -= 1
+    if not start or text[start - 1] != "r":
+        return None
+    start -= 1
+    if start and text[start - 1] == "b":
+        start -= 1
+    if start and text[start - 1] in _IDENT_CHARS:
+        return None
+    return start
 
 
 def mask_source(text: str) -> MaskedSource:
@@ -158,100 +319,72 @@ def mask_source(text: str) -> MaskedSource:
 
     Handles line and nested block comments, plain/byte strings with escapes,
     raw strings (`r"..."`, `r#"..."#`), and char literals vs lifetimes.
+
+    Code between two events is copied through as one slice, so the cost
+    scales with the number of comments and literals rather than characters.
     """
-    out = list(text)
     n = len(text)
-    literal_spans: list[tuple[int, int, str]] = []  # (start, end_exclusive, kind)
-
-    def blank(a: int, b: int) -> None:
-        for j in range(a, min(b, n)):
-            if out[j] != "\n":
-                out[j] = " "
-
-    i = 0
-    while i < n:
-        c = text[i]
-        nxt = text[i + 1] if i + 1 < n else ""
-        if c == "/" and nxt == "/":
-            j = text.find("\n", i)
-            j = n if j == -1 else j
-            blank(i, j)
-            i = j
-            continue
-        if c == "/" and nxt == "*":
-            depth = 1
-            j = i + 2
-            while j < n and depth:
-                if text[j : j + 2] == "/*":
-                    depth += 1
-                    j += 2
-                elif text[j : j + 2] == "*/":
-                    depth -= 1
-                    j += 2
-                else:
-                    j += 1
-            blank(i, j)
-            i = j
-            continue
-        if c in "br":
-            prev = text[i - 1] if i > 0 else " "
-            raw_match = _RAW_OPEN_RE.match(text, i)
-            if raw_match is not None and _IDENT_CHAR_RE.match(prev) is None:
-                closer = '"' + "#" * len(raw_match.group(1))
-                j = text.find(closer, raw_match.end())
-                j = n if j == -1 else j + len(closer)
-                literal_spans.append((raw_match.end(), max(raw_match.end(), j - len(closer)), "string"))
-                blank(i, j)
-                i = j
-                continue
-        if c == '"':
-            j = i + 1
-            while j < n:
-                if text[j] == "\\":
-                    j += 2
-                    continue
-                if text[j] == '"':
+    pieces: list[str] = []
+    append = pieces.append
+    literal_spans: list[tuple[int, int, str]] = []  # (start, end_exclusive, kind) of the contents
+    copied = 0  # text[:copied] is already in `pieces`
+    pos = 0
+    while pos < n:
+        resume = n
+        for event in _MASK_EVENT_RE.finditer(text, pos):
+            group = event.lastgroup
+            start = event.start()
+            if group == "char":
+                literal_spans.append((start + 1, event.end() - 1, "char"))
+            elif group == "block":
+                resume = _block_comment_end(text, start)
+                append(text[copied:start])
+                append(_blanked(text[start:resume]))
+                copied = resume
+                break
+            elif group != "line":
+                raw_start = _raw_string_start(text, start) if start and text[start - 1] in "#r" else None
+                if raw_start is not None:
+                    closer = '"' + text[raw_start:start].lstrip("br")
+                    close = text.find(closer, start + 1)
+                    if close == -1:
+                        literal_spans.append((start + 1, max(start + 1, n - len(closer)), "string"))
+                    else:
+                        literal_spans.append((start + 1, close, "string"))
+                        resume = close + len(closer)
+                    append(text[copied:raw_start])
+                    append(_blanked(text[raw_start:resume]))
+                    copied = resume
                     break
-                j += 1
-            literal_spans.append((i + 1, min(j, n), "string"))
-            blank(i, j + 1)
-            i = j + 1
-            continue
-        if c == "'":
-            if nxt == "\\":
-                j = text.find("'", i + 2)
-                if j != -1 and j - i <= 12:
-                    literal_spans.append((i + 1, j, "char"))
-                    blank(i, j + 1)
-                    i = j + 1
-                    continue
-            elif nxt and text[i + 2 : i + 3] == "'":
-                literal_spans.append((i + 1, i + 2, "char"))
-                blank(i, i + 3)
-                i = i + 3
-                continue
-        i += 1
-
-    line_starts = [0]
-    for idx, ch in enumerate(text):
-        if ch == "\n":
-            line_starts.append(idx + 1)
-
-    def offset_line_col(offset: int) -> tuple[int, int]:
-        lo, hi = 0, len(line_starts) - 1
-        while lo < hi:
-            mid = (lo + hi + 1) // 2
-            if line_starts[mid] <= offset:
-                lo = mid
-            else:
-                hi = mid - 1
-        return lo + 1, offset - line_starts[lo]
-
+                if group == "string_open":
+                    # No closing quote before EOF: the literal runs to the end.
+                    literal_spans.append((start + 1, n, "string"))
+                    append(text[copied:start])
+                    append(_blanked(text[start:]))
+                    copied = n
+                    break
+                literal_spans.append((start + 1, event.end() - 1, "string"))
+            append(text[copied:start])
+            append(_blanked(event.group()))
+            copied = event.end()
+        pos = resume
+    append(text[copied:])
+
+    # Each literal is anchored on the character before its contents (the
+    # opening quote). Offsets only grow, so newlines are counted incrementally.
     strings: list[StringLiteral] = []
+    line = 1
+    line_start = 0
+    counted = 0
     for start, end, kind in literal_spans:
-        line, col = offset_line_col(max(start - 1, 0))
-        strings.append(StringLiteral(line=line, col=col, text=text[start:end], kind=kind))
-    return MaskedSource(lines="".join(out).splitlines(), strings=strings)
+        offset = start - 1
+        newlines = text.count("\n", counted, offset)
+        if newlines:
+            line += newlines
+            line_start = text.rfind("\n", counted, offset) + 1
+        counted = offset
+        strings.append(StringLiteral(line=line, col=offset - line_start, text=text[start:end], kind=kind))
+    return MaskedSource(lines="".join(pieces).splitlines(), strings=strings)
 
 
 # ---------------------------------------------------------------------------
@@ -259,15 +392,167 @@ def mask_source(text: str) -> MaskedSource:
 # ---------------------------------------------------------------------------
 
 
-def rust_files(project_root: Path) -> list[Path]:
-    files: list[Path] = []
-    for path in sorted(project_root.rglob("*.rs")):
-        rel = path.relative_to(project_root).as_posix()
-        parts = rel.split("/")
-        if "target" in parts or any(part.startswith(".") for part in parts):
+# Checkout toplevel per project root, or None outside git. Memoized per
+# process: one helper run lists a project a handful of times and its checkout
+# does not move under it.
+_git_toplevels: dict[Path, Path | None] = {}
+
+
+def git_toplevel(project_root: Path) -> Path | None:
+    """Top directory of the git checkout `project_root` is in, or None."""
+    if project_root in _git_toplevels:
+        return _git_toplevels[project_root]
+    result = subprocess.run(
+        ["git", "-C", str(project_root), "rev-parse", "--show-toplevel"],
+        capture_output=True,
+        text=True,
+        check=False,
+    )
+    toplevel = Path(result.stdout.strip()) if result.returncode == 0 and result.stdout.strip() else None
+    _git_toplevels[project_root] = toplevel
+    return toplevel
+
+
+@dataclass(frozen=True)
+class ProjectListing:
+    """The project files generators look at, outside `target/` and dot-dirs."""
+
+    rust_files: tuple[Path, ...]
+    manifests: frozenset[Path]  # every Cargo.toml
+
+
+def _is_pruned(rel: str) -> bool:
+    parts = rel.split("/")
+    return "target" in parts or any(part.startswith(".") for part in parts)
+
+
+_GITMODULES_PATH_RE = re.compile(r"^\s*path\s*=\s*(.+?)\s*$", re.MULTILINE)
+
+
+def _submodule_dirs(project_root: Path, toplevel: Path) -> list[Path]:
+    """Submodule checkouts under `project_root`, from the toplevel `.gitmodules`."""
+    try:
+        text = (toplevel / ".gitmodules").read_text()
+    except (OSError, UnicodeDecodeError):
+        return []
+    # git reports the toplevel fully resolved; map back onto `project_root`
+    # as the caller spelled it so listed paths keep one form.
+    resolved_root = project_root.resolve()
+    dirs: list[Path] = []
+    for match in _GITMODULES_PATH_RE.finditer(text):
+        path = toplevel / match.group(1)
+        if path.is_relative_to(resolved_root) and path != resolved_root:
+            path = project_root / path.relative_to(resolved_root)
+            if path.is_dir():
+                dirs.append(path)
+    return dirs
+
+
+def _git_listing(project_root: Path, toplevel: Path) -> ProjectListing | None:
+    """Tracked plus untracked-but-not-ignored files, as git sees them.
+
+    git does not list inside submodules (tracked as a gitlink) or untracked
+    nested repositories (listed as `dir/`); those are walked like a non-git
+    tree, so their sources are included as the plain walk would include them.
+    """
+    result = subprocess.run(
+        [
+            "git",
+            "-C",
+            str(project_root),
+            "ls-files",
+            "-z",
+            "--cached",
+            "--others",
+            "--exclude-standard",
+            "--",
+            "*.rs",
+            "*Cargo.toml",
+            "*/",
+        ],
+        capture_output=True,
+        check=False,
+    )
+    if result.returncode != 0:
+        return None
+    rust: set[Path] = set()
+    manifests: set[Path] = set()
+    opaque = _submodule_dirs(project_root, toplevel)
+    for raw in result.stdout.split(b"\0"):
+        rel = os.fsdecode(raw)
+        if not rel or _is_pruned(rel.rstrip("/")):
             continue
-        files.append(path)
-    return files
+        path = project_root / rel
+        if rel.endswith("/"):
+            opaque.append(path)
+            continue
+        # --cached still lists files deleted from the working tree.
+        if not os.path.lexists(path):
+            continue
+        if rel.endswith(".rs"):
+            rust.add(path)
+        elif path.name == "Cargo.toml":
+            manifests.add(path)
+    for directory in opaque:
+        if _is_pruned(directory.relative_to(project_root).as_posix()):
+            continue
+        nested = _walk_listing(directory)
+        rust.update(nested.rust_files)
+        manifests.update(nested.manifests)
+    return ProjectListing(rust_files=tuple(sorted(rust)), manifests=frozenset(manifests))
+
+
+def _walk_listing(project_root: Path) -> ProjectListing:
+    """Walk the tree, never descending into `target`, dot-dirs or symlinked dirs."""
+    rust: list[Path] = []
+    manifests: set[Path] = set()
+    pending = [project_root]
+    while pending:
+        directory = pending.pop()
+        try:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    name = entry.name
+                    if name.startswith("."):
+                        continue
+                    if name.endswith(".rs"):
+                        rust.append(directory / name)
+                    elif name == "Cargo.toml":
+                        manifests.add(directory / name)
+                    try:
+                        descend = entry.is_dir() and not entry.is_symlink()
+                    except OSError:
+                        descend = False
+                    if descend and name != "target":
+                        pending.append(directory / name)
+        except OSError:
+            continue
+    return ProjectListing(rust_files=tuple(sorted(rust)), manifests=frozenset(manifests))
+
+
+# Listings keyed by root: repeated calls within one helper run share a single
+# listing.
+_listings: dict[Path, ProjectListing] = {}
+
+
+def project_listing(project_root: Path) -> ProjectListing:
+    """`.rs` files and manifests under `project_root`, pruned before descending.
+
+    In a git checkout the listing comes from `git ls-files`, so gitignored
+    paths are never visited; elsewhere a pruned `os.scandir` walk is used.
+    """
+    listing = _listings.get(project_root)
+    if listing is None:
+        toplevel = git_toplevel(project_root)
+        listing = (_git_listing(project_root, toplevel) if toplevel is not None else None) or _walk_listing(
+            project_root
+        )
+        _listings[project_root] = listing
+    return listing
+
+
+def rust_files(project_root: Path) -> list[Path]:
+    return list(project_listing(project_root).rust_files)
 
 
 def path_is_exempt(rel: str, exempts: tuple[str, ...]) -> bool:
@@ -318,6 +603,15 @@ class EnumDef:
     variants: tuple[tuple[str, int], ...]  # (variant name, 1-based line)
 
 
+@dataclass(frozen=True)
+class ImplDef:
+    trait_name: str  # last segment of the trait path; "" for an inherent impl
+    trait_path: str  # as written, generics included, whitespace collapsed
+    self_type: str
+    generics: str  # the `<...>` after `impl`, "" when absent
+    line: int  # 1-based line of the `impl` keyword
+
+
 _VIS_RE = r"(?:pub(?:\([^)]*\))?\s+)?"
 _STRUCT_RE = re.compile(rf"^\s*{_VIS_RE}struct\s+([A-Za-z_]\w*)")
 _ENUM_RE = re.compile(rf"^\s*{_VIS_RE}enum\s+([A-Za-z_]\w*)")
@@ -339,26 +633,15 @@ def _find_body_open(lines: list[str], start_line: int, start_col: int) -> tuple[
     return None
 
 
-def _scan_block_fields(lines: list[str], open_line: int, open_col: int) -> list[FieldDef]:
-    fields: list[FieldDef] = []
-    depth = 0
-    for idx in range(open_line, len(lines)):
-        segment = lines[idx][open_col if idx == open_line else 0 :]
-        if depth == 1 and idx != open_line:
-            match = _FIELD_RE.match(lines[idx])
-            if match is not None:
-                fields.append(FieldDef(name=match.group(1), type_text=match.group(2).strip(), line=idx + 1))
-        for ch in segment:
-            if ch == "{":
-                depth += 1
-            elif ch == "}":
-                depth -= 1
-                if depth == 0:
-                    return fields
-    return fields
+def _direct_child_lines(masked: MaskedSource, open_line: int, open_col: int) -> list[int]:
+    """0-based lines that start directly inside the block opened at (open_line, open_col)."""
+    inner = masked.depth_at(open_line, open_col) + 1
+    depths = masked.line_depths
+    return [idx for idx in masked.block_lines(open_line, open_col) if depths[idx] == inner]
 
 
-def scan_structs(lines: list[str]) -> list[StructDef]:
+def scan_structs(masked: MaskedSource) -> list[StructDef]:
+    lines = masked.lines
     structs: list[StructDef] = []
     for idx, line in enumerate(lines):
         match = _STRUCT_RE.match(line)
@@ -367,13 +650,17 @@ def scan_structs(lines: list[str]) -> list[StructDef]:
         opened = _find_body_open(lines, idx, match.end())
         if opened is None:
             continue
-        open_line, open_col = opened
-        fields = _scan_block_fields(lines, open_line, open_col)
+        fields: list[FieldDef] = []
+        for field_idx in _direct_child_lines(masked, *opened):
+            field = _FIELD_RE.match(lines[field_idx])
+            if field is not None:
+                fields.append(FieldDef(name=field.group(1), type_text=field.group(2).strip(), line=field_idx + 1))
         structs.append(StructDef(name=match.group(1), line=idx + 1, fields=tuple(fields)))
     return structs
 
 
-def scan_enums(lines: list[str]) -> list[EnumDef]:
+def scan_enums(masked: MaskedSource) -> list[EnumDef]:
+    lines = masked.lines
     enums: list[EnumDef] = []
     for idx, line in enumerate(lines):
         match = _ENUM_RE.match(line)
@@ -382,32 +669,18 @@ def scan_enums(lines: list[str]) -> list[EnumDef]:
         opened = _find_body_open(lines, idx, match.end())
         if opened is None:
             continue
-        open_line, open_col = opened
         variants: list[tuple[str, int]] = []
-        depth = 0
-        for j in range(open_line, len(lines)):
-            segment = lines[j][open_col if j == open_line else 0 :]
-            if depth == 1 and j != open_line:
-                vmatch = _VARIANT_RE.match(lines[j])
-                if vmatch is not None:
-                    variants.append((vmatch.group(1), j + 1))
-            closed = False
-            for ch in segment:
-                if ch == "{":
-                    depth += 1
-                elif ch == "}":
-                    depth -= 1
-                    if depth == 0:
-                        closed = True
-                        break
-            if closed:
-                break
+        for variant_idx in _direct_child_lines(masked, *opened):
+            vmatch = _VARIANT_RE.match(lines[variant_idx])
+            if vmatch is not None:
+                variants.append((vmatch.group(1), variant_idx + 1))
         enums.append(EnumDef(name=match.group(1), line=idx + 1, variants=tuple(variants)))
     return enums
 
 
-def test_spans(lines: list[str]) -> list[tuple[int, int]]:
+def test_spans(masked: MaskedSource) -> list[tuple[int, int]]:
     """1-based inclusive line ranges of `#[cfg(test)]` items."""
+    lines = masked.lines
     spans: list[tuple[int, int]] = []
     for idx, line in enumerate(lines):
         if "#[cfg(test)]" not in line:
@@ -416,23 +689,108 @@ def test_spans(lines: list[str]) -> list[tuple[int, int]]:
         opened = _find_body_open(lines, idx, col)
         if opened is None:
             continue
-        open_line, open_col = opened
-        depth = 0
-        for j in range(open_line, len(lines)):
-            segment = lines[j][open_col if j == open_line else 0 :]
-            for ch in segment:
-                if ch == "{":
-                    depth += 1
-                elif ch == "}":
-                    depth -= 1
-                    if depth == 0:
-                        spans.append((idx + 1, j + 1))
-                        break
-            if depth == 0 and spans and spans[-1][0] == idx + 1:
-                break
+        close_line = masked.closing_line(*opened)
+        if close_line is not None:
+            spans.append((idx + 1, close_line + 1))
     return spans
 
 
+_IMPL_RE = re.compile(r"\bimpl\b")
+# Tokens that matter while reading an impl header; `->` is matched so the `>`
+# of a return arrow inside generics is not taken for a closing bracket.
+_IMPL_HEADER_TOKEN_RE = re.compile(r"->|[<>()\[\]{};]|\b(?:for|where)\b")
+_IMPL_PREFIX_WORDS = ("unsafe", "default")
+
+
+def _impl_at_item_position(text: str, start: int) -> bool:
+    """`impl` that starts an item, not `-> impl Trait` / `x: impl Trait`."""
+    j = start
+    while True:
+        while j > 0 and text[j - 1].isspace():
+            j -= 1
+        for word in _IMPL_PREFIX_WORDS:
+            head = j - len(word)
+            if head >= 0 and text.startswith(word, head) and not (head and text[head - 1] in _IDENT_CHARS):
+                j = head
+                break
+        else:
+            # `$(` opens a macro repetition, where impls are items too.
+            return j == 0 or text[j - 1] in "{};]" or text.endswith("$(", 0, j)
+
+
+def _impl_header(text: str, start: int) -> tuple[str, str, str] | None:
+    """(generics, trait path, self type) of the header after `impl` at `start`.
+
+    The trait path is "" for an inherent impl. None when the header is cut
+    off before its `{`, `;` or `where`.
+    """
+    pos = start + len("impl")
+    while pos < len(text) and text[pos].isspace():
+        pos += 1
+    generics_start = pos
+    depth = 0
+    trait_for: tuple[int, int] | None = None
+    for token in _IMPL_HEADER_TOKEN_RE.finditer(text, pos):
+        kind = token.group()
+        if kind == "->":
+            continue
+        if kind in "<([":
+            depth += 1
+        elif kind in ">)]":
+            depth -= 1
+            if depth < 0:
+                return None
+            if depth == 0 and pos == generics_start and text[generics_start] == "<" and kind == ">":
+                pos = token.end()
+        elif depth:
+            # `;` is fine inside brackets (`[T; N]`); a brace means the header
+            # never closed its brackets.
+            if kind in "{}":
+                return None
+        elif kind == "for":
+            # `for<'a>` is a higher-ranked bound, not the trait/type separator.
+            if trait_for is None and not text.startswith("<", token.end()):
+                trait_for = (token.start(), token.end())
+        else:
+            end = token.start()
+            break
+    else:
+        return None
+    generics = " ".join(text[generics_start:pos].split())
+    if trait_for is None:
+        return generics, "", " ".join(text[pos:end].split())
+    return generics, " ".join(text[pos : trait_for[0]].split()), " ".join(text[trait_for[1] : end].split())
+
+
+def _trait_name(trait_path: str) -> str:
+    path = re.split(r"[<(]", trait_path.lstrip("!?").strip(), maxsplit=1)[0]
+    return path.rsplit("::", 1)[-1].strip()
+
+
+def scan_impls(masked: MaskedSource) -> list[ImplDef]:
+    """Every `impl` item header in the masked source, trait and inherent."""
+    text = masked.text
+    impls: list[ImplDef] = []
+    for match in _IMPL_RE.finditer(text):
+        start = match.start()
+        if not _impl_at_item_position(text, start):
+            continue
+        header = _impl_header(text, start)
+        if header is None:
+            continue
+        generics, trait_path, self_type = header
+        impls.append(
+            ImplDef(
+                trait_name=_trait_name(trait_path),
+                trait_path=trait_path,
+                self_type=self_type,
+                generics=generics,
+                line=masked.line_index.line(start),
+            )
+        )
+    return impls
+
+
 def in_spans(line: int, spans: list[tuple[int, int]]) -> bool:
     return any(start <= line <= end for start, end in spans)
 
@@ -449,14 +807,288 @@ def snake_case(name: str) -> str:
     return "_".join(camel_words(name))
 
 
+def render_line(raw_lines: list[str], line: int) -> str:
+    """Candidate text for a 1-based line: the source line, stripped and capped."""
+    if 1 <= line <= len(raw_lines):
+        return raw_lines[line - 1].strip()[:200]
+    return ""
+
+
 def display_line(path: Path, line: int) -> str:
     try:
         lines = path.read_text().splitlines()
     except (OSError, UnicodeDecodeError):
         return ""
-    if 1 <= line <= len(lines):
-        return lines[line - 1].strip()[:200]
-    return ""
+    return render_line(lines, line)
+
+
+# ---------------------------------------------------------------------------
+# Source corpus — every .rs file read, masked and scanned at most once
+# ---------------------------------------------------------------------------
+
+
+@dataclass(frozen=True)
+class SourceFile:
+    raw_lines: list[str]  # unmasked, for rendering candidate text
+    masked: MaskedSource
+    structs: tuple[StructDef, ...]
+    enums: tuple[EnumDef, ...]
+    impls: tuple[ImplDef, ...]
+    test_spans: list[tuple[int, int]]
+
+    def display_line(self, line: int) -> str:
+        return render_line(self.raw_lines, line)
+
+
+def scan_source(text: str) -> SourceFile:
+    masked = mask_source(text)
+    return SourceFile(
+        raw_lines=text.splitlines(),
+        masked=masked,
+        structs=tuple(scan_structs(masked)),
+        enums=tuple(scan_enums(masked)),
+        impls=tuple(scan_impls(masked)),
+        test_spans=test_spans(masked),
+    )
+
+
+_EMPTY_SOURCE = SourceFile(raw_lines=[], masked=MaskedSource(lines=[], strings=[]), structs=(), enums=(), impls=(), test_spans=[])
+
+
+def _source_to_json(source: SourceFile) -> dict[str, object]:
+    return {
+        "raw_lines": source.raw_lines,
+        "lines": source.masked.lines,
+        "strings": [[lit.line, lit.col, lit.text, lit.kind] for lit in source.masked.strings],
+        "structs": [
+            [struct.name, struct.line, [[fld.name, fld.type_text, fld.line] for fld in struct.fields]]
+            for struct in source.structs
+        ],
+        "enums": [[enum.name, enum.line, [list(variant) for variant in enum.variants]] for enum in source.enums],
+        "impls": [[impl.trait_name, impl.trait_path, impl.self_type, impl.generics, impl.line] for impl in source.impls],
+        "test_spans": [list(span) for span in source.test_spans],
+    }
+
+
+def _source_from_json(entry: dict[str, object]) -> SourceFile:
+    """Rebuild a cached SourceFile. Malformed entries raise and are re-scanned."""
+    raw = cast(dict[str, list[list[object]]], cast(object, entry))
+    return SourceFile(
+        raw_lines=cast(list[str], entry["raw_lines"]),
+        masked=MaskedSource(
+            lines=cast(list[str], entry["lines"]),
+            strings=[
+                StringLiteral(line=int(str(line)), col=int(str(col)), text=str(text), kind=str(kind))
+                for line, col, text, kind in raw["strings"]
+            ],
+        ),
+        structs=tuple(
+            StructDef(
+                name=str(name),
+                line=int(str(line)),
+                fields=tuple(
+                    FieldDef(name=str(fname), type_text=str(ftype), line=int(str(fline)))
+                    for fname, ftype, fline in cast(list[list[object]], fields)
+                ),
+            )
+            for name, line, fields in raw["structs"]
+        ),
+        enums=tuple(
+            EnumDef(
+                name=str(name),
+                line=int(str(line)),
+                variants=tuple((str(vname), int(str(vline))) for vname, vline in cast(list[list[object]], variants)),
+            )
+            for name, line, variants in raw["enums"]
+        ),
+        impls=tuple(
+            ImplDef(
+                trait_name=str(trait_name),
+                trait_path=str(trait_path),
+                self_type=str(self_type),
+                generics=str(generics),
+                line=int(str(line)),
+            )
+            for trait_name, trait_path, self_type, generics, line in raw["impls"]
+        ),
+        test_spans=[(int(str(start)), int(str(end))) for start, end in raw["test_spans"]],
+    )
+
+
+def _corpus_cache_path(project_root: Path) -> Path:
+    digest = hashlib.sha256(str(project_root.resolve()).encode()).hexdigest()[:16]
+    return CORPUS_CACHE_DIR / f"{digest}.json"
+
+
+class SourceCorpus:
+    """Parsed `.rs` sources for one project root, shared by every generator.
+
+    `source(path)` returns the masked lines, string literals, struct/enum scans
+    and `#[cfg(test)]` spans for a file, computing them on first request. The
+    on-disk cache is consulted per file by (mtime_ns, size); `save` writes back
+    whatever was (re)scanned and drops files the listing no longer has.
+    """
+
+    def __init__(self, project_root: Path) -> None:
+        self.project_root: Path = project_root
+        self._cache_path: Path = _corpus_cache_path(project_root)
+        self._sources: dict[Path, SourceFile] = {}
+        self._listings: dict[Path, list[Path]] = {}
+        self._impl_index: dict[str, list[tuple[Path, ImplDef]]] | None = None
+        self._entries: dict[str, dict[str, object]] = self._load_entries()
+        self._dirty: bool = False
+
+    def _load_entries(self) -> dict[str, dict[str, object]]:
+        try:
+            raw: object = json.loads(self._cache_path.read_text())  # pyright: ignore[reportAny]
+        except (OSError, ValueError):
+            return {}
+        if not isinstance(raw, dict):
+            return {}
+        payload = cast(dict[str, object], raw)
+        files = payload.get("files")
+        if payload.get("version") != CORPUS_CACHE_VERSION or not isinstance(files, dict):
+            return {}
+        return cast(dict[str, dict[str, object]], files)
+
+    def rust_files(self, root: Path | None = None) -> list[Path]:
+        base = self.project_root if root is None else root
+        listing = self._listings.get(base)
+        if listing is None:
+            listing = rust_files(base)
+            self._listings[base] = listing
+        return listing
+
+    def source(self, path: Path) -> SourceFile:
+        cached = self._sources.get(path)
+        if cached is not None:
+            return cached
+        stat, source = self._load(path)
+        if source is None:
+            try:
+                source = scan_source(path.read_text())
+            except (OSError, UnicodeDecodeError):
+                source = _EMPTY_SOURCE
+            self._store(path, stat, _source_to_json(source))
+        self._sources[path] = source
+        return source
+
+    def _load(self, path: Path) -> tuple[os.stat_result | None, SourceFile | None]:
+        """The file's stat and its cached scan, if the cache entry is current."""
+        try:
+            stat = path.stat()
+        except OSError:
+            return None, None
+        entry = self._entries.get(str(path))
+        if not isinstance(entry, dict):
+            return stat, None
+        if entry.get("mtime_ns") != stat.st_mtime_ns or entry.get("size") != stat.st_size:
+            return stat, None
+        try:
+            return stat, _source_from_json(entry)
+        except (KeyError, TypeError, ValueError):
+            return stat, None
+
+    def _store(self, path: Path, stat: os.stat_result | None, scanned: dict[str, object]) -> None:
+        if stat is None:
+            return
+        self._entries[str(path)] = {"mtime_ns": stat.st_mtime_ns, "size": stat.st_size, **scanned}
+        self._dirty = True
+
+    def prefetch(self, paths: list[Path]) -> None:
+        """Scan the files among `paths` that neither memory nor disk has yet.
+
+        With enough of them (PARALLEL_SCAN_MIN_FILES) and more than one worker,
+        the scans run in a process pool; otherwise they are left to `source`,
+        which scans lazily in this process. Each file's scan depends only on its
+        text and results are stored by path, so the corpus — and every
+        generator's candidate list — is the same either way. A pool that cannot
+        start also leaves the files to the serial path.
+        """
+        pending: list[tuple[Path, os.stat_result | None]] = []
+        for path in paths:
+            if path in self._sources:
+                continue
+            stat, source = self._load(path)
+            if source is None:
+                pending.append((path, stat))
+            else:
+                self._sources[path] = source
+        workers = min(SCAN_WORKERS, len(pending) // PARALLEL_SCAN_CHUNK)
+        if len(pending) < PARALLEL_SCAN_MIN_FILES or workers < 2:
+            return
+        try:
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                entries = list(pool.map(_scan_path, [path for path, _ in pending], chunksize=PARALLEL_SCAN_CHUNK))
+        except (OSError, BrokenProcessPool):
+            return
+        for (path, stat), entry in zip(pending, entries):
+            scanned = _source_to_json(_EMPTY_SOURCE) if entry is None else entry
+            self._sources[path] = _source_from_json(scanned)
+            self._store(path, stat, scanned)
+
+    def impl_index(self) -> dict[str, list[tuple[Path, ImplDef]]]:
+        """Trait name -> every impl of it in the project; inherent impls under "".
+
+        Built from the per-file `scan_impls` results in one pass over the
+        corpus, so each query is a dict lookup however many traits there are.
+        """
+        if self._impl_index is None:
+            index: dict[str, list[tuple[Path, ImplDef]]] = {}
+            for path in self.rust_files():
+                for impl in self.source(path).impls:
+                    index.setdefault(impl.trait_name, []).append((path, impl))
+            self._impl_index = index
+        return self._impl_index
+
+    def save(self) -> None:
+        """Write the cache back if anything was (re)scanned or pruned.
+
+        Once the project's full listing has been taken, entries for files it
+        did not list (deleted or renamed since, or now ignored) are dropped,
+        so the cache tracks the tree instead of growing with its history.
+        """
+        if self.project_root in self._listings:
+            live = {str(path) for listing in self._listings.values() for path in listing}
+            live.update(str(path) for path in self._sources)
+            stale = [key for key in self._entries if key not in live]
+            for key in stale:
+                del self._entries[key]
+            self._dirty = self._dirty or bool(stale)
+        if not self._dirty:
+            return
+        tmp = self._cache_path.with_name(f"{self._cache_path.name}.{os.getpid()}.tmp")
+        try:
+            self._cache_path.parent.mkdir(parents=True, exist_ok=True)
+            _ = tmp.write_text(json.dumps({"version": CORPUS_CACHE_VERSION, "files": self._entries}))
+            _ = tmp.replace(self._cache_path)
+        except OSError:
+            tmp.unlink(missing_ok=True)
+            return
+        self._dirty = False
+
+
+def _scan_path(path: Path) -> dict[str, object] | None:
+    """Read and scan one file into its cache-entry form; None when unreadable.
+
+    Module-level so process-pool workers can run it; the entry form is plain
+    lists and strings, which pickle cheaply back to the parent.
+    """
+    try:
+        return _source_to_json(scan_source(path.read_text()))
+    except (OSError, UnicodeDecodeError):
+        return None
+
+
+_corpora: dict[Path, SourceCorpus] = {}
+
+
+def source_corpus(project_root: Path) -> SourceCorpus:
+    corpus = _corpora.get(project_root)
+    if corpus is None:
+        corpus = SourceCorpus(project_root)
+        _corpora[project_root] = corpus
+    return corpus
 
 
 # ---------------------------------------------------------------------------
@@ -553,6 +1185,7 @@ def _member_manifests(project_root: Path) -> list[Path]:
     workspace = _toml_table(data, "workspace")
     if not workspace:
         return []
+    listing = project_listing(project_root)
     manifests: list[Path] = []
     if "package" in data:
         manifests.append(root_manifest)
@@ -563,13 +1196,20 @@ def _member_manifests(project_root: Path) -> list[Path]:
                 continue
             if "*" in member:
                 for path in sorted(project_root.glob(member)):
-                    if (path / "Cargo.toml").exists():
+                    if _is_listed_manifest(listing, project_root, path / "Cargo.toml"):
                         manifests.append(path / "Cargo.toml")
-            elif (project_root / member / "Cargo.toml").exists():
+            elif _is_listed_manifest(listing, project_root, project_root / member / "Cargo.toml"):
                 manifests.append(project_root / member / "Cargo.toml")
     return manifests
 
 
+def _is_listed_manifest(listing: ProjectListing, project_root: Path, manifest: Path) -> bool:
+    # Members outside the root (`../shared`) are not in the listing; stat those.
+    if manifest.is_relative_to(project_root) and ".." not in manifest.parts:
+        return manifest in listing.manifests
+    return manifest.exists()
+
+
 _DEP_SECTIONS = ("dependencies", "dev-dependencies", "build-dependencies")
 
 
@@ -621,16 +1261,17 @@ def gen_bevy_kana_usage(spec: CandidatesSpec, project_root: Path) -> Enumeration
     leak_re = re.compile(
         r"^\s*pub\s.*\b(Position|Displacement|Velocity|ToF32|ToI32|ToU32|ToUsize)\b"
     )
+    corpus = source_corpus(project_root)
     for crate_dir in kana_crates:
         if not (crate_dir / "src" / "lib.rs").exists():
             continue
-        for path in rust_files(crate_dir / "src"):
+        for path in corpus.rust_files(crate_dir / "src"):
             rel = path.relative_to(project_root).as_posix()
-            masked = read_masked(path)
-            for idx, line in enumerate(masked.lines):
+            source = corpus.source(path)
+            for idx, line in enumerate(source.masked.lines):
                 if leak_re.match(line) or re.match(r"^\s*pub\s+use\s+.*bevy_kana", line):
                     candidates.append(
-                        Candidate(file=rel, line=idx + 1, text=display_line(path, idx + 1))
+                        Candidate(file=rel, line=idx + 1, text=source.display_line(idx + 1))
                     )
     candidates.sort(key=lambda c: (c.file, c.line))
     return Enumeration(
@@ -670,16 +1311,16 @@ def gen_allows_without_reason(spec: CandidatesSpec, project_root: Path) -> Enume
     """`#[allow(...)]` attributes (single- or multi-line) with no `reason` field."""
     _ = spec
     candidates: list[Candidate] = []
-    for path in rust_files(project_root):
+    corpus = source_corpus(project_root)
+    for path in corpus.rust_files():
         rel = path.relative_to(project_root).as_posix()
-        masked = read_masked(path)
-        masked_text = "\n".join(masked.lines)
-        for match in _ALLOW_RE.finditer(masked_text):
+        source = corpus.source(path)
+        for match in _ALLOW_RE.finditer(source.masked.text):
             if re.search(r"\breason\s*=", match.group(1)):
                 continue
-            attr_line = masked_text.count("\n", 0, match.start()) + 1
+            attr_line = source.masked.line_index.line(match.start())
             candidates.append(
-                Candidate(file=rel, line=attr_line, text=display_line(path, attr_line))
+                Candidate(file=rel, line=attr_line, text=source.display_line(attr_line))
             )
     candidates.sort(key=lambda c: (c.file, c.line))
     return Enumeration(candidates=tuple(candidates), source="parse:allow-attrs-without-reason")
@@ -688,41 +1329,27 @@ def gen_allows_without_reason(spec: CandidatesSpec, project_root: Path) -> Enume
 def gen_test_allow_boilerplate(spec: CandidatesSpec, project_root: Path) -> Enumeration:
     _ = spec
     candidates: list[Candidate] = []
-    for path in rust_files(project_root):
+    corpus = source_corpus(project_root)
+    for path in corpus.rust_files():
         rel = path.relative_to(project_root).as_posix()
-        masked = read_masked(path)
-        masked_text = "\n".join(masked.lines)
+        masked = corpus.source(path).masked
+        masked_text = masked.text
+        line_index = masked.line_index
         for match in _ALLOW_RE.finditer(masked_text):
             lints = [part.strip() for part in match.group(1).replace("\n", " ").split(",")]
             tracked = [lint for lint in lints if lint in _BOILERPLATE_LINTS]
             if not tracked:
                 continue
-            attr_line = masked_text.count("\n", 0, match.start()) + 1
-            attr_end_line = masked_text.count("\n", 0, match.end()) + 1
-            attr_end_col = match.end() - (masked_text.rfind("\n", 0, match.end()) + 1)
+            attr_line = line_index.line(match.start())
+            attr_end_line = line_index.line(match.end())
+            attr_end_col = line_index.col(match.end())
             opened = _find_brace_after(masked.lines, attr_end_line - 1, attr_end_col)
             if opened is None:
                 scope_text = masked_text[match.end() :]
             else:
                 open_line, open_col = opened
-                end_line = open_line
-                depth = 0
-                for j in range(open_line, len(masked.lines)):
-                    segment = masked.lines[j][open_col if j == open_line else 0 :]
-                    done = False
-                    for ch in segment:
-                        if ch == "{":
-                            depth += 1
-                        elif ch == "}":
-                            depth -= 1
-                            if depth == 0:
-                                end_line = j
-                                done = True
-                                break
-                    if done:
-                        break
-                else:
-                    end_line = len(masked.lines) - 1
+                close_line = masked.closing_line(open_line, open_col)
+                end_line = len(masked.lines) - 1 if close_line is None else close_line
                 scope_text = "\n".join(masked.lines[open_line : end_line + 1])
             for lint in tracked:
                 if _BOILERPLATE_LINTS[lint] not in scope_text:
@@ -757,10 +1384,10 @@ def _type_idents(type_text: str) -> list[str]:
 
 def _each_struct(project_root: Path) -> list[tuple[str, Path, StructDef]]:
     found: list[tuple[str, Path, StructDef]] = []
-    for path in rust_files(project_root):
+    corpus = source_corpus(project_root)
+    for path in corpus.rust_files():
         rel = path.relative_to(project_root).as_posix()
-        masked = read_masked(path)
-        for struct in scan_structs(masked.lines):
+        for struct in corpus.source(path).structs:
             found.append((rel, path, struct))
     return found
 
@@ -799,10 +1426,10 @@ def gen_field_affixes(spec: CandidatesSpec, project_root: Path) -> Enumeration:
 def gen_enum_variant_stutter(spec: CandidatesSpec, project_root: Path) -> Enumeration:
     _ = spec
     candidates: list[Candidate] = []
-    for path in rust_files(project_root):
+    corpus = source_corpus(project_root)
+    for path in corpus.rust_files():
         rel = path.relative_to(project_root).as_posix()
-        masked = read_masked(path)
-        for enum in scan_enums(masked.lines):
+        for enum in corpus.source(path).enums:
             enum_words = set(camel_words(enum.name))
             for variant_name, variant_line in enum.variants:
                 shared = enum_words & set(camel_words(variant_name))
@@ -854,19 +1481,17 @@ _TRAIT_RE = re.compile(rf"^\s*{_VIS_RE}(?:unsafe\s+)?trait\s+([A-Z]\w*)")
 def gen_single_impl_traits(spec: CandidatesSpec, project_root: Path) -> Enumeration:
     _ = spec
     decls: list[tuple[str, str, int]] = []  # (trait name, rel file, line)
-    masked_texts: list[str] = []
-    for path in rust_files(project_root):
+    corpus = source_corpus(project_root)
+    for path in corpus.rust_files():
         rel = path.relative_to(project_root).as_posix()
-        masked = read_masked(path)
-        masked_texts.append("\n".join(masked.lines))
-        for idx, line in enumerate(masked.lines):
+        for idx, line in enumerate(corpus.source(path).masked.lines):
             match = _TRAIT_RE.match(line)
             if match is not None:
                 decls.append((match.group(1), rel, idx + 1))
+    impls = corpus.impl_index()
     candidates: list[Candidate] = []
     for trait_name, rel, line in decls:
-        impl_re = re.compile(rf"\bimpl\b[^{{;]*?\b{trait_name}\b[^{{;]*?\bfor\b", re.S)
-        impl_count = sum(len(impl_re.findall(text)) for text in masked_texts)
+        impl_count = len(impls.get(trait_name, ()))
         if impl_count <= 1:
             candidates.append(
                 Candidate(
@@ -885,10 +1510,11 @@ _FN_RE = re.compile(r"\bfn\s+(\w+)\s*(?:<[^>]*>)?\s*\(", re.S)
 def gen_observer_guards(spec: CandidatesSpec, project_root: Path) -> Enumeration:
     _ = spec
     candidates: list[Candidate] = []
-    for path in rust_files(project_root):
+    corpus = source_corpus(project_root)
+    for path in corpus.rust_files():
         rel = path.relative_to(project_root).as_posix()
-        masked = read_masked(path)
-        masked_text = "\n".join(masked.lines)
+        masked = corpus.source(path).masked
+        masked_text = masked.text
         for match in _FN_RE.finditer(masked_text):
             params_end = masked_text.find(")", match.end())
             if params_end == -1:
@@ -896,11 +1522,11 @@ def gen_observer_guards(spec: CandidatesSpec, project_root: Path) -> Enumeration
             params = masked_text[match.end() : params_end + 1]
             if "On<" not in params and "Trigger<" not in params:
                 continue
-            fn_line = masked_text.count("\n", 0, match.start()) + 1
+            fn_line = masked.line_index.line(match.start())
             body_open = masked_text.find("{", params_end)
             if body_open == -1:
                 continue
-            body_start_line = masked_text.count("\n", 0, body_open) + 1
+            body_start_line = masked.line_index.line(body_open)
             window = masked.lines[body_start_line - 1 : body_start_line + 5]
             if any("return" in line for line in window):
                 candidates.append(
@@ -922,14 +1548,14 @@ _ITEM_RE = re.compile(
 def gen_module_root_items(spec: CandidatesSpec, project_root: Path) -> Enumeration:
     _ = spec
     candidates: list[Candidate] = []
-    for path in rust_files(project_root):
+    corpus = source_corpus(project_root)
+    for path in corpus.rust_files():
         if path.name not in ("mod.rs", "lib.rs", "main.rs"):
             continue
         rel = path.relative_to(project_root).as_posix()
-        masked = read_masked(path)
-        depth = 0
+        masked = corpus.source(path).masked
         items: list[tuple[int, str]] = []
-        for idx, line in enumerate(masked.lines):
+        for idx, (line, depth) in enumerate(zip(masked.lines, masked.line_depths)):
             if depth == 0:
                 match = _ITEM_RE.match(line)
                 if match is not None:
@@ -937,11 +1563,6 @@ def gen_module_root_items(spec: CandidatesSpec, project_root: Path) -> Enumerati
                     # fn main in main.rs is structurally required, not a violation.
                     if not (path.name == "main.rs" and kind == "fn" and name == "main"):
                         items.append((idx + 1, f"{kind} {name}".strip()))
-            for ch in line:
-                if ch == "{":
-                    depth += 1
-                elif ch == "}":
-                    depth -= 1
         if items:
             preview = ", ".join(label for _line, label in items[:6])
             if len(items) > 6:
@@ -963,7 +1584,7 @@ _ANTI_PATTERN_STEMS = {"helpers", "utils", "util", "common", "misc", "types", "m
 def gen_submodule_names(spec: CandidatesSpec, project_root: Path) -> Enumeration:
     _ = spec
     candidates: list[Candidate] = []
-    for path in rust_files(project_root):
+    for path in source_corpus(project_root).rust_files():
         rel = path.relative_to(project_root).as_posix()
         stem = path.stem
         parent = path.parent.name
@@ -1021,16 +1642,15 @@ def _array_dim_position(line: str, start: int) -> bool:
 
 
 def _numeric_candidates_for_file(
-    path: Path,
+    source: SourceFile,
     rel: str,
-    masked: MaskedSource,
     spans: list[tuple[int, int]],
     inside_spans: bool,
     line_filter: Callable[[str], bool] | None = None,
 ) -> list[Candidate]:
     candidates: list[Candidate] = []
     seen_lines: set[int] = set()
-    for idx, line in enumerate(masked.lines):
+    for idx, line in enumerate(source.masked.lines):
         line_no = idx + 1
         if in_spans(line_no, spans) != inside_spans:
             continue
@@ -1045,7 +1665,7 @@ def _numeric_candidates_for_file(
                 continue
             if line_no not in seen_lines:
                 seen_lines.add(line_no)
-                candidates.append(Candidate(file=rel, line=line_no, text=display_line(path, line_no)))
+                candidates.append(Candidate(file=rel, line=line_no, text=source.display_line(line_no)))
             break
     return candidates
 
@@ -1053,20 +1673,21 @@ def _numeric_candidates_for_file(
 def gen_literals(spec: CandidatesSpec, project_root: Path) -> Enumeration:
     exempts = tuple(spec.paths_exempt) + ("examples", "benches", "build.rs")
     candidates: list[Candidate] = []
-    for path in rust_files(project_root):
+    corpus = source_corpus(project_root)
+    for path in corpus.rust_files():
         rel = path.relative_to(project_root).as_posix()
         if path_is_exempt(rel, exempts) or is_test_file(rel):
             continue
-        masked = read_masked(path)
-        spans = test_spans(masked.lines)
-        candidates += _numeric_candidates_for_file(path, rel, masked, spans, inside_spans=False)
+        source = corpus.source(path)
+        masked = source.masked
+        spans = source.test_spans
+        candidates += _numeric_candidates_for_file(source, rel, spans, inside_spans=False)
         for literal in masked.strings:
             if literal.kind != "string" or len(literal.text) < 2:
                 continue
             if in_spans(literal.line, spans):
                 continue
             line = masked.lines[literal.line - 1] if literal.line - 1 < len(masked.lines) else ""
-            raw_line = display_line(path, literal.line)
             if _CONST_LINE_RE.match(line) or line.lstrip().startswith("#"):
                 continue
             prefix = line[: literal.col]
@@ -1074,7 +1695,7 @@ def gen_literals(spec: CandidatesSpec, project_root: Path) -> Enumeration:
                 continue
             if literal.text in _FIXED_SPELLINGS:
                 continue
-            candidates.append(Candidate(file=rel, line=literal.line, text=raw_line))
+            candidates.append(Candidate(file=rel, line=literal.line, text=source.display_line(literal.line)))
     deduped = sorted(set(candidates), key=lambda c: (c.file, c.line))
     return Enumeration(
         candidates=tuple(deduped),
@@ -1090,19 +1711,20 @@ def gen_test_literals(spec: CandidatesSpec, project_root: Path) -> Enumeration:
     value derived from a production constant breaks silently when it drifts."""
     _ = spec
     candidates: list[Candidate] = []
-    for path in rust_files(project_root):
+    corpus = source_corpus(project_root)
+    for path in corpus.rust_files():
         rel = path.relative_to(project_root).as_posix()
-        masked = read_masked(path)
+        source = corpus.source(path)
+        masked = source.masked
         if is_test_file(rel):
             spans = [(1, len(masked.lines))]
         else:
-            spans = test_spans(masked.lines)
+            spans = source.test_spans
         if not spans:
             continue
         candidates += _numeric_candidates_for_file(
-            path,
+            source,
             rel,
-            masked,
             spans,
             inside_spans=True,
             line_filter=lambda line: _COMPARISON_LINE_RE.search(line) is not None,
@@ -1168,8 +1790,41 @@ GENERATORS: dict[str, Callable[[CandidatesSpec, Path], Enumeration]] = {
 }
 
 
-def enumerate_candidates(spec: CandidatesSpec, project_root: Path) -> Enumeration:
-    """Run the generator named by the spec. Unknown kinds are loud config errors."""
+# Generators that never read file contents through the corpus.
+_UNPARSED_KINDS = frozenset({"regex", "workspace_deps", "submodule_names"})
+
+
+def inputs_fingerprint(project_root: Path) -> str:
+    """Digest of every file a non-regex generator can read, by path, mtime_ns and size.
+
+    That is the listing's `.rs` files and manifests plus workspace members
+    outside the root; editing, adding or removing any of them changes it.
+    """
+    listing = project_listing(project_root)
+    paths = {*listing.rust_files, *listing.manifests, project_root / "Cargo.toml", *_member_manifests(project_root)}
+    digest = hashlib.sha256()
+    for path in sorted(paths):
+        try:
+            stat = path.stat()
+            digest.update(f"{path}\0{stat.st_mtime_ns}\0{stat.st_size}\n".encode())
+        except OSError:
+            digest.update(f"{path}\0-\n".encode())
+    return digest.hexdigest()
+
+
+def enumeration_key(spec: CandidatesSpec, inputs: str) -> str | None:
+    """Memo key for the spec's enumeration over files with fingerprint `inputs`.
+
+    None for regex kinds: rg chooses its own files (globs can reach past `.rs`
+    files and manifests), so the fingerprint cannot vouch for its result.
+    """
+    if spec.kind == "regex":
+        return None
+    payload = json.dumps([ENUMERATION_KEY_VERSION, asdict(spec), inputs], sort_keys=True)
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+def _run_generator(spec: CandidatesSpec, project_root: Path) -> Enumeration:
     generator = GENERATORS.get(spec.kind)
     if generator is None:
         raise SystemExit(
@@ -1183,3 +1838,49 @@ def enumerate_candidates(spec: CandidatesSpec, project_root: Path) -> Enumeratio
             + " tune the spec's excludes before this unit can be evaluated"
         )
     return enumeration
+
+
+def enumerate_candidates(spec: CandidatesSpec, project_root: Path) -> Enumeration:
+    """Run the generator named by the spec. Unknown kinds are loud config errors."""
+    corpus = source_corpus(project_root)
+    if spec.kind in GENERATORS and spec.kind not in _UNPARSED_KINDS:
+        corpus.prefetch(corpus.rust_files())
+    try:
+        return _run_generator(spec, project_root)
+    finally:
+        corpus.save()
+
+
+def enumerate_many(
+    specs: list[CandidatesSpec], project_root: Path
+) -> dict[CandidatesSpec, Enumeration | SystemExit]:
+    """Enumerate the parse-based specs among `specs` in one pass over the sources.
+
+    Every `.rs` file is read, masked and scanned once, up front, and each
+    generator then runs over the shared corpus; the cache is written once at
+    the end. Results are keyed by spec (duplicates run once) and equal what
+    `enumerate_candidates` returns for the same spec. Specs of unparsed kinds
+    (`regex` forks rg per spec) and unknown kinds are left out, for the caller
+    to enumerate lazily only if it reaches their unit. A spec whose generator
+    fails maps to a SystemExit carrying the error, which the caller raises if
+    that unit is the one it picks.
+    """
+    wanted = [spec for spec in dict.fromkeys(specs) if spec.kind in GENERATORS and spec.kind not in _UNPARSED_KINDS]
+    enumerations: dict[CandidatesSpec, Enumeration | SystemExit] = {}
+    if not wanted:
+        return enumerations
+    corpus = source_corpus(project_root)
+    corpus.prefetch(corpus.rust_files())
+    try:
+        for spec in wanted:
+            try:
+                enumerations[spec] = _run_generator(spec, project_root)
+            except SystemExit as error:
+                enumerations[spec] = error
+            except Exception as error:
+                enumerations[spec] = SystemExit(
+                    f"candidates generator '{spec.kind}' for {spec.origin} failed: {error}"
+                )
+    finally:
+        corpus.save()
+    return enumerations
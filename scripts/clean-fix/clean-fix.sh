@@ -54,6 +54,9 @@ SCRIPT_DIR="$(cd "$(dirname "$0")" && pwd)"
 RUST_DIR="$HOME/rust"
 LOG_DIR="$HOME/.local/logs/clean-fix"
 LOG_FILE="$LOG_DIR/clean-fix-$(date '+%Y%m%d-%H%M%S').log"
+# Structured twin of LOG_FILE (see clean_fix_events.sh); exported so the stage
+# scripts append to it too.
+export CLEAN_FIX_EVENTS_FILE="${LOG_FILE%.log}.events.jsonl"
 LEGACY_LOG="$HOME/.local/logs/clean-fix.log"
 TIMESTAMP_DIR="$HOME/.local/state/clean-fix"
 CONF_FILE="$SCRIPT_DIR/clean-fix.conf"
@@ -62,6 +65,7 @@ MANUAL_LOG_RETENTION_DAYS=7
 
 source "$HOME/.cargo/env"
 source "$SCRIPT_DIR/agent_assignments.sh"
+source "$SCRIPT_DIR/clean_fix_events.sh"
 export PATH="/opt/homebrew/bin:$HOME/.local/bin:$PATH"
 
 mkdir -p "$LOG_DIR"
@@ -70,8 +74,11 @@ mkdir -p "$TIMESTAMP_DIR"
 # day of scheduled logs plus a short manual-log window so report lists stay
 # focused on runs that are still useful to inspect.
 find "$LOG_DIR" -name 'clean-fix-*.log' -mmin +"$RUN_LOG_RETENTION_MINUTES" -delete 2>/dev/null || true
+find "$LOG_DIR" -name 'clean-fix-*.events.jsonl' -mmin +"$RUN_LOG_RETENTION_MINUTES" -delete 2>/dev/null || true
 find "$LOG_DIR" -name 'style-fix-manual-*.log' -mtime +"$MANUAL_LOG_RETENTION_DAYS" -delete 2>/dev/null || true
+find "$LOG_DIR" -name 'style-fix-manual-*.events.jsonl' -mtime +"$MANUAL_LOG_RETENTION_DAYS" -delete 2>/dev/null || true
 > "$LOG_FILE"
+> "$CLEAN_FIX_EVENTS_FILE"
 # Maintain legacy single-file path as a symlink to the latest run so existing
 # tooling and the launchd plist stdout sink keep working.
 ln -sfn "$LOG_FILE" "$LEGACY_LOG"
@@ -261,6 +268,7 @@ cf_load_stage_assignment style_fix \
 cf_load_stage_enabled clean CLEAN_ENABLED || exit 1
 
 START_TIME=$SECONDS
+clean_fix_event run-start scope="$SCOPE" project="$PROJECT_FILTER"
 if [[ -n "$PROJECT_FILTER" ]]; then
     log "=== Starting clean-fix (scope: $SCOPE, project: $PROJECT_FILTER) ==="
 else
@@ -281,6 +289,7 @@ if [[ "$SCOPE" != "style" && "$SCOPE" != "run_once" && "$CLEAN_ENABLED" != "true
     log "SKIP: clean/build disabled in $CLEAN_FIX_AGENT_ASSIGNMENTS_FILE"
 fi
 if [[ "$SCOPE" != "style" && "$SCOPE" != "run_once" && "$CLEAN_ENABLED" == "true" ]]; then
+clean_fix_event phase-start phase=clean+rebuild
 # Guard so set -u doesn't trip on an empty allowlist expansion.
 if [[ ${#BUILD_TARGETS[@]} -eq 0 ]]; then
     log "No [build] targets configured — skipping clean/build pass."
@@ -300,6 +309,7 @@ for project_name in ${BUILD_TARGETS[@]+"${BUILD_TARGETS[@]}"}; do
     # checkouts (.git is a file) are valid build targets — each has its own target/.
     if [[ ! -f "$project_dir/Cargo.toml" ]]; then
         log "SKIP: $project_display (no Cargo.toml at $project_dir)"
+        clean_fix_event cell phase=clean project="$project_display" state=SKIP reason="no Cargo.toml at $project_dir"
         continue
     fi
 
@@ -309,6 +319,7 @@ for project_name in ${BUILD_TARGETS[@]+"${BUILD_TARGETS[@]}"}; do
         changed=$(find "$project_dir" \( -path "$project_dir/target" -o -path "$project_dir/.claude" \) -prune -o -newer "$timestamp_file" -type f -print -quit)
         if [[ -z "$changed" ]]; then
             log "SKIP: $project_display (not modified since last run)"
+            clean_fix_event cell phase=clean project="$project_display" state=SKIP reason="not modified since last run"
             continue
         fi
     fi
@@ -324,23 +335,28 @@ for project_name in ${BUILD_TARGETS[@]+"${BUILD_TARGETS[@]}"}; do
     [[ -n "$proj_env" ]] && log "ENV: $project_display ($proj_env)"
 
     log "CLEAN: $project_display"
+    clean_fix_event cell phase=clean project="$project_display" state=RUNNING
     env $proj_env cargo clean --manifest-path "$project_dir/Cargo.toml" 2>> "$LOG_FILE" || {
         log "ERROR: cargo clean failed for $project_display"
+        clean_fix_event cell phase=clean project="$project_display" state=FAIL reason="cargo clean failed"
         continue
     }
 
     log "BUILD: $project_display"
     env $proj_env cargo build --workspace --examples --manifest-path "$project_dir/Cargo.toml" 2>> "$LOG_FILE" || {
         log "ERROR: cargo build failed for $project_display"
+        clean_fix_event cell phase=clean project="$project_display" state=FAIL reason="cargo build failed"
         continue
     }
 
     # One switch, every consumer: turning mend off with /lint_config also stops
     # it running unattended here.
+    clean_reason=""
     if bash "$HOME/.claude/scripts/lint/lint_config.sh" enabled mend; then
         log "MEND: $project_display"
         env $proj_env "$HOME/.claude/scripts/lint/lint" mend --manifest-path "$project_dir/Cargo.toml" 2>> "$LOG_FILE" || {
             log "WARNING: cargo mend failed for $project_display"
+            clean_reason="warning"
         }
     else
         log "SKIP: mend for $project_display — mend=off in config/lint.conf"
@@ -348,16 +364,20 @@ for project_name in ${BUILD_TARGETS[@]+"${BUILD_TARGETS[@]}"}; do
 
     touch "$timestamp_file"
     log "DONE: $project_display"
+    clean_fix_event cell phase=clean project="$project_display" state=OK reason="$clean_reason"
 done
+clean_fix_event phase-end phase=clean+rebuild
 
 if [[ -n "$PROJECT_FILTER" && "$matched_clean_target" == "false" && "$SCOPE" == "clean" ]]; then
     log "SKIP: $PROJECT_FILTER (not listed in [build])"
 fi
 
 # Warm up specific projects by launching briefly then killing
+clean_fix_event phase-start phase=warmup
 "$SCRIPT_DIR/clean-fix-warmup.sh" ${PROJECT_FILTER:+"$PROJECT_FILTER"} 2>&1 | tee -a "$LOG_FILE" || {
     log "WARNING: warmup script failed"
 }
+clean_fix_event phase-end phase=warmup
 fi  # SCOPE != style
 
 # Run style evaluations and fixes when their stage assignments are enabled.
@@ -368,9 +388,11 @@ if [[ "$SCOPE" != "clean" ]]; then
     fi
     if [[ "$STYLE_EVAL_ENABLED" == "true" || "$SCOPE" == "run_once" ]]; then
         log "Starting style evaluations with family=$STYLE_EVAL_AGENT agent=${STYLE_EVAL_MODEL:-<default>} effort=${STYLE_EVAL_EFFORT:-<default>}..."
+        clean_fix_event phase-start phase=style-eval
         "$SCRIPT_DIR/style-eval-all.sh" ${style_args[@]+"${style_args[@]}"} 2>&1 | tee -a "$LOG_FILE" || {
             log "WARNING: style evaluation script failed"
         }
+        clean_fix_event phase-end phase=style-eval
     else
         log "SKIP: style eval disabled in agent-assignments.conf"
     fi
@@ -379,18 +401,22 @@ if [[ "$SCOPE" != "clean" ]]; then
     # fix stage spawns.
     if [[ "$STYLE_REVIEW_ENABLED" == "true" || "$SCOPE" == "run_once" ]]; then
         log "Reviewing pending evaluation markdown with family=$STYLE_REVIEW_AGENT agent=${STYLE_REVIEW_MODEL:-<default>} effort=${STYLE_REVIEW_EFFORT:-<default>}..."
+        clean_fix_event phase-start phase=style-eval-review
         "$SCRIPT_DIR/style-eval-review-all.sh" ${style_args[@]+"${style_args[@]}"} 2>&1 | tee -a "$LOG_FILE" || {
             log "WARNING: style eval review script failed"
         }
+        clean_fix_event phase-end phase=style-eval-review
     else
         log "SKIP: style eval review disabled in agent-assignments.conf"
     fi
 
     if [[ "$STYLE_FIX_ENABLED" == "true" || "$SCOPE" == "run_once" ]]; then
         log "Creating style-fix worktrees with family=$STYLE_FIX_AGENT agent=${STYLE_FIX_MODEL:-<default>} effort=${STYLE_FIX_EFFORT:-<default>}..."
+        clean_fix_event phase-start phase=style-fix
         "$SCRIPT_DIR/style-fix-worktrees.sh" ${style_args[@]+"${style_args[@]}"} 2>&1 | tee -a "$LOG_FILE" || {
             log "WARNING: style-fix worktree script failed"
         }
+        clean_fix_event phase-end phase=style-fix
     else
         log "SKIP: style fix disabled in agent-assignments.conf"
     fi
@@ -402,6 +428,7 @@ ELAPSED=$(( SECONDS - START_TIME ))
 MINUTES=$(( ELAPSED / 60 ))
 SECS=$(( ELAPSED % 60 ))
 log "=== Clean-fix Rust clean + rebuild complete (${MINUTES}m ${SECS}s) ==="
+clean_fix_event run-end elapsed="${MINUTES}m ${SECS}s"
 
 # Generate the clean-fix report via the assigned agent — but only when the run did
 # something. The style scope fires every 10 minutes; an all-SKIP cycle has no
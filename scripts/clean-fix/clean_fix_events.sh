@@ -0,0 +1,43 @@
+#!/usr/bin/env bash
+# Clean-fix structured event stream.
+#
+# Alongside its text log, a clean-fix run writes one JSON object per line to
+# $CLEAN_FIX_EVENTS_FILE (`<log>.events.jsonl`): run start/end, phase
+# start/end, per-project cell results, `[progress]` markers, and agent limits.
+# clean_fix_report_parse.py reads it for exact run/phase state and falls back
+# to scraping the text log when a run has no stream. With the variable unset
+# (standalone stage runs) every call is a no-op.
+
+# cf_json_string <value>
+# Echo <value> as a JSON string literal. Every control byte is escaped (ANSI
+# color codes from tool output would otherwise make the line unparseable).
+cf_json_string() {
+    local s="$1" code ch
+    s="${s//\\/\\\\}"
+    s="${s//\"/\\\"}"
+    s="${s//$'\n'/\\n}"
+    s="${s//$'\r'/\\r}"
+    s="${s//$'\t'/\\t}"
+    if [[ "$s" == *[[:cntrl:]]* ]]; then
+        for code in {1..31}; do
+            printf -v ch "\\$(printf '%03o' "$code")"
+            [[ "$s" == *"$ch"* ]] || continue
+            s="${s//"$ch"/$(printf '\\u%04x' "$code")}"
+        done
+    fi
+    printf '"%s"' "$s"
+}
+
+# clean_fix_event <event> [key=value ...]
+# Append one event line. Values are always strings. Each line is one short
+# append, so stages running in parallel never interleave partial lines.
+clean_fix_event() {
+    [[ -n "${CLEAN_FIX_EVENTS_FILE:-}" ]] || return 0
+    local event="$1" pair line
+    shift
+    line="{\"v\":1,\"ts\":$(cf_json_string "$(date '+%Y-%m-%d %H:%M:%S')"),\"event\":$(cf_json_string "$event")"
+    for pair in "$@"; do
+        line+=",$(cf_json_string "${pair%%=*}"):$(cf_json_string "${pair#*=}")"
+    done
+    printf '%s}\n' "$line" >> "$CLEAN_FIX_EVENTS_FILE" 2>/dev/null || true
+}
@@ -19,16 +19,34 @@ import re
 import subprocess
 import sys
 import time
+from bisect import bisect_left
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from dataclasses import dataclass, field
+from dataclasses import asdict, dataclass, field, replace
 from pathlib import Path
-from typing import TypedDict, cast
+from typing import TypedDict, TypeVar, cast
 
 LOG_DIR = Path.home() / ".local" / "logs" / "clean-fix"
 RUST_DIR = Path.home() / "rust"
 CONF_FILE = Path.home() / ".claude" / "scripts" / "clean-fix" / "clean-fix.conf"
 HISTORY_DIR = RUST_DIR / "nate_style" / ".history"
 PENDING_DIR = HISTORY_DIR / ".pending"
+# `--list` summaries, one per log, keyed by the log's size and mtime so only a
+# log still being written is parsed again. Dot-named so `*.log` never sees it.
+LIST_CACHE_FILE = LOG_DIR / ".list-summaries.json"
+LIST_CACHE_VERSION = 2
+# `--phase-detect` state per log: how far it has been read and what the lines
+# so far said, so each monitor tick reads only what was appended since.
+PHASE_STATE_FILE = LOG_DIR / ".phase-detect.json"
+PHASE_STATE_VERSION = 1
+# A phase signal older than this many lines no longer names the current phase.
+PHASE_SIGNAL_WINDOW = 200
+# Bytes before the saved offset that must still match for the state to resume.
+PHASE_ANCHOR_BYTES = 64
+# Structured twin of a run log written by clean_fix_events.sh:
+# clean-fix-<ts>.log -> clean-fix-<ts>.events.jsonl.
+EVENTS_SUFFIX = ".events.jsonl"
+EVENTS_VERSION = 1
 
 # Single source of truth for the live-monitor filter regex.
 # Kept identical in spirit to the alternation that previously lived in
@@ -58,6 +76,10 @@ EVAL_SORT_ORDER: dict[str, int] = {
 # has not reaped it yet.
 HEARTBEAT_FRESH_SECS = 150
 
+# Threads for `current_state_result`'s per-project loads. Each is a few file
+# reads and at most one git call, so they overlap well past the core count.
+SNAPSHOT_WORKERS = 8
+
 # Permanent exclusions: directory will never be a candidate while it exists in
 # its current form. Covers directories not opted into the `[build]` / `[projects]`
 # allowlists plus structural reasons (not a Rust project, framework-managed
@@ -113,6 +135,25 @@ FAILURE_REPORT_RE = re.compile(r"^\s+failure report: (.+)$")
 # Per-project live phase markers emitted by style-fix-worktrees.sh:
 #   [progress <project>] phase=<name> [k=v ...]
 PROGRESS_RE = re.compile(r"^\[progress (\S+)\] phase=(\S+)(?:\s+(.*))?$")
+# Every token the run-window scrape, a phase-boundary check, or a parse_*_phase
+# branch keys on. A line with none of them is inert to all of them, so
+# parse_log finds the marker lines once and hands only those on; the bulk of a
+# log (cargo and agent output) is never tried against the per-phase patterns.
+# Kept a flat alternation of literals so the engine can skip ahead on their
+# first characters.
+MARKER_RE = re.compile(
+    "|".join(
+        re.escape(token)
+        for token in (
+            "SKIP: ", "CLEAN: ", "DONE: ", "Done: ", "WARN: ", "WARNING: ", "ERROR: ",
+            "FAIL: ", "FAILED: ", "TIMEOUT: ", "OK: ", "AUTOFINALIZE: ", "ELIGIBLE: ",
+            "AGENT LIMIT: ", "WARMUP:", "[progress ", "Launched: ", "failure report: ",
+            "=== Style", "=== Clean-fix", "Starting style evaluations",
+            "Creating style-fix worktrees",
+        )
+    )
+)
+CLEAN_LINE_RE = re.compile(r"\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2} CLEAN: ")
 
 
 def _marker_reason(rest: str) -> str:
@@ -343,21 +384,129 @@ def _filename_date_time(ts: str) -> tuple[str, str]:
     return stamp.strftime("%Y-%m-%d"), stamp.strftime("%H:%M")
 
 
-def _list_duration(result: ParseResult, now: float) -> str:
-    if result.elapsed:
-        return result.elapsed
-    if not result.run_start:
+@dataclass(frozen=True)
+class LogSummary:
+    """What `--list` shows for one log; every field comes from the log and its event stream."""
+
+    status: str
+    run_start: str
+    run_end: str
+    elapsed: str
+    phases: tuple[str, ...]
+
+
+def summarize_result(result: ParseResult) -> LogSummary:
+    return LogSummary(
+        status=result.status,
+        run_start=result.run_start,
+        run_end=result.run_end,
+        elapsed=result.elapsed,
+        phases=tuple(p for p in PHASES if result.stats[p].present),
+    )
+
+
+def _load_list_cache() -> dict[str, list[object]]:
+    try:
+        parsed = _load_json_value(LIST_CACHE_FILE.read_text(errors="replace"))
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(parsed, dict):
+        return {}
+    payload = cast("dict[str, object]", parsed)
+    logs = payload.get("logs")
+    if payload.get("version") != LIST_CACHE_VERSION or not isinstance(logs, dict):
+        return {}
+    return cast("dict[str, list[object]]", logs)
+
+
+def _write_json_atomic(path: Path, payload: object) -> None:
+    import json
+    import os
+
+    tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    try:
+        _ = tmp.write_text(json.dumps(payload, sort_keys=True))
+        _ = tmp.replace(path)
+    except OSError:
+        tmp.unlink(missing_ok=True)
+
+
+def _write_list_cache(entries: dict[str, list[object]]) -> None:
+    _write_json_atomic(LIST_CACHE_FILE, {"version": LIST_CACHE_VERSION, "logs": entries})
+
+
+def _cached_summary(entry: object, stamp: list[object]) -> LogSummary | None:
+    """The summary in a list-cache entry, if it was built from inputs with this stamp."""
+    if not isinstance(entry, list):
+        return None
+    fields = cast("list[object]", entry)
+    if len(fields) != 8 or fields[:3] != stamp or not isinstance(fields[7], list):
+        return None
+    return LogSummary(
+        status=str(fields[3]),
+        run_start=str(fields[4]),
+        run_end=str(fields[5]),
+        elapsed=str(fields[6]),
+        phases=tuple(str(phase) for phase in cast("list[object]", fields[7])),
+    )
+
+
+def log_summaries(logs: list[Path]) -> list[LogSummary]:
+    """`summarize_result(parse_log(path))` for each log, through the list cache.
+
+    A cached summary is reused while the log's (size, mtime_ns) and its event
+    stream's size match the ones it was built from, so a finished log is parsed
+    once and only the log still being written is parsed again. Entries for logs
+    that no longer exist are dropped on write.
+    """
+    cached = _load_list_cache()
+    entries: dict[str, list[object]] = {}
+    summaries: list[LogSummary] = []
+    changed = False
+    for path in logs:
+        try:
+            stat = path.stat()
+        except OSError:
+            summaries.append(summarize_result(parse_log(path)))
+            continue
+        try:
+            events_size = events_path(path).stat().st_size
+        except OSError:
+            events_size = -1
+        stamp: list[object] = [stat.st_size, stat.st_mtime_ns, events_size]
+        summary = _cached_summary(cached.get(str(path)), stamp)
+        if summary is None:
+            summary = summarize_result(parse_log(path))
+            changed = True
+        entries[str(path)] = [
+            *stamp,
+            summary.status,
+            summary.run_start,
+            summary.run_end,
+            summary.elapsed,
+            list(summary.phases),
+        ]
+        summaries.append(summary)
+    if changed or entries.keys() != cached.keys():
+        _write_list_cache(entries)
+    return summaries
+
+
+def _list_duration(summary: LogSummary, now: float) -> str:
+    if summary.elapsed:
+        return summary.elapsed
+    if not summary.run_start:
         return "-"
     try:
-        start = time.mktime(time.strptime(result.run_start, "%Y-%m-%d %H:%M:%S"))
+        start = time.mktime(time.strptime(summary.run_start, "%Y-%m-%d %H:%M:%S"))
     except ValueError:
         return "-"
-    if result.status == "in-progress":
+    if summary.status == "in-progress":
         return f"running {format_duration(now - start)}"
-    if not result.run_end:
+    if not summary.run_end:
         return "-"
     try:
-        end = time.mktime(time.strptime(result.run_end, "%Y-%m-%d %H:%M:%S"))
+        end = time.mktime(time.strptime(summary.run_end, "%Y-%m-%d %H:%M:%S"))
     except ValueError:
         return "-"
     return format_duration(end - start)
@@ -425,7 +574,20 @@ def _load_json_value(text: str) -> object:
     return cast(object, json.loads(text))
 
 
+# project -> its pending JSON, read once per process; every pending_* helper
+# and the heartbeat read go through `pending_payload`.
+_pending_payloads: dict[str, dict[str, object]] = {}
+
+
 def pending_payload(project: str) -> dict[str, object]:
+    payload = _pending_payloads.get(project)
+    if payload is None:
+        payload = _read_pending_payload(project)
+        _pending_payloads[project] = payload
+    return payload
+
+
+def _read_pending_payload(project: str) -> dict[str, object]:
     pending_path = PENDING_DIR / f"{project}.json"
     if not pending_path.exists():
         return {}
@@ -646,15 +808,39 @@ def evaluation_has_no_violations(project: str, result: ParseResult) -> bool:
     return False
 
 
-def detect_phase_boundaries(lines: list[str]) -> dict[str, tuple[int, int]]:
+def marker_indices(lines: list[str]) -> list[int]:
+    """Indices of the lines MARKER_RE matches, ascending.
+
+    One scan of the joined text rather than a search per line; no marker
+    contains a newline, so a match never straddles two lines.
+    """
+    text = "\n".join(lines)
+    marked: list[int] = []
+    line = 0
+    scanned = 0
+    for match in MARKER_RE.finditer(text):
+        start = match.start()
+        line += text.count("\n", scanned, start)
+        scanned = start
+        if not marked or marked[-1] != line:
+            marked.append(line)
+    return marked
+
+
+def detect_phase_boundaries(lines: list[str], marked: list[int]) -> dict[str, tuple[int, int]]:
     """Return inclusive start / exclusive end indices for each phase that appears.
 
-    Phases not present are omitted from the dict.
+    Phases not present are omitted from the dict. One pass over the marker
+    lines (`marker_indices(lines)`) finds every start, end, and the clean
+    phase's `CLEAN:` evidence.
     """
     bounds: dict[str, tuple[int, int]] = {}
     n = len(lines)
     clean_start = 0 if n > 0 else -1
+    clean_end = -1
+    clean_seen = False
     warmup_start = -1
+    warmup_end = -1
     eval_start = -1
     eval_end = -1
     review_start = -1
@@ -665,10 +851,25 @@ def detect_phase_boundaries(lines: list[str]) -> dict[str, tuple[int, int]]:
     eval_done_seen = False
     review_done_seen = False
 
-    for i, line in enumerate(lines):
-        if warmup_start == -1 and "WARMUP:" in line and "WARMUP KILLING" not in line:
+    for i in marked:
+        line = lines[i]
+        eval_header = EVAL_HEADER_RE.search(line) is not None
+        warmup_line = "WARMUP:" in line and "WARMUP KILLING" not in line
+        style_start = eval_header or "Starting style evaluations" in line
+        # clean phase ends at first warmup OR first eval header OR first
+        # "Starting style evaluations" line.
+        if clean_end == -1:
+            if warmup_line or style_start:
+                clean_end = i
+            elif CLEAN_LINE_RE.match(line):
+                clean_seen = True
+        if warmup_start == -1 and warmup_line:
             warmup_start = i
-        if eval_start == -1 and EVAL_HEADER_RE.search(line):
+        # warmup ends at the first eval header / "Starting style" after it.
+        if warmup_start != -1 and warmup_end == -1 and style_start:
+            warmup_end = i
+
+        if eval_start == -1 and eval_header:
             eval_start = i
             continue
         if eval_start != -1 and not eval_done_seen and EVAL_DONE_RE.search(line):
@@ -691,34 +892,15 @@ def detect_phase_boundaries(lines: list[str]) -> dict[str, tuple[int, int]]:
         if FIX_DONE_RE.search(line) and fix_start != -1:
             fix_end = i + 1
 
-    # clean phase ends at first warmup OR first eval header OR first
-    # "Starting style evaluations" line.
-    clean_end = n
-    for i, line in enumerate(lines):
-        if "WARMUP:" in line and "WARMUP KILLING" not in line:
-            clean_end = i
-            break
-        if EVAL_HEADER_RE.search(line) or "Starting style evaluations" in line:
-            clean_end = i
-            break
-
-    # warmup ends at clean_end's successor: first eval header / "Starting style".
-    warmup_end = clean_end  # default if no warmup
-    if warmup_start != -1:
-        warmup_end = n
-        for i in range(warmup_start, n):
-            if EVAL_HEADER_RE.search(lines[i]) or "Starting style evaluations" in lines[i]:
-                warmup_end = i
-                break
-
+    if clean_end == -1:
+        clean_end = n
     if clean_start != -1 and clean_end > clean_start:
         # Only register clean if there's a timestamped `CLEAN: <project>` line.
         # Untimestamped SKIP/ELIGIBLE lines belong to style-fix-worktrees.sh, not the clean phase.
-        slice_text = "\n".join(lines[clean_start:clean_end])
-        if re.search(r"^\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2} CLEAN: ", slice_text, re.MULTILINE):
+        if clean_seen:
             bounds["clean"] = (clean_start, clean_end)
     if warmup_start != -1:
-        bounds["warmup"] = (warmup_start, warmup_end)
+        bounds["warmup"] = (warmup_start, warmup_end if warmup_end != -1 else n)
     if eval_start != -1:
         bounds["eval"] = (eval_start, eval_end if eval_end != -1 else n)
     if review_start != -1:
@@ -792,6 +974,33 @@ def parse_clean_phase(
         stats.processed += 1
 
 
+def apply_clean_cells(cells: dict[str, tuple[str, str]], result: ParseResult) -> None:
+    """Replace the scraped clean column with the run's `cell` events.
+
+    The stream records each project's outcome exactly, including a project
+    still building (RUNNING), which the text log cannot tell from one that
+    finished without a `DONE:` line. Reasons keep `parse_clean_phase`'s form.
+    """
+    stats = result.stats["clean"]
+    stats.present = True
+    stats.ok = stats.fail = stats.skip = stats.processed = 0
+    for project, (state, reason) in cells.items():
+        row = get_row(result.rows, project)
+        if state == "SKIP":
+            row["clean"] = Cell("SKIP", slugify_reason(reason))
+            stats.skip += 1
+            continue
+        stats.processed += 1
+        if state == "OK":
+            row["clean"] = Cell("OK", reason)
+            stats.ok += 1
+        elif state == "FAIL":
+            row["clean"] = Cell("FAIL", slugify_reason(f"ERROR {reason}"))
+            stats.fail += 1
+        else:
+            row["clean"] = Cell("RUNNING", "running")
+
+
 def parse_warmup_phase(lines: list[str], result: ParseResult) -> None:
     stats = result.stats["warmup"]
     stats.present = True
@@ -984,7 +1193,9 @@ def parse_review_phase(lines: list[str], result: ParseResult) -> None:
             result.warnings.append(Warning("review", project, "launched but no result"))
 
 
-def parse_fix_phase(lines: list[str], result: ParseResult) -> None:
+def parse_fix_phase(
+    lines: list[str], result: ParseResult, event_limits: dict[str, AgentLimit] | None = None
+) -> None:
     stats = result.stats["fix"]
     stats.present = True
     eligible: set[str] = set()
@@ -998,7 +1209,7 @@ def parse_fix_phase(lines: list[str], result: ParseResult) -> None:
     # family/log paths captured from launch markers (see agent_limit_*).
     agent_logs: dict[str, list[str]] = {}
     agent_families: dict[str, str] = {}
-    durable_limits: dict[str, AgentLimit] = {}
+    durable_limits: dict[str, AgentLimit] = dict(event_limits or {})
     eligible_re = re.compile(r"^ELIGIBLE: (\S+)")
     skip_re = re.compile(r"^SKIP: (\S+) \(([^)]+)\)")
     ok_re = re.compile(r"^OK: (\S+)")
@@ -1276,24 +1487,102 @@ def overlay_live_pending_state(result: ParseResult) -> None:
             skip.reason = plain
 
 
-def parse_log(path: Path) -> ParseResult:
-    text = path.read_text(errors="replace")
-    lines = text.splitlines()
-    result = ParseResult(path=path)
-    for phase in PHASES:
-        result.stats[phase] = PhaseStats()
+@dataclass
+class RunEvents:
+    """A run's event stream folded into the run/phase state it describes."""
 
-    if not lines:
-        result.notes.append("empty log")
-        return result
+    run_start: str = ""
+    run_end: str = ""
+    elapsed: str = ""
+    last_ts: str = ""
+    phase: str = "unknown"
+    latest: str = ""
+    # project -> (state, reason) from the latest `cell phase=clean` event.
+    clean_cells: dict[str, tuple[str, str]] = field(default_factory=dict)
+    # project -> limit from `agent-limit` events; same source as the durable
+    # `AGENT LIMIT:` log line.
+    agent_limits: dict[str, AgentLimit] = field(default_factory=dict)
+
+    def feed(self, lines: list[str]) -> bool:
+        """Fold event lines in; True if any was an event of this version.
+
+        A line that does not parse is the one still being appended and is
+        skipped.
+        """
+        seen = False
+        for line in lines:
+            try:
+                parsed = _load_json_value(line)
+            except ValueError:
+                continue
+            if not isinstance(parsed, dict):
+                continue
+            event = cast("dict[str, object]", parsed)
+            if event.get("v") != EVENTS_VERSION:
+                continue
+            seen = True
+            kind = event.get("event")
+            self.last_ts = str(event.get("ts", ""))
+            if kind == "run-start":
+                self.run_start = self.last_ts
+            elif kind == "run-end":
+                self.run_end = self.last_ts
+                self.elapsed = str(event.get("elapsed", ""))
+            elif kind == "phase-start":
+                self.phase = str(event.get("phase", "unknown"))
+            elif kind == "cell" and event.get("phase") == "clean":
+                self.clean_cells[str(event.get("project", ""))] = (
+                    str(event.get("state", "")),
+                    str(event.get("reason", "")),
+                )
+            elif kind == "agent-limit":
+                self.agent_limits[str(event.get("project", ""))] = AgentLimit(
+                    str(event.get("family", "agent")), str(event.get("descriptor", ""))
+                )
+            self.latest = describe_event(event)
+        return seen
+
+    def current(self) -> tuple[str, str]:
+        """Same contract as `detect_current_phase`."""
+        if self.run_end:
+            return ("done", self.latest)
+        return (self.phase, self.latest)
+
+
+def events_path(log: Path) -> Path:
+    return log.with_suffix(EVENTS_SUFFIX)
+
+
+def describe_event(event: dict[str, object]) -> str:
+    """One-line rendering of an event, in the text log's own form where it has one."""
+    fields = {key: str(value) for key, value in event.items() if key not in ("v", "ts", "event")}
+    if event.get("event") == "progress":
+        return f"[progress {fields.get('project', '')}] phase={fields.get('name', '')} {fields.get('rest', '')}".rstrip()
+    detail = " ".join(f"{key}={value}" for key, value in fields.items() if value)
+    return f"{event.get('ts', '')} {event.get('event', '')} {detail}".rstrip()
+
+
+def load_run_events(log: Path) -> RunEvents | None:
+    """Fold `log`'s event stream, or None when the run did not write one.
 
-    # Run window.
+    Logs from before the stream existed, and standalone stage runs, have none;
+    callers fall back to scraping the text log.
+    """
+    try:
+        text = events_path(log).read_text(errors="replace")
+    except OSError:
+        return None
+    events = RunEvents()
+    return events if events.feed(text.splitlines()) else None
+
+
+def _scrape_run_window(lines: list[str], marked: list[int], result: ParseResult) -> None:
     for line in lines:
         m = TS_RE.match(line)
         if m:
             result.run_start = m.group(1)
             break
-    for line in lines:
+    for line in (lines[i] for i in marked):
         m = COMPLETE_RE.search(line)
         if m:
             result.elapsed = m.group(1)
@@ -1311,22 +1600,48 @@ def parse_log(path: Path) -> ParseResult:
                 break
         result.status = "in-progress" if result.run_start else "partial"
 
-    bounds = detect_phase_boundaries(lines)
+
+def parse_log(path: Path) -> ParseResult:
+    text = path.read_text(errors="replace")
+    lines = text.splitlines()
+    result = ParseResult(path=path)
+    for phase in PHASES:
+        result.stats[phase] = PhaseStats()
+
+    if not lines:
+        result.notes.append("empty log")
+        return result
+
+    marked = marker_indices(lines)
+
+    # Run window: exact from the event stream when the run wrote one.
+    events = load_run_events(path)
+    if events is not None and events.run_start:
+        result.run_start = events.run_start
+        result.run_end = events.run_end or events.last_ts
+        result.elapsed = events.elapsed
+        result.status = "complete" if events.run_end else "in-progress"
+    else:
+        _scrape_run_window(lines, marked, result)
+
+    bounds = detect_phase_boundaries(lines, marked)
+
+    def marker_lines(phase: str) -> list[str]:
+        start, end = bounds[phase]
+        return [lines[i] for i in marked[bisect_left(marked, start) : bisect_left(marked, end)]]
+
     if "clean" in bounds:
-        s, e = bounds["clean"]
-        parse_clean_phase(lines[s:e], result)
+        parse_clean_phase(marker_lines("clean"), result)
+    if events is not None and events.clean_cells:
+        apply_clean_cells(events.clean_cells, result)
     if "warmup" in bounds:
-        s, e = bounds["warmup"]
-        parse_warmup_phase(lines[s:e], result)
+        parse_warmup_phase(marker_lines("warmup"), result)
     if "eval" in bounds:
-        s, e = bounds["eval"]
-        parse_eval_phase(lines[s:e], result)
+        parse_eval_phase(marker_lines("eval"), result)
     if "review" in bounds:
-        s, e = bounds["review"]
-        parse_review_phase(lines[s:e], result)
+        parse_review_phase(marker_lines("review"), result)
     if "fix" in bounds:
-        s, e = bounds["fix"]
-        parse_fix_phase(lines[s:e], result)
+        parse_fix_phase(marker_lines("fix"), result, events.agent_limits if events is not None else None)
 
     # Partial logs: only the style-fix passes present (style-fix-manual logs).
     phases_present = [p for p in PHASES if result.stats[p].present]
@@ -1392,32 +1707,14 @@ def pending_stop_reason(pending: dict[str, object]) -> str:
 
 
 def source_working_tree_is_dirty(root: Path) -> bool:
-    """Match the style-fix launcher's member-scoped dirty-tree check."""
-    try:
-        repo_result = subprocess.run(
-            ["git", "-C", str(root), "rev-parse", "--show-toplevel"],
-            check=False,
-            capture_output=True,
-            text=True,
-        )
-    except OSError:
-        return False
-    repo_text = repo_result.stdout.strip()
-    if repo_result.returncode != 0 or not repo_text:
-        return False
-
-    repo_root = Path(repo_text)
-    try:
-        target = root.resolve().relative_to(repo_root.resolve())
-    except (OSError, ValueError):
-        return False
+    """Match the style-fix launcher's member-scoped dirty-tree check.
 
-    command = ["git", "-C", str(repo_root), "status", "--porcelain"]
-    if target != Path("."):
-        command.extend(["--", str(target)])
+    Pathspecs resolve against `-C`, so `-- .` scopes the status to the member
+    directory (the whole repo when `root` is its top level) in one git call.
+    """
     try:
         status_result = subprocess.run(
-            command,
+            ["git", "-C", str(root), "status", "--porcelain", "--", "."],
             check=False,
             capture_output=True,
             text=True,
@@ -1427,6 +1724,40 @@ def source_working_tree_is_dirty(root: Path) -> bool:
     return status_result.returncode == 0 and bool(status_result.stdout.strip())
 
 
+@dataclass(frozen=True)
+class ProjectSnapshot:
+    """What `current_state_result` needs about one project, loaded in one pass."""
+
+    root_exists: bool
+    has_manifest: bool
+    pending: dict[str, object]
+    status: str  # pending_status(), or "" without a pending JSON
+    heartbeat: HeartbeatStatus | None
+    dirty: bool  # only checked for reviewed findings, the one row that shows it
+
+
+def load_project_snapshot(project: str, root: Path, now_epoch: float) -> ProjectSnapshot:
+    pending = pending_payload(project)
+    status = pending_status(pending) if pending else ""
+    root_exists = root.exists()
+    return ProjectSnapshot(
+        root_exists=root_exists,
+        has_manifest=root_exists and (root / "Cargo.toml").exists(),
+        pending=pending,
+        status=status,
+        heartbeat=eval_heartbeat_status(project, now_epoch),
+        dirty=status == "reviewed_findings" and root_exists and source_working_tree_is_dirty(root),
+    )
+
+
+def _newest_live_log() -> ParseResult | None:
+    newest = find_newest_log()
+    if newest is None:
+        return None
+    live = parse_log(newest)
+    return live if live.status == "in-progress" else None
+
+
 def current_state_result() -> ParseResult:
     result = ParseResult(path=Path(CURRENT_STATE_LABEL))
     for phase in PHASES:
@@ -1438,18 +1769,28 @@ def current_state_result() -> ParseResult:
     worktrees = style_fix_worktrees_by_project()
     now_epoch = time.time()
 
-    for project in sorted(roots):
+    # Projects are independent, so their pending reads, stats, and git calls
+    # run side by side; the newest log is parsed for the live overlay meanwhile.
+    projects = sorted(roots)
+    with ThreadPoolExecutor(max_workers=SNAPSHOT_WORKERS) as pool:
+        live_future = pool.submit(_newest_live_log)
+        snapshots = list(
+            pool.map(load_project_snapshot, projects, [roots[p] for p in projects], [now_epoch] * len(projects))
+        )
+        live = live_future.result()
+
+    for project, snapshot in zip(projects, snapshots):
         row = get_row(result.rows, project)
         root = roots[project]
-        pending = pending_payload(project)
-        hb = eval_heartbeat_status(project, now_epoch)
-        if root.exists() and not (root / "Cargo.toml").exists():
+        pending = snapshot.pending
+        hb = snapshot.heartbeat
+        if snapshot.root_exists and not snapshot.has_manifest:
             row["eval"] = Cell("FAIL", "missing-cargo-toml")
             result.warnings.append(
                 Warning("eval", project, f"project root has no Cargo.toml: {root}")
             )
             continue
-        if not root.exists():
+        if not snapshot.root_exists:
             row["eval"] = Cell("FAIL", "project-root-missing")
             result.warnings.append(
                 Warning("eval", project, f"project root missing: {root}")
@@ -1457,7 +1798,7 @@ def current_state_result() -> ParseResult:
             continue
 
         if pending:
-            status = pending_status(pending)
+            status = snapshot.status
             if status == "missing":
                 if hb is not None and hb["fresh"]:
                     row["eval"] = Cell("RUNNING", "running")
@@ -1481,7 +1822,7 @@ def current_state_result() -> ParseResult:
                 result.skip_reasons.append(
                     SkipReason("eval", "reviewed findings awaiting fix", project)
                 )
-                if source_working_tree_is_dirty(root):
+                if snapshot.dirty:
                     row["fix"] = Cell("SKIP", "source-working-tree-dirty")
                     result.skip_reasons.append(
                         SkipReason("fix", "source working tree dirty", project)
@@ -1519,23 +1860,20 @@ def current_state_result() -> ParseResult:
                     f"{project}: {', '.join(worktrees[project])} exists but no pending clean-fix handoff is recorded."
                 )
 
-    newest = find_newest_log()
-    if newest is not None:
-        live = parse_log(newest)
-        if live.status == "in-progress":
-            result.notes.append(f"live log overlay: {newest}")
-            for project, live_row in live.rows.items():
-                if project not in result.rows:
-                    continue
-                row = result.rows[project]
-                for phase in PHASES:
-                    if live_row[phase].state != CELL_DASH:
-                        row[phase] = live_row[phase]
-            result.warnings.extend(live.warnings)
-            result.running.extend(live.running)
-            result.tool_warnings.extend(live.tool_warnings)
-            result.skip_reasons.extend(live.skip_reasons)
-            result.phase_now.update(live.phase_now)
+    if live is not None:
+        result.notes.append(f"live log overlay: {live.path}")
+        for project, live_row in live.rows.items():
+            if project not in result.rows:
+                continue
+            row = result.rows[project]
+            for phase in PHASES:
+                if live_row[phase].state != CELL_DASH:
+                    row[phase] = live_row[phase]
+        result.warnings.extend(live.warnings)
+        result.running.extend(live.running)
+        result.tool_warnings.extend(live.tool_warnings)
+        result.skip_reasons.extend(live.skip_reasons)
+        result.phase_now.update(live.phase_now)
 
     recompute_current_stats(result)
     return result
@@ -1909,29 +2247,191 @@ def humanize_cell_reason(reason: str) -> str:
     return known.get(reason, reason.replace("-", " "))
 
 
+RUN_COMPLETE_MARKER = "=== Clean-fix Rust clean + rebuild complete"
+LAUNCHED_PID_RE = re.compile(r"^Launched: \S+ \(PID")
+CLEAN_SIGNAL_RE = re.compile(r"^\d{4}-\d{2}-\d{2}.*(CLEAN:|BUILD:|MEND:|DONE:)")
+
+
+def classify_phase_signal(line: str) -> str | None:
+    """The phase a log line announces, or None for lines that announce none."""
+    if FIX_HEADER_RE.search(line) or LAUNCHED_PID_RE.search(line):
+        return "style-fix"
+    if EVAL_HEADER_RE.search(line) or "Launched:" in line and "via claude" in line:
+        return "style-eval"
+    if REVIEW_HEADER_RE.search(line):
+        return "style-eval-review"
+    if "WARMUP" in line:
+        return "warmup"
+    if CLEAN_SIGNAL_RE.search(line):
+        return "clean+rebuild"
+    return None
+
+
+@dataclass
+class LogCursor:
+    """Where a resumable reader of an append-only file stopped.
+
+    `offset` always sits just past a newline, so the bytes before it decode
+    and split into lines exactly as they would as part of the whole file.
+    `anchor` is the hex of the bytes just before `offset`, to notice a file
+    rewritten in place rather than appended to.
+    """
+
+    device: int = 0
+    inode: int = 0
+    offset: int = 0
+    anchor: str = ""
+
+
+ScanT = TypeVar("ScanT", bound=LogCursor)
+
+
+@dataclass
+class PhaseScan(LogCursor):
+    """Resumable `detect_current_phase` state for one text log."""
+
+    line_count: int = 0
+    last_line: str = ""
+    complete: bool = False
+    signal_index: int = -1
+    signal_phase: str = ""
+    signal_line: str = ""
+
+    def feed(self, lines: list[str]) -> None:
+        for line in lines:
+            if RUN_COMPLETE_MARKER in line:
+                self.complete = True
+            phase = classify_phase_signal(line)
+            if phase is not None:
+                self.signal_index = self.line_count
+                self.signal_phase = phase
+                self.signal_line = line
+            self.line_count += 1
+            self.last_line = line
+
+    def current(self) -> tuple[str, str]:
+        if self.line_count == 0:
+            return ("unknown", "")
+        if self.complete:
+            return ("done", self.last_line)
+        if self.signal_index != -1 and self.signal_index >= self.line_count - PHASE_SIGNAL_WINDOW:
+            return (self.signal_phase, self.signal_line)
+        return ("unknown", self.last_line)
+
+
+@dataclass
+class EventScan(LogCursor):
+    """Resumable `detect_current_phase` state for one event stream.
+
+    Keeps only the `RunEvents` fields the phase answer reads; per-project
+    cells are `parse_log`'s concern.
+    """
+
+    seen: bool = False
+    run_end: str = ""
+    phase: str = "unknown"
+    latest: str = ""
+
+    def feed(self, lines: list[str]) -> None:
+        events = RunEvents(run_end=self.run_end, phase=self.phase, latest=self.latest)
+        if events.feed(lines):
+            self.seen = True
+            self.run_end, self.phase, self.latest = events.run_end, events.phase, events.latest
+
+    def current(self) -> tuple[str, str]:
+        return RunEvents(run_end=self.run_end, phase=self.phase, latest=self.latest).current()
+
+
+def _load_phase_states() -> dict[str, dict[str, object]]:
+    try:
+        parsed = _load_json_value(PHASE_STATE_FILE.read_text(errors="replace"))
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(parsed, dict):
+        return {}
+    payload = cast("dict[str, object]", parsed)
+    logs = payload.get("logs")
+    if payload.get("version") != PHASE_STATE_VERSION or not isinstance(logs, dict):
+        return {}
+    return cast("dict[str, dict[str, object]]", logs)
+
+
+def _scan_from_state(kind: type[ScanT], state: object) -> ScanT | None:
+    if not isinstance(state, dict):
+        return None
+    try:
+        return kind(**cast("dict[str, object]", state))  # pyright: ignore[reportArgumentType]
+    except TypeError:
+        return None
+
+
+def _resume_scan(path: Path, kind: type[ScanT], state: object) -> tuple[ScanT, bytes]:
+    """The saved scan of `path` and the bytes appended since it stopped.
+
+    When the file was replaced, truncated or rewritten in place, a fresh scan
+    and the whole file are returned instead.
+    """
+    stat = path.stat()
+    scan = _scan_from_state(kind, state)
+    if scan is None or (scan.device, scan.inode) != (stat.st_dev, stat.st_ino) or scan.offset > stat.st_size:
+        scan = kind(device=stat.st_dev, inode=stat.st_ino)
+    anchor_len = len(scan.anchor) // 2
+    with path.open("rb") as handle:
+        _ = handle.seek(scan.offset - anchor_len)
+        appended = handle.read()
+        if appended[:anchor_len].hex() != scan.anchor:
+            scan = kind(device=stat.st_dev, inode=stat.st_ino)
+            _ = handle.seek(0)
+            return scan, handle.read()
+    return scan, appended[anchor_len:]
+
+
+def _advance_scan(scan: LogCursor, appended: bytes) -> int:
+    """Move `scan` past the complete lines of `appended`; returns their length."""
+    cut = appended.rfind(b"\n") + 1
+    scan.offset += cut
+    if cut:
+        scan.anchor = appended[max(cut - PHASE_ANCHOR_BYTES, 0) : cut].hex()
+    return cut
+
+
 def detect_current_phase(path: Path) -> tuple[str, str]:
-    """Return (current_phase, latest_meaningful_line)."""
-    text = path.read_text(errors="replace")
-    lines = text.splitlines()
-    if not lines:
-        return ("unknown", "")
-
-    if any("=== Clean-fix Rust clean + rebuild complete" in line for line in lines):
-        return ("done", lines[-1] if lines else "")
-
-    # Walk from end backwards looking for the latest phase signal.
-    for line in reversed(lines[-200:]):
-        if FIX_HEADER_RE.search(line) or re.search(r"^Launched: \S+ \(PID", line):
-            return ("style-fix", line)
-        if EVAL_HEADER_RE.search(line) or "Launched:" in line and "via claude" in line:
-            return ("style-eval", line)
-        if REVIEW_HEADER_RE.search(line):
-            return ("style-eval-review", line)
-        if "WARMUP" in line:
-            return ("warmup", line)
-        if re.search(r"^\d{4}-\d{2}-\d{2}.*(CLEAN:|BUILD:|MEND:|DONE:)", line):
-            return ("clean+rebuild", line)
-    return ("unknown", lines[-1])
+    """Return (current_phase, latest_meaningful_line).
+
+    A run that wrote an event stream is answered from that; otherwise from the
+    text log. Either file is read from where the previous call for it
+    stopped; only when it was replaced or truncated is it read from the start
+    again. Complete lines advance the saved state; a trailing partial log line
+    is considered for this answer but re-read next time (a partial event line
+    does not parse and waits for the next call).
+    """
+    states = _load_phase_states()
+    dirty = False
+    answer: tuple[str, str] | None = None
+    stream = events_path(path)
+    if stream.exists():
+        events, appended = _resume_scan(stream, EventScan, states.get(str(stream)))
+        cut = _advance_scan(events, appended)
+        events.feed(appended[:cut].decode("utf-8", errors="replace").splitlines())
+        if cut:
+            states[str(stream)] = asdict(events)
+            dirty = True
+        if events.seen:
+            answer = events.current()
+    if answer is None:
+        scan, appended = _resume_scan(path, PhaseScan, states.get(str(path)))
+        cut = _advance_scan(scan, appended)
+        scan.feed(appended[:cut].decode("utf-8", errors="replace").splitlines())
+        if cut:
+            states[str(path)] = asdict(scan)
+            dirty = True
+        tail = replace(scan)
+        tail.feed(appended[cut:].decode("utf-8", errors="replace").splitlines())
+        answer = tail.current()
+    if dirty:
+        states = {key: state for key, state in states.items() if Path(key).exists()}
+        _write_json_atomic(PHASE_STATE_FILE, {"version": PHASE_STATE_VERSION, "logs": states})
+    return answer
 
 
 def format_age(seconds: float) -> str:
@@ -2041,14 +2541,13 @@ def emit_list() -> None:
         print("ERROR: no logs found")
         sys.exit(1)
     now = time.time()
-    for path in logs:
+    for path, summary in zip(logs, log_summaries(logs)):
         ts = _filename_ts_key(path)
         date, clock = _filename_date_time(ts)
-        result = parse_log(path)
-        duration = _list_duration(result, now)
-        present = ",".join(p for p in PHASES if result.stats[p].present) or "none"
+        duration = _list_duration(summary, now)
+        present = ",".join(summary.phases) or "none"
         print(
-            f"LOG path={path} date={date} time={clock} duration={duration} status={result.status} phases={present}"
+            f"LOG path={path} date={date} time={clock} duration={duration} status={summary.status} phases={present}"
         )
 
 
@@ -27,6 +27,10 @@ mkdir -p "$LOG_DIR"
 LOG="$LOG_DIR/style-fix-manual-$(date '+%Y%m%d-%H%M%S').log"
 
 SCRIPT="$HOME/.claude/scripts/clean-fix/style-fix-worktrees.sh"
+# Structured twin of $LOG; style-fix-worktrees.sh appends its progress events.
+export CLEAN_FIX_EVENTS_FILE="${LOG%.log}.events.jsonl"
+source "$HOME/.claude/scripts/clean-fix/clean_fix_events.sh"
+clean_fix_event phase-start phase=style-fix
 
 echo "Log: $LOG"
 
@@ -26,6 +26,10 @@ __emit_launcher_exit() {
     __final_exit_code=$?
     local proj="${SINGLE_PROJECT:-all}"
     printf '[progress %s] phase=launcher-exit code=%s\n' "$proj" "$__final_exit_code"
+    # The trap can fire before clean_fix_events.sh is sourced.
+    if declare -F clean_fix_event >/dev/null; then
+        clean_fix_event progress project="$proj" name=launcher-exit rest="code=$__final_exit_code"
+    fi
 }
 trap __emit_launcher_exit EXIT
 
@@ -34,6 +38,7 @@ source "$HOME/.cargo/env"
 
 SCRIPT_DIR="$(cd "$(dirname "$0")" && pwd)"
 source "$SCRIPT_DIR/agent_assignments.sh"
+source "$SCRIPT_DIR/clean_fix_events.sh"
 
 RUST_DIR="$HOME/rust"
 CONF_FILE="$SCRIPT_DIR/clean-fix.conf"
@@ -51,10 +56,24 @@ mkdir -p "$LOG_DIR"
 # Stable phase markers a `Monitor` consumer (e.g. /style_eval --fix) can grep
 # for line-by-line. Format: `[progress <project>] phase=<name> [k=v ...]`.
 # Kept on its own line and on stdout so the manual launcher's log captures it.
+# Each marker is also appended to the run's event stream (clean_fix_events.sh).
 progress() {
     local proj="$1"
     shift
-    printf '[progress %s] %s\n' "$proj" "$*"
+    local marker="$*"
+    local name="${marker%% *}"
+    local rest=""
+    [[ "$marker" == *" "* ]] && rest="${marker#* }"
+    printf '[progress %s] %s\n' "$proj" "$marker"
+    clean_fix_event progress project="$proj" name="${name#phase=}" rest="$rest"
+}
+
+# Durable `AGENT LIMIT:` line for the run log, mirrored as an agent-limit event.
+report_agent_limit() {
+    local proj="$1"
+    [[ -n "$SUPERVISE_AGENT_LIMIT" ]] || return 0
+    echo "AGENT LIMIT: $proj (${STYLE_AGENT} $SUPERVISE_AGENT_LIMIT)"
+    clean_fix_event agent-limit project="$proj" family="$STYLE_AGENT" descriptor="$SUPERVISE_AGENT_LIMIT"
 }
 
 # Validate that $dir is a real git-linked worktree of $repo, not just a leftover
@@ -518,13 +537,14 @@ supervise_agent() {
             # processes, no orphan risk.
             local delta=$((current_log_size - last_log_size))
             tail -c "$delta" "$log_file" 2>/dev/null \
-                | awk -v proj="$proj" '
+                | awk '
                     /^>>> phase: / {
                         sub(/^>>> phase: /, "")
-                        printf "[progress %s] phase=agent-step %s\n", proj, $0
+                        print
                         fflush()
                     }
-                ' || true
+                ' \
+                | while IFS= read -r step; do progress "$proj" "phase=agent-step $step"; done || true
             last_log_size=$current_log_size
             last_activity_at=$elapsed
         elif (( current_log_size < last_log_size )); then
@@ -554,7 +574,7 @@ supervise_agent() {
             SUPERVISE_TIMED_OUT=1
             SUPERVISE_ELAPSED=$elapsed
             SUPERVISE_AGENT_LIMIT=$(detect_agent_limit "$log_file")
-            [[ -n "$SUPERVISE_AGENT_LIMIT" ]] && echo "AGENT LIMIT: $proj (${STYLE_AGENT} $SUPERVISE_AGENT_LIMIT)"
+            report_agent_limit "$proj"
             return 0
         fi
     done
@@ -569,18 +589,19 @@ supervise_agent() {
     if (( final_log_size > last_log_size )); then
         local delta=$((final_log_size - last_log_size))
         tail -c "$delta" "$log_file" 2>/dev/null \
-            | awk -v proj="$proj" '
+            | awk '
                 /^>>> phase: / {
                     sub(/^>>> phase: /, "")
-                    printf "[progress %s] phase=agent-step %s\n", proj, $0
+                    print
                     fflush()
                 }
-            ' || true
+            ' \
+            | while IFS= read -r step; do progress "$proj" "phase=agent-step $step"; done || true
     fi
     SUPERVISE_ELAPSED=$elapsed
     progress "$proj" "phase=${label}-exit code=$SUPERVISE_AGENT_CODE elapsed=${elapsed}s"
     SUPERVISE_AGENT_LIMIT=$(detect_agent_limit "$log_file")
-    [[ -n "$SUPERVISE_AGENT_LIMIT" ]] && echo "AGENT LIMIT: $proj (${STYLE_AGENT} $SUPERVISE_AGENT_LIMIT)"
+    report_agent_limit "$proj"
     return 0
 }
 
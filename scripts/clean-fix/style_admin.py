@@ -9,7 +9,7 @@ import re
 from pathlib import Path
 from typing import Any
 
-from style_history import HISTORY_DIR, NATE_STYLE_DIR
+from style_history import HISTORY_DIR, NATE_STYLE_DIR, invalidate_review_index
 
 RUST_STYLE_DIR = NATE_STYLE_DIR / "rust"
 
@@ -113,6 +113,7 @@ def load_jsonl(path: Path) -> list[dict[str, Any]]:
 
 
 def write_jsonl(path: Path, rows: list[dict[str, Any]]) -> None:
+    invalidate_review_index(path.stem)
     if not rows:
         path.unlink(missing_ok=True)
         return
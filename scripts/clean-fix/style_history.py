@@ -10,7 +10,9 @@ import os
 import re
 import subprocess
 import sys
+import time
 from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime
 from datetime import timedelta
@@ -20,18 +22,39 @@ from typing import NamedTuple
 from typing import TypedDict
 from typing import cast
 
-from candidate_generators import CandidatesSpec, Enumeration, enumerate_candidates, read_candidates_spec  # pyright: ignore[reportImplicitRelativeImport]  # run standalone, not as a package — relative import would break it
+from candidate_generators import (  # pyright: ignore[reportImplicitRelativeImport]  # run standalone, not as a package — relative import would break it
+    Candidate,
+    CandidatesSpec,
+    Enumeration,
+    enumerate_candidates,
+    enumerate_many,
+    enumeration_key,
+    inputs_fingerprint,
+    read_candidates_spec,
+)
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "rust_style"))
+from style_files import resolve as resolve_style_files  # pyright: ignore[reportImplicitRelativeImport]  # sibling scripts dir, same standalone constraint
 
 RUST_DIR = Path(os.environ.get("STYLE_HISTORY_RUST_DIR", str(Path.home() / "rust")))
 NATE_STYLE_DIR = Path(os.environ.get("STYLE_HISTORY_NATE_STYLE_DIR", str(RUST_DIR / "nate_style")))
 HISTORY_DIR = NATE_STYLE_DIR / ".history"
 PENDING_DIR = HISTORY_DIR / ".pending"
-LOAD_STYLE_SCRIPT = Path(
-    os.environ.get(
-        "STYLE_HISTORY_LOAD_STYLE_SCRIPT",
-        str(Path.home() / ".claude" / "scripts" / "rust_style" / "load-rust-style.sh"),
-    )
-)
+# Unset: style files are resolved in-process by `rust_style/style_files.py`.
+# Set: `list_style_files` shells out to this loader's `--list-files` instead.
+LOAD_STYLE_SCRIPT = os.environ.get("STYLE_HISTORY_LOAD_STYLE_SCRIPT")
+# Per-history-file guideline review/finding counts behind
+# `cross_project_hit_rates`; dot-named so `*.jsonl` globs never see it.
+HIT_RATE_INDEX = HISTORY_DIR / ".hit-rate-index.json"
+HIT_RATE_INDEX_VERSION = 1
+# Per-project sidecars summarising each guideline's review history, checked
+# against the JSONL byte length they were built from.
+REVIEW_INDEX_DIR = HISTORY_DIR / ".review-index"
+REVIEW_INDEX_VERSION = 2
+# Style-file content hashes (by path, mtime_ns, size) and per-project tracked
+# diff digests (by working-tree signature) behind `project_fingerprint`.
+FINGERPRINT_CACHE = HISTORY_DIR / ".fingerprint-cache.json"
+FINGERPRINT_CACHE_VERSION = 1
 CLEAN_FIX_CONF_FILE = Path(
     os.environ.get(
         "STYLE_HISTORY_CONF_FILE",
@@ -55,6 +78,11 @@ EXIT_INCOMPLETE_RUN = 3
 # enumerated zero sites. Free for quota purposes and excluded from hit rates.
 FREE_SKIP_SOURCES = frozenset({"pre_filter", "candidates"})
 
+# Concurrent `rg` probes when gating a batch of pre_filters. rg parallelises
+# its own directory walk, so a handful is enough to overlap process start-up
+# and the per-pattern tree scans without oversubscribing the machine.
+PRE_FILTER_WORKERS = 8
+
 
 class Outcome(TypedDict, total=False):
     status: str
@@ -70,9 +98,16 @@ class ReviewedUnit(TypedDict, total=False):
     finding_source: str
 
 
+class StoredEnumeration(TypedDict):
+    key: str  # candidate_generators.enumeration_key at next-unit time
+    source: str
+    candidates: list[list[str | int]]  # [file, line, text]
+
+
 class PendingState(TypedDict, total=False):
     budget: int
     checked_unit_count: int
+    enumerations: dict[str, StoredEnumeration]  # unit_id -> list handed out by next-unit
     evaluation_markdown: str
     evaluation_complete: bool
     evaluation_summary: dict[str, object]
@@ -124,6 +159,38 @@ class HistoryRow(TypedDict, total=False):
     fingerprint: str
 
 
+class GuidelineReview(TypedDict):
+    end_time: str
+    fingerprint: str
+    review_count: int
+    latest_outcome: Outcome
+
+
+class HitCounts(TypedDict):
+    reviews: int
+    findings: int
+    updated_at: str
+
+
+class HitRateFileEntry(TypedDict):
+    size: int
+    mtime_ns: int
+    guidelines: dict[str, HitCounts]
+
+
+class FingerprintCache(TypedDict):
+    style_files: dict[str, list[int | str]]  # path -> [mtime_ns, size, sha256]
+    diffs: dict[str, list[str]]  # project root -> [working-tree signature, diff sha256]
+
+
+@dataclass(frozen=True)
+class Fingerprint:
+    digest: str
+    diff: str  # "clean" (no tracked changes), "cached" or "computed"
+    git_ms: float
+    style_ms: float
+
+
 @dataclass(frozen=True)
 class Unit:
     unit_id: str
@@ -168,9 +235,12 @@ def _extract_wikilink(raw: str) -> str:
 
 
 def parse_frontmatter(path: Path) -> dict[str, list[str]]:
+    return _parse_frontmatter_lines(path.read_text().splitlines())
+
+
+def _parse_frontmatter_lines(lines: list[str]) -> dict[str, list[str]]:
     tags: list[str] = []
     see_also: list[str] = []
-    lines = path.read_text().splitlines()
     if not lines or lines[0].strip() != "---":
         return {"tags": tags, "see_also": see_also}
     current_key = ""
@@ -211,7 +281,11 @@ def parse_frontmatter(path: Path) -> dict[str, list[str]]:
 
 
 def extract_title(path: Path) -> str:
-    for line in path.read_text().splitlines():
+    return _title_from_lines(path.read_text().splitlines(), path)
+
+
+def _title_from_lines(lines: list[str], path: Path) -> str:
+    for line in lines:
         if line.startswith("#"):
             return line.lstrip("#").strip()
     return path.name
@@ -223,7 +297,10 @@ def read_pre_filter(path: Path) -> str:
     Returns the regex string, or empty string when absent. Strips surrounding
     quotes (single or double) so the value can be passed directly to ripgrep.
     """
-    lines = path.read_text().splitlines()
+    return _pre_filter_from_lines(path.read_text().splitlines())
+
+
+def _pre_filter_from_lines(lines: list[str]) -> str:
     if not lines or lines[0].strip() != "---":
         return ""
     for line in lines[1:]:
@@ -256,30 +333,62 @@ def pre_filter_has_candidates(pattern: str, project_root: Path) -> bool:
     return result.returncode == 0
 
 
+def pre_filter_candidates(patterns: list[str], project_root: Path) -> dict[str, bool]:
+    """`pre_filter_has_candidates` for many patterns at once, keyed by pattern.
+
+    One rg per distinct pattern, run concurrently. A single rg with several
+    `-e` flags would walk the tree once but cannot say which pattern matched,
+    and re-matching its output in Python would judge rg (Rust regex) syntax
+    with `re`; separate probes keep each verdict exactly what it was.
+    """
+    distinct = list(dict.fromkeys(pattern for pattern in patterns if pattern))
+    if not distinct:
+        return {}
+
+    def probe(pattern: str) -> bool:
+        return pre_filter_has_candidates(pattern, project_root)
+
+    with ThreadPoolExecutor(max_workers=min(PRE_FILTER_WORKERS, len(distinct))) as pool:
+        verdicts = list(pool.map(probe, distinct))
+    return dict(zip(distinct, verdicts))
+
+
 def auto_record_pre_filter_skip(project: str, unit: "Unit", skipped_by: str = "pre_filter") -> None:
     """Record `no_findings` for a unit the helper disposed without an LLM call.
 
     `skipped_by` is `pre_filter` (skip-gate regex found zero matches) or
     `candidates` (the unit's candidate generator enumerated zero sites).
     """
+    auto_record_free_skips(project, [(unit, skipped_by)])
+
+
+def auto_record_free_skips(project: str, skips: list[tuple["Unit", str]]) -> None:
+    """`auto_record_pre_filter_skip` for a batch of units, in one pending write."""
+    if not skips:
+        return
     pending = load_pending(project)
     if not pending:
         return
     reviewed_units: list[ReviewedUnit] = list(pending.get("reviewed_units", []))
     reviewed_unit_ids: list[str] = list(pending.get("reviewed_unit_ids", []))
-    if unit.unit_id in reviewed_unit_ids:
+    recorded = False
+    for unit, skipped_by in skips:
+        if unit.unit_id in reviewed_unit_ids:
+            continue
+        for guideline_id in unit.guideline_ids:
+            reviewed_units.append(
+                {
+                    "guideline_id": guideline_id,
+                    "outcome": {"status": "no_findings", "skipped_by": skipped_by},
+                }
+            )
+        reviewed_unit_ids.append(unit.unit_id)
+        pending["last_unit_id"] = unit.unit_id
+        recorded = True
+    if not recorded:
         return
-    for guideline_id in unit.guideline_ids:
-        reviewed_units.append(
-            {
-                "guideline_id": guideline_id,
-                "outcome": {"status": "no_findings", "skipped_by": skipped_by},
-            }
-        )
-    reviewed_unit_ids.append(unit.unit_id)
     pending["reviewed_units"] = reviewed_units
     pending["reviewed_unit_ids"] = reviewed_unit_ids
-    pending["last_unit_id"] = unit.unit_id
     pending["last_unit_result"] = "no_findings"
     pending["updated_at"] = utc_now()
     _ = refresh_evaluation_summary(pending)
@@ -504,16 +613,44 @@ def eligible_project_roots() -> list[Path]:
 
 def append_jsonl_history(path: Path, payload: HistoryRow) -> None:
     path.parent.mkdir(parents=True, exist_ok=True)
+    line = json.dumps(payload, sort_keys=True) + "\n"
+    before = _stat_or_none(path)
     with path.open("a") as handle:
-        _ = handle.write(json.dumps(payload, sort_keys=True) + "\n")
+        _ = handle.write(line)
+    if path.parent == HISTORY_DIR and path.suffix == ".jsonl":
+        appended_bytes = len(line.encode())
+        _advance_hit_rate_index(path, before, appended_bytes, payload)
+        _advance_review_index(path.stem, before, appended_bytes, payload)
+
+
+def _stat_or_none(path: Path) -> os.stat_result | None:
+    try:
+        return path.stat()
+    except OSError:
+        return None
+
+
+def _write_json_atomic(path: Path, payload: object) -> None:
+    """Replace `path` whole so a concurrent reader never sees a partial file."""
+    tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        _ = tmp.write_text(json.dumps(payload, sort_keys=True) + "\n")
+        _ = tmp.replace(path)
+    except OSError:
+        tmp.unlink(missing_ok=True)
 
 
 def load_history(project: str) -> list[HistoryRow]:
     path = history_file(project)
     if not path.exists():
         return []
+    return _parse_history_text(path.read_text())
+
+
+def _parse_history_text(text: str) -> list[HistoryRow]:
     rows: list[HistoryRow] = []
-    for raw_line in path.read_text().splitlines():
+    for raw_line in text.splitlines():
         line = raw_line.strip()
         if not line:
             continue
@@ -527,18 +664,66 @@ def load_history(project: str) -> list[HistoryRow]:
 
 
 def list_style_files(project_root: Path) -> list[Path]:
-    result = subprocess.run(
-        ["zsh", str(LOAD_STYLE_SCRIPT), "--list-files", "--project-root", str(project_root)],
-        check=True,
-        capture_output=True,
-        text=True,
-    )
-    return [Path(line.strip()) for line in result.stdout.splitlines() if line.strip()]
+    """The loader's `--list-files` order, resolved in-process (memoized per root)
+    unless `STYLE_HISTORY_LOAD_STYLE_SCRIPT` names a loader to run instead."""
+    if LOAD_STYLE_SCRIPT:
+        result = subprocess.run(
+            ["zsh", LOAD_STYLE_SCRIPT, "--list-files", "--project-root", str(project_root)],
+            check=True,
+            capture_output=True,
+            text=True,
+        )
+        return [Path(line.strip()) for line in result.stdout.splitlines() if line.strip()]
+    return list(resolve_style_files(project_root).files)
+
+
+@dataclass(frozen=True)
+class UnitCatalog:
+    """The style corpus as seen from one project: listed and parsed once.
+
+    A single `next-unit` call needs the unit list, the totals and the
+    non-negotiable ids, each of which used to re-run `--list-files` and re-read
+    every guideline. The corpus does not change under one helper invocation, so
+    `unit_catalog` builds this once per project root per process.
+    """
+
+    style_files: tuple[Path, ...]
+    units: tuple[Unit, ...]
+
+    def totals(self) -> dict[str, int]:
+        reviewable = sum(1 for unit in self.units if unit.budget_cost > 0)
+        return {
+            "guideline_total": len(self.units),
+            "reviewable_unit_total": reviewable,
+            "non_negotiable_unit_total": len(self.units) - reviewable,
+        }
+
+    def non_negotiable_guideline_ids(self) -> list[str]:
+        return [
+            guideline_id
+            for unit in self.units
+            if unit.budget_cost == 0
+            for guideline_id in unit.guideline_ids
+        ]
+
+
+_unit_catalogs: dict[Path, UnitCatalog] = {}
+
+
+def unit_catalog(project_root: Path) -> UnitCatalog:
+    catalog = _unit_catalogs.get(project_root)
+    if catalog is None:
+        style_files = list_style_files(project_root)
+        catalog = UnitCatalog(
+            style_files=tuple(style_files),
+            units=tuple(_build_units_from_files(style_files, project_root, style_files)),
+        )
+        _unit_catalogs[project_root] = catalog
+    return catalog
 
 
 def build_units(project_root: Path) -> list[Unit]:
-    all_files = list_style_files(project_root)
-    return _build_units_from_files(all_files, project_root, all_files)
+    return list(unit_catalog(project_root).units)
 
 
 def _build_units_from_files(
@@ -556,7 +741,8 @@ def _build_units_from_files(
     }
     units: list[Unit] = []
     for index, style_file in enumerate(style_files, start=1):
-        frontmatter = parse_frontmatter(style_file)
+        lines = style_file.read_text().splitlines()
+        frontmatter = _parse_frontmatter_lines(lines)
         tags = set(frontmatter["tags"])
         see_also_stems = list(frontmatter["see_also"])
         guideline_id = normalize_guideline_id(str(style_file), project_root)
@@ -570,10 +756,10 @@ def _build_units_from_files(
                 unit_id=guideline_id,
                 budget_cost=0 if "non-negotiable" in tags else 1,
                 checklist_index=index,
-                display_name=extract_title(style_file),
+                display_name=_title_from_lines(lines, style_file),
                 guideline_ids=(guideline_id,),
                 see_also_guideline_ids=tuple(see_also_ids),
-                pre_filter=read_pre_filter(style_file),
+                pre_filter=_pre_filter_from_lines(lines),
             )
         )
     return units
@@ -589,7 +775,7 @@ def resolve_focus_targets(requested: list[str], project_root: Path) -> list[Path
       - absolute paths
     Raises SystemExit with the first unresolvable entry so the caller can fix input.
     """
-    style_files = list_style_files(project_root)
+    style_files = unit_catalog(project_root).style_files
     by_stem: dict[str, Path] = {p.stem: p for p in style_files}
     by_name: dict[str, Path] = {p.name: p for p in style_files}
     by_guideline_id: dict[str, Path] = {
@@ -627,18 +813,12 @@ def resolve_focus_targets(requested: list[str], project_root: Path) -> list[Path
 def focused_units(project_root: Path, requested: list[str]) -> list[Unit]:
     """Build units for an explicit subset of guidelines — read-only, no state writes."""
     targets = resolve_focus_targets(requested, project_root)
-    all_files = list_style_files(project_root)
+    all_files = list(unit_catalog(project_root).style_files)
     return _build_units_from_files(targets, project_root, all_files)
 
 
 def unit_totals(project_root: Path) -> dict[str, int]:
-    units = build_units(project_root)
-    reviewable = [unit for unit in units if unit.budget_cost > 0]
-    return {
-        "guideline_total": len(units),
-        "reviewable_unit_total": len(reviewable),
-        "non_negotiable_unit_total": len(units) - len(reviewable),
-    }
+    return unit_catalog(project_root).totals()
 
 
 def refresh_evaluation_summary(
@@ -690,14 +870,124 @@ def history_summary(pending: PendingState) -> dict[str, object]:
 
 
 def review_counts(project_root: Path) -> dict[str, int]:
-    project = project_key(project_root)
-    counts: dict[str, int] = defaultdict(int)
-    for row in load_history(project):
-        for reviewed in row.get("reviewed_units", []):
-            guideline_id = reviewed.get("guideline_id")
-            if isinstance(guideline_id, str):
-                counts[guideline_id] += 1
-    return counts
+    return guideline_review_counts(project_key(project_root))
+
+
+def guideline_review_counts(project: str) -> dict[str, int]:
+    return {guideline_id: review["review_count"] for guideline_id, review in review_index(project).items()}
+
+
+def review_index_file(project: str) -> Path:
+    return REVIEW_INDEX_DIR / f"{project}.json"
+
+
+def review_index(project: str) -> dict[str, GuidelineReview]:
+    """Per-guideline review summary for `project`, from its sidecar.
+
+    The sidecar records the history file's size and mtime_ns it was built
+    from, the same key `HIT_RATE_INDEX` uses. `append_jsonl_history` advances
+    it with each row; when the stat disagrees (first use, a writer that
+    bypassed the helper) the history is re-read once and the sidecar
+    replaced. `style_admin` rewrites drop the sidecar outright via
+    `invalidate_review_index`, so a same-length rewrite is never trusted.
+    """
+    path = history_file(project)
+    stat = _stat_or_none(path)
+    if stat is None:
+        return {}
+    cached = _load_review_index(project)
+    if cached is not None and cached[0] == (stat.st_size, stat.st_mtime_ns):
+        return cached[1]
+    try:
+        data = path.read_bytes()
+    except OSError:
+        return {}
+    guidelines: dict[str, GuidelineReview] = {}
+    for row in _parse_history_text(data.decode()):
+        _fold_review(guidelines, row)
+    # Record the stat only if the file is still the one just read; otherwise
+    # leave the sidecar stale so the next reader rebuilds from the new bytes.
+    after = _stat_or_none(path)
+    if after is not None and after.st_size == len(data) and after.st_mtime_ns == stat.st_mtime_ns:
+        _write_review_index(project, (after.st_size, after.st_mtime_ns), guidelines)
+    return guidelines
+
+
+def invalidate_review_index(project: str) -> None:
+    """Drop `project`'s review sidecar after its history was rewritten in place."""
+    review_index_file(project).unlink(missing_ok=True)
+
+
+def _fold_review(guidelines: dict[str, GuidelineReview], row: HistoryRow) -> None:
+    end_time = row.get("end_time", "")
+    fingerprint = row.get("fingerprint", "")
+    for reviewed in row.get("reviewed_units", []):
+        guideline_id = reviewed.get("guideline_id")
+        if not isinstance(guideline_id, str):
+            continue
+        previous = guidelines.get(guideline_id)
+        guidelines[guideline_id] = {
+            "end_time": end_time,
+            "fingerprint": fingerprint,
+            "review_count": (previous["review_count"] if previous else 0) + 1,
+            "latest_outcome": reviewed.get("outcome", {}),
+        }
+
+
+def _load_review_index(project: str) -> tuple[tuple[int, int], dict[str, GuidelineReview]] | None:
+    try:
+        raw: object = json.loads(review_index_file(project).read_text())  # pyright: ignore[reportAny]
+    except (OSError, ValueError):
+        return None
+    if not isinstance(raw, dict):
+        return None
+    payload = cast("dict[str, object]", raw)
+    size = payload.get("size")
+    mtime_ns = payload.get("mtime_ns")
+    guidelines = payload.get("guidelines")
+    if (
+        payload.get("version") != REVIEW_INDEX_VERSION
+        or not isinstance(size, int)
+        or not isinstance(mtime_ns, int)
+        or not isinstance(guidelines, dict)
+    ):
+        return None
+    return (size, mtime_ns), cast("dict[str, GuidelineReview]", guidelines)
+
+
+def _write_review_index(project: str, stamp: tuple[int, int], guidelines: dict[str, GuidelineReview]) -> None:
+    _write_json_atomic(
+        review_index_file(project),
+        {"version": REVIEW_INDEX_VERSION, "size": stamp[0], "mtime_ns": stamp[1], "guidelines": guidelines},
+    )
+
+
+def _advance_review_index(
+    project: str,
+    before: os.stat_result | None,
+    appended_bytes: int,
+    row: HistoryRow,
+) -> None:
+    """Fold a freshly appended row into the project's sidecar.
+
+    Same contract as `_advance_hit_rate_index`: only a sidecar that matched
+    the file's size and mtime right before the append moves forward;
+    otherwise it stays stale and `review_index` rebuilds it on next read.
+    """
+    if before is None:
+        cached: tuple[tuple[int, int], dict[str, GuidelineReview]] | None = ((0, 0), {})
+        before_size = 0
+    else:
+        cached = _load_review_index(project)
+        before_size = before.st_size
+        if cached is None or cached[0] != (before.st_size, before.st_mtime_ns):
+            return
+    after = _stat_or_none(history_file(project))
+    if after is None or after.st_size != before_size + appended_bytes:
+        return
+    guidelines = cached[1]
+    _fold_review(guidelines, row)
+    _write_review_index(project, (after.st_size, after.st_mtime_ns), guidelines)
 
 
 def cross_project_hit_rates() -> dict[str, float]:
@@ -710,37 +1000,38 @@ def cross_project_hit_rates() -> dict[str, float]:
 
     Pre-filter skips (`outcome.skipped_by == "pre_filter"`) are excluded from
     both numerator and denominator — they aren't real LLM reviews.
+
+    Counts come from `HIT_RATE_INDEX`, which `append_jsonl_history` advances
+    row by row. A history file whose size or mtime no longer matches its index
+    entry (first run, rename, prune, a concurrent writer) is re-read in full
+    once and its entry replaced, so the cost per call is a stat per project
+    plus a sum over guidelines rather than a parse of all history.
     """
-    reviews: dict[str, int] = defaultdict(int)
-    findings: dict[str, int] = defaultdict(int)
     if not HISTORY_DIR.exists():
         return {}
+    cached = _load_hit_rate_index()
+    entries: dict[str, HitRateFileEntry] = {}
+    changed = False
     for jsonl_path in HISTORY_DIR.glob("*.jsonl"):
-        try:
-            text = jsonl_path.read_text()
-        except OSError:
+        stat = _stat_or_none(jsonl_path)
+        if stat is None:
             continue
-        for raw_line in text.splitlines():
-            line = raw_line.strip()
-            if not line:
-                continue
-            try:
-                parsed: object = json.loads(line)  # pyright: ignore[reportAny]
-            except json.JSONDecodeError:
+        entry = cached.get(jsonl_path.name)
+        if entry is None or entry["size"] != stat.st_size or entry["mtime_ns"] != stat.st_mtime_ns:
+            entry = _scan_hit_counts(jsonl_path, stat)
+            if entry is None:
                 continue
-            if not isinstance(parsed, dict):
-                continue
-            row = cast(HistoryRow, cast(object, parsed))
-            for reviewed in row.get("reviewed_units", []):
-                guideline_id = reviewed.get("guideline_id")
-                if not isinstance(guideline_id, str):
-                    continue
-                outcome: Outcome = reviewed.get("outcome", {})
-                if outcome.get("skipped_by") in FREE_SKIP_SOURCES:
-                    continue
-                reviews[guideline_id] += 1
-                if reviewed.get("finding_source") or outcome.get("status") not in (None, "no_findings"):
-                    findings[guideline_id] += 1
+            changed = True
+        entries[jsonl_path.name] = entry
+    if changed or entries.keys() != cached.keys():
+        _write_hit_rate_index(entries)
+
+    reviews: dict[str, int] = defaultdict(int)
+    findings: dict[str, int] = defaultdict(int)
+    for entry in entries.values():
+        for guideline_id, counts in entry["guidelines"].items():
+            reviews[guideline_id] += counts["reviews"]
+            findings[guideline_id] += counts["findings"]
     return {
         guideline_id: findings.get(guideline_id, 0) / count
         for guideline_id, count in reviews.items()
@@ -748,6 +1039,94 @@ def cross_project_hit_rates() -> dict[str, float]:
     }
 
 
+def _fold_hit_counts(guidelines: dict[str, HitCounts], row: HistoryRow) -> None:
+    updated_at = row.get("end_time", "")
+    for reviewed in row.get("reviewed_units", []):
+        guideline_id = reviewed.get("guideline_id")
+        if not isinstance(guideline_id, str):
+            continue
+        outcome: Outcome = reviewed.get("outcome", {})
+        if outcome.get("skipped_by") in FREE_SKIP_SOURCES:
+            continue
+        counts = guidelines.setdefault(guideline_id, {"reviews": 0, "findings": 0, "updated_at": ""})
+        counts["reviews"] += 1
+        if reviewed.get("finding_source") or outcome.get("status") not in (None, "no_findings"):
+            counts["findings"] += 1
+        counts["updated_at"] = max(counts["updated_at"], updated_at)
+
+
+def _scan_hit_counts(path: Path, stat: os.stat_result) -> HitRateFileEntry | None:
+    try:
+        text = path.read_text()
+    except OSError:
+        return None
+    guidelines: dict[str, HitCounts] = {}
+    for raw_line in text.splitlines():
+        line = raw_line.strip()
+        if not line:
+            continue
+        try:
+            parsed: object = json.loads(line)  # pyright: ignore[reportAny]
+        except json.JSONDecodeError:
+            continue
+        if isinstance(parsed, dict):
+            _fold_hit_counts(guidelines, cast(HistoryRow, cast(object, parsed)))
+    return {"size": stat.st_size, "mtime_ns": stat.st_mtime_ns, "guidelines": guidelines}
+
+
+def _load_hit_rate_index() -> dict[str, HitRateFileEntry]:
+    try:
+        raw: object = json.loads(HIT_RATE_INDEX.read_text())  # pyright: ignore[reportAny]
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(raw, dict):
+        return {}
+    payload = cast("dict[str, object]", raw)
+    files = payload.get("files")
+    if payload.get("version") != HIT_RATE_INDEX_VERSION or not isinstance(files, dict):
+        return {}
+    return {
+        name: cast(HitRateFileEntry, cast(object, entry))
+        for name, entry in cast("dict[str, object]", files).items()
+        if isinstance(entry, dict)
+        and isinstance(entry.get("size"), int)
+        and isinstance(entry.get("mtime_ns"), int)
+        and isinstance(entry.get("guidelines"), dict)
+    }
+
+
+def _write_hit_rate_index(entries: dict[str, HitRateFileEntry]) -> None:
+    _write_json_atomic(HIT_RATE_INDEX, {"version": HIT_RATE_INDEX_VERSION, "files": entries})
+
+
+def _advance_hit_rate_index(
+    path: Path,
+    before: os.stat_result | None,
+    appended_bytes: int,
+    row: HistoryRow,
+) -> None:
+    """Fold one freshly appended row into its file's index entry.
+
+    Only an entry that described the file exactly as it was before the append
+    is advanced; anything else is left stale for `cross_project_hit_rates` to
+    rebuild, which is also what happens if another writer appended in between.
+    """
+    entries = _load_hit_rate_index()
+    entry = entries.get(path.name)
+    if before is None:
+        entry = HitRateFileEntry(size=0, mtime_ns=0, guidelines={})
+    elif entry is None or entry["size"] != before.st_size or entry["mtime_ns"] != before.st_mtime_ns:
+        return
+    after = _stat_or_none(path)
+    if after is None or after.st_size != entry["size"] + appended_bytes:
+        return
+    _fold_hit_counts(entry["guidelines"], row)
+    entry["size"] = after.st_size
+    entry["mtime_ns"] = after.st_mtime_ns
+    entries[path.name] = entry
+    _write_hit_rate_index(entries)
+
+
 def project_fingerprint(project_root: Path) -> str:
     """Hash of the code state a review verdict applies to.
 
@@ -757,22 +1136,134 @@ def project_fingerprint(project_root: Path) -> str:
     — only its path via `git status` — acceptable for a TTL gate that errs
     toward re-reviewing.
     """
+    return fingerprint_project(project_root).digest
+
+
+def fingerprint_project(project_root: Path) -> Fingerprint:
+    """`project_fingerprint` with the cost of each half, for the launch gate.
+
+    One `git status --porcelain=v2 --branch` supplies HEAD and the status
+    listing; of its `# branch.*` headers only the HEAD oid is hashed, so a
+    fetch that moves the upstream leaves the fingerprint alone. A tree with no
+    tracked changes has an empty diff, so `git diff HEAD` only runs when
+    tracked entries exist — and not even then when the changed paths' stats
+    and status match the last diff hashed for this root.
+    Style files are hashed by content digest, cached by (mtime_ns, size).
+    """
+    cache = _load_fingerprint_cache()
+    dirty = False
     hasher = hashlib.sha256()
-    for git_args in (("rev-parse", "HEAD"), ("status", "--porcelain"), ("diff", "HEAD")):
-        result = subprocess.run(
-            ["git", "-C", str(project_root), *git_args],
-            capture_output=True,
-            text=True,
-            check=False,
-        )
-        hasher.update(result.stdout.encode())
-    for style_file in list_style_files(project_root):
+
+    started = time.perf_counter()
+    status = subprocess.run(
+        ["git", "-C", str(project_root), "status", "--porcelain=v2", "--branch", "--no-ahead-behind", "-z"],
+        capture_output=True,
+        text=True,
+        check=False,
+    ).stdout
+    hasher.update(_hashed_status(status).encode())
+    changed = _tracked_changes(status)
+    diff_state = "clean"
+    if changed:
+        # Each entry carries its HEAD and index blob ids, so the entries plus
+        # the worktree stats of their paths pin down what `git diff HEAD` says.
+        signature = hashlib.sha256()
+        for entry, paths in changed:
+            signature.update(entry.encode())
+            for rel in paths:
+                stat = _stat_or_none(project_root / rel)
+                signature.update(f"\0{stat.st_mtime_ns if stat else '-'}\0{stat.st_size if stat else '-'}".encode())
+            signature.update(b"\n")
+        diffs = cache["diffs"]
+        remembered = diffs.get(str(project_root))
+        if remembered is not None and remembered[0] == signature.hexdigest():
+            diff_digest = remembered[1]
+            diff_state = "cached"
+        else:
+            diff = subprocess.run(
+                ["git", "-C", str(project_root), "diff", "HEAD"],
+                capture_output=True,
+                check=False,
+            ).stdout
+            diff_digest = hashlib.sha256(diff).hexdigest()
+            diffs[str(project_root)] = [signature.hexdigest(), diff_digest]
+            diff_state = "computed"
+            dirty = True
+        hasher.update(diff_digest.encode())
+    git_ms = (time.perf_counter() - started) * 1000
+
+    started = time.perf_counter()
+    hashes = cache["style_files"]
+    for style_file in unit_catalog(project_root).style_files:
         hasher.update(str(style_file).encode())
+        stat = _stat_or_none(style_file)
+        if stat is None:
+            continue
+        key = str(style_file)
+        remembered_file = hashes.get(key)
+        if remembered_file is not None and remembered_file[:2] == [stat.st_mtime_ns, stat.st_size]:
+            hasher.update(str(remembered_file[2]).encode())
+            continue
         try:
-            hasher.update(style_file.read_bytes())
+            content_digest = hashlib.sha256(style_file.read_bytes()).hexdigest()
         except OSError:
             continue
-    return hasher.hexdigest()
+        hashes[key] = [stat.st_mtime_ns, stat.st_size, content_digest]
+        dirty = True
+        hasher.update(content_digest.encode())
+    style_ms = (time.perf_counter() - started) * 1000
+
+    if dirty:
+        _write_json_atomic(FINGERPRINT_CACHE, {"version": FINGERPRINT_CACHE_VERSION, **cache})
+    return Fingerprint(digest=hasher.hexdigest(), diff=diff_state, git_ms=git_ms, style_ms=style_ms)
+
+
+def _hashed_status(status: str) -> str:
+    """`git status --porcelain=v2 --branch -z` output minus every header but `branch.oid`.
+
+    The branch name, upstream and ahead/behind counts say nothing about the
+    code under review.
+    """
+    return "\0".join(
+        record for record in status.split("\0") if not record.startswith("# ") or record.startswith("# branch.oid ")
+    )
+
+
+def _tracked_changes(status: str) -> list[tuple[str, list[str]]]:
+    """Tracked entries in `git status --porcelain=v2 -z` output, with their paths.
+
+    Ordinary (`1`), renamed/copied (`2`, followed by its source path) and
+    unmerged (`u`) entries count; untracked, ignored and header lines do not.
+    """
+    entries: list[tuple[str, list[str]]] = []
+    fields = iter(status.split("\0"))
+    for field in fields:
+        if field.startswith("1 "):
+            entries.append((field, [field.split(" ", 8)[8]]))
+        elif field.startswith("2 "):
+            entries.append((field, [field.split(" ", 9)[9], next(fields, "")]))
+        elif field.startswith("u "):
+            entries.append((field, [field.split(" ", 10)[10]]))
+    return entries
+
+
+def _load_fingerprint_cache() -> FingerprintCache:
+    empty: FingerprintCache = {"style_files": {}, "diffs": {}}
+    try:
+        raw: object = json.loads(FINGERPRINT_CACHE.read_text())  # pyright: ignore[reportAny]
+    except (OSError, ValueError):
+        return empty
+    if not isinstance(raw, dict):
+        return empty
+    payload = cast("dict[str, object]", raw)
+    style_files = payload.get("style_files")
+    diffs = payload.get("diffs")
+    if payload.get("version") != FINGERPRINT_CACHE_VERSION or not isinstance(style_files, dict) or not isinstance(diffs, dict):
+        return empty
+    return {
+        "style_files": cast("dict[str, list[int | str]]", style_files),
+        "diffs": cast("dict[str, list[str]]", diffs),
+    }
 
 
 def parse_utc_timestamp(value: str) -> datetime | None:
@@ -795,14 +1286,10 @@ def last_review_index(project: str) -> dict[str, LastReview]:
     audit only; `unit_is_due` keys off `end_time` alone (TTL re-arms each unit
     on time, regardless of fingerprint). `end_time` is what matters here.
     """
-    index: dict[str, LastReview] = {}
-    for row in load_history(project):
-        entry = LastReview(row.get("end_time", ""), row.get("fingerprint", ""))
-        for reviewed in row.get("reviewed_units", []):
-            guideline_id = reviewed.get("guideline_id")
-            if isinstance(guideline_id, str):
-                index[guideline_id] = entry
-    return index
+    return {
+        guideline_id: LastReview(review["end_time"], review["fingerprint"])
+        for guideline_id, review in review_index(project).items()
+    }
 
 
 def unit_is_due(
@@ -870,15 +1357,17 @@ def unit_next_due_epoch(
     return soonest
 
 
-def due_units_payload(project_root: Path) -> dict[str, object]:
+def due_units_payload(project_root: Path, *, with_fingerprint: bool = True) -> dict[str, object]:
     """Read-only report of which reviewable units are due right now.
 
     `due_unit_count == 0` is the launch gate: the clean-fix skips spawning an
-    eval agent for the project entirely.
+    eval agent for the project entirely. `timing` breaks down what the
+    report cost: the due-unit scan and, when fingerprinted, each half of
+    `fingerprint_project` and how its diff was obtained.
     """
+    started = time.perf_counter()
     project = project_key(project_root)
     reviewable = [unit for unit in build_units(project_root) if unit.budget_cost > 0]
-    current_fingerprint = project_fingerprint(project_root)
     review_index = last_review_index(project)
     now = datetime.now(tz=timezone.utc)
     ttl = timedelta(days=eval_ttl_days())
@@ -898,23 +1387,32 @@ def due_units_payload(project_root: Path) -> dict[str, object]:
         if epoch is not None
     ]
     next_due_epoch = int(min(pending_epochs)) if pending_epochs else 0
-    return {
+    payload: dict[str, object] = {
         "due_unit_count": len(due_ids),
         "due_unit_ids": due_ids,
-        "fingerprint": current_fingerprint,
         "next_due_epoch": next_due_epoch,
         "reviewable_unit_total": len(reviewable),
         "ttl_days": eval_ttl_days(),
     }
+    due_ms = (time.perf_counter() - started) * 1000
+    # The gate's `--field due_unit_count` never reads the fingerprint, so it is
+    # only computed when asked for.
+    if with_fingerprint:
+        fingerprint = fingerprint_project(project_root)
+        payload["fingerprint"] = fingerprint.digest
+        payload["timing"] = {
+            "due_ms": round(due_ms, 1),
+            "fingerprint_git_ms": round(fingerprint.git_ms, 1),
+            "fingerprint_style_ms": round(fingerprint.style_ms, 1),
+            "fingerprint_diff": fingerprint.diff,
+        }
+    else:
+        payload["timing"] = {"due_ms": round(due_ms, 1)}
+    return payload
 
 
 def non_negotiable_guideline_ids(project_root: Path) -> list[str]:
-    return [
-        guideline_id
-        for unit in build_units(project_root)
-        if unit.budget_cost == 0
-        for guideline_id in unit.guideline_ids
-    ]
+    return unit_catalog(project_root).non_negotiable_guideline_ids()
 
 
 def start_run(project_root: Path) -> None:
@@ -1163,29 +1661,62 @@ def next_unit(project_root: Path) -> dict[str, object]:
         sortable.append((-unit_hit_rate, unit_count, unit.checklist_index, unit.unit_id, unit))
     sortable.sort(key=lambda item: (item[0], item[1], item[2], item[3]))
 
-    # Walk candidates in sort order. For each, run its pre_filter (if any) against
-    # the project tree. If the pattern finds zero matches, the violation cannot be
-    # present — auto-record `no_findings` for the unit and continue to the next
-    # candidate without invoking the LLM. Generator-backed units additionally run
-    # their candidate generator here: zero candidates is the same free skip, and a
+    # Walk candidates in sort order. A unit whose pre_filter finds zero matches
+    # in the project tree cannot be violated — auto-record `no_findings` for it
+    # and continue to the next candidate without invoking the LLM. Every due
+    # unit's pre_filter is probed up front in one concurrent batch rather than
+    # one rg fork per step. Generator-backed units additionally run their
+    # candidate generator: zero candidates is the same free skip, and a
     # non-empty list rides along in the unit payload as the agent's closed list.
-    enumeration: Enumeration | None = None
-    while sortable:
-        enumeration = None
-        _, unit_count, _, _, unit = sortable[0]
-        if unit.pre_filter and not pre_filter_has_candidates(unit.pre_filter, project_root):
-            auto_record_pre_filter_skip(project, unit)
-            _ = sortable.pop(0)
+    # Every due parse-based generator unit is enumerated up front in one pass
+    # over the sources, so empty ones behind the chosen unit are skipped now
+    # too instead of on later calls; a generator failure only aborts the call
+    # if its unit is the one picked. Skips are recorded in a single pending
+    # write.
+    pre_filter_verdicts = pre_filter_candidates([item[4].pre_filter for item in sortable], project_root)
+
+    def pre_filter_empty(unit: Unit) -> bool:
+        return bool(unit.pre_filter) and not pre_filter_verdicts.get(unit.pre_filter, True)
+
+    specs: dict[str, CandidatesSpec] = {}
+    for item in sortable:
+        if pre_filter_empty(item[4]):
             continue
-        spec = unit_candidates_spec(unit.unit_id, project_root)
+        spec = unit_candidates_spec(item[4].unit_id, project_root)
         if spec is not None:
-            enumeration = enumerate_candidates(spec, project_root)
-            if not enumeration.candidates:
-                auto_record_pre_filter_skip(project, unit, skipped_by="candidates")
-                _ = sortable.pop(0)
-                continue
-        break
-    else:
+            specs[item[4].unit_id] = spec
+    # Fingerprinted before enumerating: an edit that lands mid-scan leaves a
+    # stale fingerprint, so record-unit re-enumerates rather than trusting it.
+    inputs = inputs_fingerprint(project_root) if specs else ""
+    enumerations = enumerate_many(list(specs.values()), project_root)
+
+    free_skips: list[tuple[Unit, str]] = []
+    enumeration: Enumeration | None = None
+    chosen: int | None = None
+    for position, item in enumerate(sortable):
+        unit = item[4]
+        if pre_filter_empty(unit):
+            free_skips.append((unit, "pre_filter"))
+            continue
+        spec = specs.get(unit.unit_id)
+        outcome = None if spec is None else enumerations.get(spec)
+        if chosen is None and spec is not None and outcome is None:
+            # Not batched (regex and other unparsed kinds): enumerated one at
+            # a time, and only up to the unit that gets picked.
+            outcome = enumerate_candidates(spec, project_root)
+        if isinstance(outcome, SystemExit):
+            if chosen is None:
+                raise outcome
+            outcome = None
+        unit_enumeration = outcome
+        if unit_enumeration is not None and not unit_enumeration.candidates:
+            free_skips.append((unit, "candidates"))
+            continue
+        if chosen is None:
+            chosen = position
+            enumeration = unit_enumeration
+    if chosen is None:
+        auto_record_free_skips(project, free_skips)
         pending = load_pending(project)
         evaluation_markdown = pending.get("evaluation_markdown", "")
         finding_count = count_findings_in_markdown(evaluation_markdown)
@@ -1203,6 +1734,10 @@ def next_unit(project_root: Path) -> dict[str, object]:
             "stop_reason": "exhausted",
         }
 
+    _, unit_count, _, _, unit = sortable[chosen]
+    auto_record_free_skips(project, free_skips)
+    if enumeration is not None:
+        remember_enumeration(project, unit.unit_id, enumeration_key(specs[unit.unit_id], inputs), enumeration)
     summary = refresh_evaluation_summary(pending, project_root)
     unit_payload: dict[str, object] = {
         "budget_cost": unit.budget_cost,
@@ -1251,12 +1786,13 @@ def record_unit(project_root: Path, results_path: Path, eval_path: Path) -> None
     if unit_id in reviewed_unit_ids:
         raise SystemExit(f"Unit already recorded in this run: {unit_id}")
 
-    # Generator-backed units: re-run the (deterministic, cheap) generator and
-    # refuse the record unless every candidate carries a disposition. An
-    # early-quitting agent cannot silently narrow coverage.
+    # Generator-backed units: refuse the record unless every candidate carries
+    # a disposition. An early-quitting agent cannot silently narrow coverage.
+    # The list is the one next-unit handed out when no input file changed
+    # since; otherwise the (deterministic) generator runs again.
     spec = unit_candidates_spec(unit_id, project_root)
     if spec is not None:
-        verify_dispositions(unit_id, payload, enumerate_candidates(spec, project_root))
+        verify_dispositions(unit_id, payload, recall_enumeration(pending, unit_id, spec, project_root))
 
     evaluation_markdown = (
         eval_path.read_text()
@@ -1307,6 +1843,10 @@ def record_unit(project_root: Path, results_path: Path, eval_path: Path) -> None
     pending["reviewed_units"] = reviewed_units
     reviewed_unit_ids.append(unit_id)
     pending["reviewed_unit_ids"] = reviewed_unit_ids
+    if unit_id in pending.get("enumerations", {}):
+        pending["enumerations"] = {
+            stored_id: stored for stored_id, stored in pending.get("enumerations", {}).items() if stored_id != unit_id
+        }
     pending["evaluation_markdown"] = evaluation_markdown
     pending["evaluation_updated_at"] = utc_now()
     pending["phase"] = "evaluation"
@@ -1519,6 +2059,40 @@ def unit_candidates_spec(guideline_id: str, project_root: Path) -> CandidatesSpe
     return read_candidates_spec(path)
 
 
+def remember_enumeration(project: str, unit_id: str, key: str | None, enumeration: Enumeration) -> None:
+    """Keep the candidate list next-unit handed out for `record_unit` to verify against."""
+    if key is None:
+        return
+    pending = load_pending(project)
+    if not pending:
+        return
+    enumerations = dict(pending.get("enumerations", {}))
+    enumerations[unit_id] = {
+        "key": key,
+        "source": enumeration.source,
+        "candidates": [[candidate.file, candidate.line, candidate.text] for candidate in enumeration.candidates],
+    }
+    pending["enumerations"] = enumerations
+    write_pending(project, pending)
+
+
+def recall_enumeration(pending: PendingState, unit_id: str, spec: CandidatesSpec, project_root: Path) -> Enumeration:
+    """The unit's remembered candidate list if its key still matches, else a fresh enumeration."""
+    stored = pending.get("enumerations", {}).get(unit_id)
+    if stored is not None and stored.get("key") == enumeration_key(spec, inputs_fingerprint(project_root)):
+        try:
+            return Enumeration(
+                candidates=tuple(
+                    Candidate(file=str(file), line=int(line), text=str(text))
+                    for file, line, text in stored["candidates"]
+                ),
+                source=stored["source"],
+            )
+        except (KeyError, TypeError, ValueError):
+            pass
+    return enumerate_candidates(spec, project_root)
+
+
 def verify_dispositions(unit_id: str, payload: ResultPayload, enumeration: Enumeration) -> None:
     """Refuse a generator-backed record whose dispositions don't close the candidate list.
 
@@ -1861,7 +2435,7 @@ def parse_args() -> argparse.Namespace:
     _ = due.add_argument("--project-root", required=True)
     _ = due.add_argument(
         "--field",
-        choices=("due_unit_count", "fingerprint", "next_due_epoch", "reviewable_unit_total", "ttl_days"),
+        choices=("due_unit_count", "fingerprint", "next_due_epoch", "reviewable_unit_total", "timing", "ttl_days"),
     )
     last = subparsers.add_parser(
         "last-findings",
@@ -1970,10 +2544,14 @@ def main() -> None:
         finalize_no_findings(_arg_str(args, "project"))
         return
     if command == "due-units":
-        payload = due_units_payload(Path(_arg_str(args, "project_root")).expanduser().resolve())
         field = getattr(args, "field")  # pyright: ignore[reportAny]
+        payload = due_units_payload(
+            Path(_arg_str(args, "project_root")).expanduser().resolve(),
+            with_fingerprint=not isinstance(field, str) or field in ("fingerprint", "timing"),
+        )
         if isinstance(field, str):
-            print(payload[field])
+            value = payload[field]
+            print(json.dumps(value, sort_keys=True) if isinstance(value, dict) else value)
         else:
             print(json.dumps(payload, indent=2, sort_keys=True))
         return
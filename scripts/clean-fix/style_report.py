@@ -13,7 +13,7 @@ from datetime import timezone
 from typing import TypedDict
 from typing import cast
 
-from style_history import HISTORY_DIR, HistoryRow, Outcome, build_units, list_style_files, normalize_guideline_id, parse_frontmatter, resolve_project_root
+from style_history import HISTORY_DIR, HistoryRow, Outcome, build_units, guideline_review_counts, list_style_files, normalize_guideline_id, parse_frontmatter, resolve_project_root
 
 STATUS_FIELDS = ("fixed", "partial", "skipped", "fix_failed", "no_findings")
 BLOCKING_STATUSES = frozenset({"partial", "skipped", "fix_failed"})
@@ -194,12 +194,7 @@ def build_coverage_view(project_filter: str | None) -> list[CoverageRow]:
         project_root = resolve_project_root(project)
         if project_root is None:
             continue
-        counts: defaultdict[str, int] = defaultdict(int)
-        for row in load_project_history(project):
-            for unit in row.get("reviewed_units") or []:
-                guideline_id = unit.get("guideline_id")
-                if isinstance(guideline_id, str):
-                    counts[guideline_id] += 1
+        counts = guideline_review_counts(project)
         try:
             units = build_units(project_root)
         except Exception:
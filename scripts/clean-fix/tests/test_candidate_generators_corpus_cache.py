@@ -0,0 +1,48 @@
+#!/usr/bin/env python3
+"""`SourceCorpus.save` drops cache entries for files the listing no longer has."""
+
+from __future__ import annotations
+
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+import candidate_generators
+from candidate_generators import SourceCorpus
+
+
+class CorpusCacheTest(unittest.TestCase):
+    def test_save_prunes_unlisted_files(self) -> None:
+        saved = candidate_generators.CORPUS_CACHE_DIR
+        with tempfile.TemporaryDirectory() as tmp:
+            candidate_generators.CORPUS_CACHE_DIR = Path(tmp) / "cache"
+            try:
+                root = Path(tmp) / "crate"
+                (root / "src").mkdir(parents=True)
+                for name in ("lib", "old"):
+                    _ = (root / "src" / f"{name}.rs").write_text(f"pub struct {name.title()};\n")
+                corpus = SourceCorpus(root)
+                corpus.prefetch(corpus.rust_files())
+                for path in corpus.rust_files():
+                    _ = corpus.source(path)
+                corpus.save()
+
+                (root / "src" / "old.rs").unlink()
+                # A later helper run: nothing listed in this process yet.
+                candidate_generators._listings.clear()
+                unlisted = SourceCorpus(root)
+                unlisted.save()
+                self.assertEqual(len(SourceCorpus(root)._entries), 2)
+
+                listed = SourceCorpus(root)
+                _ = listed.rust_files()
+                listed.save()
+                self.assertEqual(sorted(SourceCorpus(root)._entries), [str(root / "src" / "lib.rs")])
+            finally:
+                candidate_generators.CORPUS_CACHE_DIR = saved
+
+
+if __name__ == "__main__":
+    unittest.main()
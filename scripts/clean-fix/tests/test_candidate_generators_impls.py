@@ -0,0 +1,50 @@
+#!/usr/bin/env python3
+"""Header parsing for `candidate_generators.scan_impls`."""
+
+from __future__ import annotations
+
+import sys
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+from candidate_generators import ImplDef, mask_source, scan_impls
+
+SOURCE = """impl<T: Fn() -> u8> fmt::Display for Wrapper<T> where T: Clone {
+}
+unsafe impl Send for X {}
+impl Foo { fn f() -> impl Iterator<Item = u8> { todo!() } }
+impl<'a> From<&'a str> for Bar<'a> {}
+impl !Sync for Y {}
+#[cfg(test)]
+impl<F> Tr for F where F: for<'a> Fn(&'a u8) {}
+fn g(x: impl Into<String>) {}
+unsafe impl<T, const N: usize> Array for [T; N] {}
+macro_rules! m { ($t:ty) => { $( impl Marker for $t {} )* } }
+"""
+
+
+class ScanImplsTest(unittest.TestCase):
+    def test_headers(self) -> None:
+        impls = scan_impls(mask_source(SOURCE))
+        self.assertEqual(
+            impls,
+            [
+                ImplDef("Display", "fmt::Display", "Wrapper<T>", "<T: Fn() -> u8>", 1),
+                ImplDef("Send", "Send", "X", "", 3),
+                ImplDef("", "", "Foo", "", 4),
+                ImplDef("From", "From<&'a str>", "Bar<'a>", "<'a>", 5),
+                ImplDef("Sync", "!Sync", "Y", "", 6),
+                ImplDef("Tr", "Tr", "F", "<F>", 8),
+                ImplDef("Array", "Array", "[T; N]", "<T, const N: usize>", 10),
+                ImplDef("Marker", "Marker", "$t", "", 11),
+            ],
+        )
+
+    def test_bounds_are_not_impls(self) -> None:
+        impls = scan_impls(mask_source("impl<S, T: Signer<S>> SignerMut<S> for T {}\n"))
+        self.assertEqual([impl.trait_name for impl in impls], ["SignerMut"])
+
+
+if __name__ == "__main__":
+    unittest.main()
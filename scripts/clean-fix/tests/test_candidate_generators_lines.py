@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+"""Offset/line and brace views derived from `candidate_generators.MaskedSource`."""
+
+from __future__ import annotations
+
+import sys
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+from candidate_generators import mask_source, scan_enums, scan_structs
+
+SOURCE = """struct Outer {
+    a: u8,
+    inner: Inner { b: u8 },
+    c: Vec<u8>,
+}
+enum E { A,
+    B { x: u8 },
+    C,
+}
+#[cfg(test)]
+mod tests {
+    fn f() { let s = "}"; }
+}
+struct Open {
+    d: u8,
+"""
+
+
+class LineIndexTest(unittest.TestCase):
+    def test_offsets_round_trip(self) -> None:
+        masked = mask_source(SOURCE)
+        index = masked.line_index
+        text = masked.text
+        for offset in range(len(text) + 1):
+            line = text.count("\n", 0, offset) + 1
+            col = offset - (text.rfind("\n", 0, offset) + 1)
+            self.assertEqual((index.line(offset), index.col(offset)), (line, col), offset)
+            self.assertEqual(index.offset(line, col), offset)
+
+
+class BraceViewsTest(unittest.TestCase):
+    def test_line_depths(self) -> None:
+        masked = mask_source(SOURCE)
+        self.assertEqual(masked.line_depths[:6], [0, 1, 1, 1, 1, 0])
+        self.assertEqual(masked.line_depths[-1], 1)
+
+    def test_closing_line(self) -> None:
+        masked = mask_source(SOURCE)
+        self.assertEqual(masked.closing_line(0, 13), 4)
+        self.assertEqual(masked.closing_line(2, 17), 2)
+        self.assertEqual(masked.closing_line(10, 10), 12)
+        self.assertEqual(masked.closing_line(13, 12), None)
+        self.assertEqual(masked.block_lines(13, 12), range(14, 15))
+
+    def test_scanners(self) -> None:
+        masked = mask_source(SOURCE)
+        structs = {struct.name: [field.name for field in struct.fields] for struct in scan_structs(masked)}
+        self.assertEqual(structs, {"Outer": ["a", "inner", "c"], "Open": ["d"]})
+        self.assertEqual([name for name, _ in scan_enums(masked)[0].variants], ["B", "C"])
+
+
+if __name__ == "__main__":
+    unittest.main()
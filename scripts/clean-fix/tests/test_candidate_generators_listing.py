@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+"""`project_listing` from git covers submodules and nested repos like the walk."""
+
+from __future__ import annotations
+
+import shutil
+import subprocess
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+import candidate_generators
+from candidate_generators import _walk_listing, project_listing
+
+
+def git(cwd: Path, *args: str) -> None:
+    _ = subprocess.run(
+        ["git", "-c", "user.email=t@t", "-c", "user.name=t", "-c", "protocol.file.allow=always", *args],
+        cwd=cwd,
+        check=True,
+        capture_output=True,
+    )
+
+
+def write(path: Path, text: str) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    _ = path.write_text(text)
+
+
+@unittest.skipUnless(shutil.which("git"), "git not installed")
+class GitListingTest(unittest.TestCase):
+    def test_submodule_and_nested_repo_sources_are_listed(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            root = Path(tmp) / "repo"
+            write(root / "Cargo.toml", "[workspace]\n")
+            write(root / "src" / "lib.rs", "fn a() {}\n")
+            write(root / ".gitignore", "ignored/\n")
+            git(root.parent, "init", "-q", str(root))
+            git(root, "add", ".")
+            git(root, "commit", "-qm", "init")
+
+            sub = Path(tmp) / "sub-origin"
+            write(sub / "Cargo.toml", "[package]\n")
+            write(sub / "src" / "s.rs", "fn s() {}\n")
+            git(sub.parent, "init", "-q", str(sub))
+            git(sub, "add", ".")
+            git(sub, "commit", "-qm", "sub")
+            git(root, "submodule", "add", "-q", str(sub), "crates/sub")
+
+            write(root / "nested" / "inner" / "n.rs", "fn n() {}\n")
+            git(root / "nested", "init", "-q")
+            write(root / "untracked" / "u.rs", "fn u() {}\n")
+            write(root / "ignored" / "i.rs", "fn i() {}\n")
+
+            candidate_generators._listings.clear()
+            listing = project_listing(root)
+            walked = _walk_listing(root)
+            ignored = root / "ignored" / "i.rs"
+            self.assertEqual(listing.rust_files, tuple(path for path in walked.rust_files if path != ignored))
+            self.assertEqual(listing.manifests, walked.manifests)
+            self.assertIn(root / "crates" / "sub" / "src" / "s.rs", listing.rust_files)
+            self.assertIn(root / "nested" / "inner" / "n.rs", listing.rust_files)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,196 @@
+#!/usr/bin/env python3
+"""Golden checks for `candidate_generators.mask_source`.
+
+The masker jumps between lexical events with a regex. `reference_mask_source`
+is the original character-at-a-time walk it replaced, kept here as the oracle:
+every input must mask to the same lines and string literals under both.
+"""
+
+from __future__ import annotations
+
+import random
+import re
+import sys
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+from candidate_generators import MaskedSource, StringLiteral, mask_source
+
+_RAW_OPEN_RE = re.compile(r'b?r(#*)"')
+_IDENT_CHAR_RE = re.compile(r"[A-Za-z0-9_]")
+
+
+def reference_mask_source(text: str) -> MaskedSource:
+    out = list(text)
+    n = len(text)
+    literal_spans: list[tuple[int, int, str]] = []
+
+    def blank(a: int, b: int) -> None:
+        for j in range(a, min(b, n)):
+            if out[j] != "\n":
+                out[j] = " "
+
+    i = 0
+    while i < n:
+        c = text[i]
+        nxt = text[i + 1] if i + 1 < n else ""
+        if c == "/" and nxt == "/":
+            j = text.find("\n", i)
+            j = n if j == -1 else j
+            blank(i, j)
+            i = j
+            continue
+        if c == "/" and nxt == "*":
+            depth = 1
+            j = i + 2
+            while j < n and depth:
+                if text[j : j + 2] == "/*":
+                    depth += 1
+                    j += 2
+                elif text[j : j + 2] == "*/":
+                    depth -= 1
+                    j += 2
+                else:
+                    j += 1
+            blank(i, j)
+            i = j
+            continue
+        if c in "br":
+            prev = text[i - 1] if i > 0 else " "
+            raw_match = _RAW_OPEN_RE.match(text, i)
+            if raw_match is not None and _IDENT_CHAR_RE.match(prev) is None:
+                closer = '"' + "#" * len(raw_match.group(1))
+                j = text.find(closer, raw_match.end())
+                j = n if j == -1 else j + len(closer)
+                literal_spans.append((raw_match.end(), max(raw_match.end(), j - len(closer)), "string"))
+                blank(i, j)
+                i = j
+                continue
+        if c == '"':
+            j = i + 1
+            while j < n:
+                if text[j] == "\\":
+                    j += 2
+                    continue
+                if text[j] == '"':
+                    break
+                j += 1
+            literal_spans.append((i + 1, min(j, n), "string"))
+            blank(i, j + 1)
+            i = j + 1
+            continue
+        if c == "'":
+            if nxt == "\\":
+                j = text.find("'", i + 2)
+                if j != -1 and j - i <= 12:
+                    literal_spans.append((i + 1, j, "char"))
+                    blank(i, j + 1)
+                    i = j + 1
+                    continue
+            elif nxt and text[i + 2 : i + 3] == "'":
+                literal_spans.append((i + 1, i + 2, "char"))
+                blank(i, i + 3)
+                i = i + 3
+                continue
+        i += 1
+
+    line_starts = [0]
+    for idx, ch in enumerate(text):
+        if ch == "\n":
+            line_starts.append(idx + 1)
+
+    strings: list[StringLiteral] = []
+    for start, end, kind in literal_spans:
+        offset = max(start - 1, 0)
+        line = sum(1 for line_start in line_starts if line_start <= offset)
+        strings.append(
+            StringLiteral(line=line, col=offset - line_starts[line - 1], text=text[start:end], kind=kind)
+        )
+    return MaskedSource(lines="".join(out).splitlines(), strings=strings)
+
+
+GOLDEN_SOURCE = """fn main<'a>(x: &'a str) -> char {
+    // a "quoted" comment
+    let s = "a // not a comment";
+    let r = r#"raw "quote" /* */"#;
+    let b = br"bytes";
+    /* outer /* nested */ still comment */
+    let e = "esc \\" quote";
+    let c = '\\n';
+    let q = '"';
+    let ident = for_r"x";
+    'x'
+}
+"""
+
+GOLDEN_LINES = [
+    "fn main<'a>(x: &'a str) -> char {",
+    "                         ",
+    "    let s =                     ;",
+    "    let r =                       ;",
+    "    let b =          ;",
+    "                                          ",
+    "    let e =               ;",
+    "    let c =     ;",
+    "    let q =    ;",
+    "    let ident = for_r   ;",
+    "       ",
+    "}",
+]
+
+GOLDEN_STRINGS = [
+    StringLiteral(line=3, col=12, text="a // not a comment", kind="string"),
+    StringLiteral(line=4, col=14, text='raw "quote" /* */', kind="string"),
+    StringLiteral(line=5, col=14, text="bytes", kind="string"),
+    StringLiteral(line=7, col=12, text='esc \\" quote', kind="string"),
+    StringLiteral(line=8, col=12, text="\\n", kind="char"),
+    StringLiteral(line=9, col=12, text='"', kind="char"),
+    StringLiteral(line=10, col=21, text="x", kind="string"),
+    StringLiteral(line=11, col=4, text="x", kind="char"),
+]
+
+# Inputs where the scanner runs off the end of the text or meets odd layout.
+EDGE_CASES = [
+    "",
+    'let s = "unterminated',
+    'let s = "trailing backslash\\',
+    'let r = r##"unterminated raw"#',
+    "/* unterminated /* nested */ block",
+    "// comment at EOF",
+    'r"raw at start"',
+    "'\\u{1F600}' '\\u{10FFFF}xx'",
+    "let s = \"multi\nline\\\nstring\";\r\nlet t = 1;\r\n",
+    "x /*/ still comment */ y",
+    "'''",
+    'a"b"r"c"#r#"d"#',
+]
+
+
+class MaskSourceGoldenTest(unittest.TestCase):
+    def assert_same_as_reference(self, text: str) -> None:
+        expected = reference_mask_source(text)
+        actual = mask_source(text)
+        self.assertEqual(actual.lines, expected.lines, repr(text))
+        self.assertEqual(actual.strings, expected.strings, repr(text))
+
+    def test_golden_source(self) -> None:
+        masked = mask_source(GOLDEN_SOURCE)
+        self.assertEqual(masked.lines, GOLDEN_LINES)
+        self.assertEqual(masked.strings, GOLDEN_STRINGS)
+
+    def test_edge_cases_match_reference(self) -> None:
+        for text in EDGE_CASES:
+            with self.subTest(text=text):
+                self.assert_same_as_reference(text)
+
+    def test_random_token_soup_matches_reference(self) -> None:
+        rng = random.Random(20260101)
+        alphabet = ["/", "*", '"', "'", "\\", "r", "b", "#", "\n", "a", "_", " ", "\r", "x"]
+        for _ in range(20000):
+            text = "".join(rng.choice(alphabet) for _ in range(rng.randint(0, 24)))
+            self.assert_same_as_reference(text)
+
+
+if __name__ == "__main__":
+    unittest.main()
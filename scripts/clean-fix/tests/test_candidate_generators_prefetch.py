@@ -0,0 +1,47 @@
+#!/usr/bin/env python3
+"""`SourceCorpus.prefetch` builds the same corpus in a process pool as serially."""
+
+from __future__ import annotations
+
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+import candidate_generators
+from candidate_generators import SourceCorpus
+
+
+def write_crate(root: Path, files: int) -> None:
+    src = root / "src"
+    src.mkdir(parents=True)
+    for n in range(files):
+        _ = (src / f"m{n}.rs").write_text(
+            f'pub struct S{n} {{\n    value_{n}: u{8 * (n % 4 + 1)},\n}}\n'
+            + f'impl Tr for S{n} {{}}\nconst NAME: &str = "s{n}";\n'
+        )
+    _ = (src / "bad.rs").write_bytes(b"\xff\xfe not utf-8")
+
+
+class PrefetchTest(unittest.TestCase):
+    def test_pool_matches_serial(self) -> None:
+        saved = candidate_generators.SCAN_WORKERS
+        candidate_generators.SCAN_WORKERS = 2
+        try:
+            with tempfile.TemporaryDirectory() as tmp:
+                root = Path(tmp)
+                write_crate(root, candidate_generators.PARALLEL_SCAN_MIN_FILES)
+                pooled = SourceCorpus(root)
+                files = pooled.rust_files()
+                pooled.prefetch(files)
+                serial = SourceCorpus(root)
+                for path in files:
+                    self.assertEqual(pooled.source(path), serial.source(path), path)
+                self.assertEqual(pooled._entries, serial._entries)
+        finally:
+            candidate_generators.SCAN_WORKERS = saved
+
+
+if __name__ == "__main__":
+    unittest.main()
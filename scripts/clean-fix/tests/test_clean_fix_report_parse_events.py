@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+"""Run and phase state from a log's event stream, with the text-log fallback."""
+
+from __future__ import annotations
+
+import json
+import random
+import sys
+import tempfile
+import unittest
+from collections.abc import Callable
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+import clean_fix_report_parse
+from clean_fix_report_parse import detect_current_phase, events_path, load_run_events, parse_log
+
+LOG = """2026-10-17 04:00:00 === Starting clean-fix (scope: all) ===
+2026-10-17 04:00:01 CLEAN: alpha
+2026-10-17 04:00:09 DONE: alpha
+=== Style evaluation: 1 projects ===
+Launched: alpha via claude (PID 42)
+"""
+
+
+def event(ts: str, kind: str, **fields: str) -> str:
+    return json.dumps({"v": 1, "ts": f"2026-10-17 {ts}", "event": kind, **fields}) + "\n"
+
+
+class RunEventsTest(unittest.TestCase):
+    def run_with_log(self, check: Callable[[Path], None]) -> None:
+        saved = clean_fix_report_parse.PHASE_STATE_FILE
+        with tempfile.TemporaryDirectory() as tmp:
+            clean_fix_report_parse.PHASE_STATE_FILE = Path(tmp) / ".phase-detect.json"
+            try:
+                log = Path(tmp) / "clean-fix-20261017-040000.log"
+                _ = log.write_text(LOG)
+                check(log)
+            finally:
+                clean_fix_report_parse.PHASE_STATE_FILE = saved
+
+    def test_without_stream_scrapes_log(self) -> None:
+        def check(log: Path) -> None:
+            self.assertEqual(detect_current_phase(log)[0], "style-eval")
+            result = parse_log(log)
+            self.assertEqual((result.run_start, result.status), ("2026-10-17 04:00:00", "in-progress"))
+
+        self.run_with_log(check)
+
+    def test_stream_drives_phase_and_window(self) -> None:
+        def check(log: Path) -> None:
+            stream = (
+                event("04:00:00", "run-start", scope="all")
+                + event("04:00:01", "phase-start", phase="clean+rebuild")
+                + event("04:00:09", "phase-end", phase="clean+rebuild")
+                + event("04:00:10", "phase-start", phase="style-eval-review")
+                + '{"v": 1, "ts": "2026-10-17 04:00:11", "ev'
+            )
+            _ = events_path(log).write_text(stream)
+            self.assertEqual(
+                detect_current_phase(log),
+                ("style-eval-review", "2026-10-17 04:00:10 phase-start phase=style-eval-review"),
+            )
+
+            with events_path(log).open("a") as handle:
+                _ = handle.write('ent": "cell"}\n' + event("04:05:00", "run-end", elapsed="5m 0s"))
+            self.assertEqual(detect_current_phase(log)[0], "done")
+            result = parse_log(log)
+            self.assertEqual(
+                (result.run_start, result.run_end, result.elapsed, result.status),
+                ("2026-10-17 04:00:00", "2026-10-17 04:05:00", "5m 0s", "complete"),
+            )
+            self.assertEqual(result.rows["alpha"]["clean"].state, "OK")
+
+        self.run_with_log(check)
+
+    def test_cell_and_agent_limit_events_fold_into_rows(self) -> None:
+        def check(log: Path) -> None:
+            with log.open("a") as handle:
+                _ = handle.write("=== Style-fix worktrees: 1 eligible projects ===\nELIGIBLE: alpha\nFAILED: alpha (timeout)\n")
+            _ = events_path(log).write_text(
+                event("04:00:00", "run-start", scope="all")
+                + event("04:00:01", "cell", phase="clean", project="alpha", state="RUNNING")
+                + event("04:00:09", "cell", phase="clean", project="alpha", state="OK", reason="warning")
+                + event("04:00:09", "cell", phase="clean", project="beta", state="RUNNING")
+                + event("04:00:09", "cell", phase="clean", project="gamma", state="SKIP", reason="not modified")
+                + event("04:01:00", "agent-limit", project="alpha", family="codex", descriptor="retry after 5 PM")
+            )
+            result = parse_log(log)
+            cells = {project: result.rows[project]["clean"].render() for project in ("alpha", "beta", "gamma")}
+            self.assertEqual(cells, {"alpha": "OK:warning", "beta": "RUNNING:running", "gamma": "SKIP:not-modified"})
+            stats = result.stats["clean"]
+            self.assertEqual((stats.ok, stats.skip, stats.processed), (1, 1, 2))
+            self.assertEqual(
+                (result.agent_limits["alpha"].family, result.rows["alpha"]["fix"].reason),
+                ("codex", "codex-usage-limit"),
+            )
+
+        self.run_with_log(check)
+
+    def test_resumed_stream_matches_whole_file_fold(self) -> None:
+        pieces = [
+            event("04:00:00", "run-start", scope="all"),
+            event("04:00:01", "phase-start", phase="warmup"),
+            event("04:00:02", "phase-start", phase="style-eval"),
+            event("04:00:03", "progress", project="alpha", name="agent-step", rest="\x1b[1mverify\x1b[0m"),
+            event("04:00:04", "run-end", elapsed="4s"),
+            '{"v": 1, "ts": "2026-10-17 04:00:05", "ev',
+            'ent": "phase-start", "phase": "style-fix"}\n',
+            "\n",
+        ]
+        rng = random.Random(20261017)
+
+        def check(log: Path) -> None:
+            _ = log.write_text("")
+            stream = events_path(log)
+            for trial in range(40):
+                data = ""
+                for _ in range(rng.randint(1, 15)):
+                    if rng.random() < 0.1:
+                        data = ""
+                    data += "".join(rng.choice(pieces) for _ in range(rng.randint(0, 6)))
+                    _ = stream.write_text(data)
+                    expected = load_run_events(log)
+                    self.assertEqual(
+                        detect_current_phase(log),
+                        expected.current() if expected is not None else ("unknown", ""),
+                        trial,
+                    )
+
+        self.run_with_log(check)
+
+
+if __name__ == "__main__":
+    unittest.main()
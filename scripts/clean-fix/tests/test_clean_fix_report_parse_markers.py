@@ -0,0 +1,155 @@
+#!/usr/bin/env python3
+"""Single-pass marker scan in `clean_fix_report_parse`.
+
+`parse_log` finds the marker lines once (`marker_indices`) and derives phase
+boundaries from those alone. `reference_phase_boundaries` is the multi-pass
+scan over every line it replaced, kept as the oracle.
+"""
+
+from __future__ import annotations
+
+import random
+import re
+import sys
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+from clean_fix_report_parse import (
+    EVAL_DONE_RE,
+    EVAL_HEADER_RE,
+    FIX_DONE_RE,
+    FIX_HEADER_RE,
+    MARKER_RE,
+    REVIEW_DONE_RE,
+    REVIEW_HEADER_RE,
+    detect_phase_boundaries,
+    marker_indices,
+)
+
+
+def reference_phase_boundaries(lines: list[str]) -> dict[str, tuple[int, int]]:
+    bounds: dict[str, tuple[int, int]] = {}
+    n = len(lines)
+    clean_start = 0 if n > 0 else -1
+    warmup_start = -1
+    eval_start = -1
+    eval_end = -1
+    review_start = -1
+    review_end = -1
+    fix_start = -1
+    fix_end = n  # default — fix runs to end
+
+    eval_done_seen = False
+    review_done_seen = False
+
+    for i, line in enumerate(lines):
+        if warmup_start == -1 and "WARMUP:" in line and "WARMUP KILLING" not in line:
+            warmup_start = i
+        if eval_start == -1 and EVAL_HEADER_RE.search(line):
+            eval_start = i
+            continue
+        if eval_start != -1 and not eval_done_seen and EVAL_DONE_RE.search(line):
+            eval_end = i + 1
+            eval_done_seen = True
+            continue
+        if review_start == -1 and REVIEW_HEADER_RE.search(line):
+            review_start = i
+            continue
+        if review_start != -1 and not review_done_seen and REVIEW_DONE_RE.search(line):
+            review_end = i + 1
+            review_done_seen = True
+            continue
+        if fix_start == -1 and (
+            FIX_HEADER_RE.search(line)
+            or line.startswith("ELIGIBLE: ")
+            or "Creating style-fix worktrees" in line
+        ):
+            fix_start = i
+        if FIX_DONE_RE.search(line) and fix_start != -1:
+            fix_end = i + 1
+
+    # clean phase ends at first warmup OR first eval header OR first
+    # "Starting style evaluations" line.
+    clean_end = n
+    for i, line in enumerate(lines):
+        if "WARMUP:" in line and "WARMUP KILLING" not in line:
+            clean_end = i
+            break
+        if EVAL_HEADER_RE.search(line) or "Starting style evaluations" in line:
+            clean_end = i
+            break
+
+    # warmup ends at clean_end's successor: first eval header / "Starting style".
+    warmup_end = clean_end  # default if no warmup
+    if warmup_start != -1:
+        warmup_end = n
+        for i in range(warmup_start, n):
+            if EVAL_HEADER_RE.search(lines[i]) or "Starting style evaluations" in lines[i]:
+                warmup_end = i
+                break
+
+    if clean_start != -1 and clean_end > clean_start:
+        # Only register clean if there's a timestamped `CLEAN: <project>` line.
+        # Untimestamped SKIP/ELIGIBLE lines belong to style-fix-worktrees.sh, not the clean phase.
+        slice_text = "\n".join(lines[clean_start:clean_end])
+        if re.search(r"^\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2} CLEAN: ", slice_text, re.MULTILINE):
+            bounds["clean"] = (clean_start, clean_end)
+    if warmup_start != -1:
+        bounds["warmup"] = (warmup_start, warmup_end)
+    if eval_start != -1:
+        bounds["eval"] = (eval_start, eval_end if eval_end != -1 else n)
+    if review_start != -1:
+        bounds["review"] = (review_start, review_end if review_end != -1 else n)
+    if fix_start != -1:
+        bounds["fix"] = (fix_start, fix_end)
+
+    return bounds
+
+
+LINES = [
+    "2026-10-17 04:00:00 === Starting clean-fix (scope: all) ===",
+    "2026-10-17 04:00:01 CLEAN: alpha",
+    "2026-10-17 04:00:09 DONE: alpha",
+    "2026-10-17 04:00:10 SKIP: beta (not modified since last run)",
+    "2026-10-17 04:01:00 WARMUP: start",
+    "WARMUP OK: alpha",
+    "WARMUP KILLING pid 9",
+    "WARMUP:tight",
+    "2026-10-17 04:02:00 Starting style evaluations with family=claude",
+    "=== Style evaluation: 2 projects ===",
+    "Launched: alpha via claude (PID 1)",
+    "OK: alpha (2 findings)",
+    "=== Done: 1 succeeded, 0 failed out of 1 ===",
+    "=== Style eval review (codex): 1 projects ===",
+    "=== Done: 1 reviewed, 0 failed out of 1 ===",
+    "2026-10-17 04:03:00 Creating style-fix worktrees with family=codex",
+    "=== Style-fix worktrees: 1 eligible projects ===",
+    "ELIGIBLE: alpha",
+    "[progress alpha] phase=done eval=/tmp/e.md",
+    "=== Done: 1 created, 0 failed, 0 skipped out of 1 ===",
+    "=== Done: 1 created, 0 failed, 2 skipped ===",
+    "   Compiling alpha v0.1.0",
+    "warning: unused variable",
+    "xCLEAN: y",
+    "",
+]
+
+
+class MarkerScanTest(unittest.TestCase):
+    def test_marker_indices_match_per_line_search(self) -> None:
+        lines = ["OK: a", "noise", "x OK: y WARN: z", "", "\tfailure report: r", "=== Clean-fix Rust"]
+        expected = [i for i, line in enumerate(lines) if MARKER_RE.search(line)]
+        self.assertEqual(marker_indices(lines), expected)
+        self.assertEqual(expected, [0, 2, 4, 5])
+
+    def test_random_logs_match_reference(self) -> None:
+        rng = random.Random(20261017)
+        for _ in range(5000):
+            lines = [rng.choice(LINES) for _ in range(rng.randint(0, 40))]
+            lines = [f"{line} {rng.choice(LINES)}" if rng.random() < 0.1 else line for line in lines]
+            self.assertEqual(detect_phase_boundaries(lines, marker_indices(lines)), reference_phase_boundaries(lines), lines)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+"""Resumable `clean_fix_report_parse.detect_current_phase`.
+
+`reference_detect_phase` is the original whole-file scan, kept as the oracle:
+after every append, truncate or replace the incremental answer must match it.
+"""
+
+from __future__ import annotations
+
+import random
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+import clean_fix_report_parse
+from clean_fix_report_parse import PHASE_SIGNAL_WINDOW, RUN_COMPLETE_MARKER, classify_phase_signal, detect_current_phase
+
+PIECES = [
+    "=== Style evaluation: 3 projects ===\n",
+    "=== Style eval review: 2 projects ===\n",
+    "=== Style-fix worktrees: 4 eligible projects ===\n",
+    "Launched: worker (PID 3)\n",
+    "Launched: eval via claude\n",
+    "WARMUP start\n",
+    "2026-01-01 12:00:00 CLEAN: crate\n",
+    f"{RUN_COMPLETE_MARKER} ===\n",
+    "partial",
+    "\r\n",
+    "\r",
+    "é",
+    "\n",
+]
+
+
+def reference_detect_phase(path: Path) -> tuple[str, str]:
+    lines = path.read_text(errors="replace").splitlines()
+    if not lines:
+        return ("unknown", "")
+    if any(RUN_COMPLETE_MARKER in line for line in lines):
+        return ("done", lines[-1])
+    for line in reversed(lines[-PHASE_SIGNAL_WINDOW:]):
+        phase = classify_phase_signal(line)
+        if phase is not None:
+            return (phase, line)
+    return ("unknown", lines[-1])
+
+
+class DetectCurrentPhaseTest(unittest.TestCase):
+    def test_random_appends_match_reference(self) -> None:
+        rng = random.Random(20261017)
+        saved = clean_fix_report_parse.PHASE_STATE_FILE
+        with tempfile.TemporaryDirectory() as tmp:
+            clean_fix_report_parse.PHASE_STATE_FILE = Path(tmp) / ".phase-detect.json"
+            try:
+                for trial in range(60):
+                    log = Path(tmp) / f"run{trial}.log"
+                    data = b""
+                    for _ in range(rng.randint(1, 25)):
+                        if rng.random() < 0.05:
+                            data = b""
+                        for _ in range(rng.randint(0, 20)):
+                            piece = rng.choice(PIECES) if rng.random() < 0.5 else "filler\n" * rng.randint(1, 80)
+                            data += piece.encode()
+                        if rng.random() < 0.05:
+                            log.unlink(missing_ok=True)
+                        _ = log.write_bytes(data)
+                        self.assertEqual(detect_current_phase(log), reference_detect_phase(log), trial)
+            finally:
+                clean_fix_report_parse.PHASE_STATE_FILE = saved
+
+
+if __name__ == "__main__":
+    unittest.main()
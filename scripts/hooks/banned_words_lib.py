@@ -1,12 +1,13 @@
 """Shared banned-words detection."""
 
+import hashlib
 import json
 import os
 import re
 import shutil
-from collections.abc import Iterable
+from collections.abc import Iterable, Sequence
 from contextlib import contextmanager
-from dataclasses import dataclass
+from dataclasses import asdict, dataclass, field
 from datetime import datetime
 from pathlib import Path
 from typing import NamedTuple, cast
@@ -152,15 +153,7 @@ def _read_guide() -> str:
 
 
 def _style_guide_counters() -> dict[str, int]:
-    guide = _read_guide()
-    if not guide:
-        return {}
-    out: dict[str, int] = {}
-    pattern = re.compile(r'^###\s+"([^"]+)".*?\bcounter:\s*(\d+)', re.MULTILINE)
-    matches = cast("list[tuple[str, str]]", pattern.findall(guide))
-    for stem, raw_count in matches:
-        out[stem] = int(raw_count)
-    return out
+    return dict(compiled_matcher().rules.counters)
 
 
 def _initial_timestamp() -> str:
@@ -296,20 +289,56 @@ def counter_analysis_rows() -> list[tuple[str, int, str]]:
     return rows
 
 
-def load_banned_words() -> list[str]:
-    return re.findall(r'^###\s+"([^"]+)"', _read_guide(), re.MULTILINE)
+# ── Compiled matcher ────────────────────────────────────────────────────────
+# Every hook invocation used to re-read the guide once per loader, re-run the
+# section regexes, and recompile each stem pattern before scanning. The parsed
+# rules now live in MATCHER_CACHE, keyed by the guide's mtime/size and sha256:
+# an unchanged guide costs one `stat` plus one JSON read, and a touched-but-
+# identical guide costs one hash. Within a process the compiled matcher is
+# memoized on the same stat key, so repeated scans (a diff, a daemon) pay only
+# the `stat`. Edits to the guide are still picked up on the next call.
+MATCHER_CACHE = COUNTER_STATE.with_name("forbidden-words-matcher.json")
+MATCHER_CACHE_VERSION = 1
+_SECTION_RE = re.compile(
+    r'^###\s+"([^"]+)".*?\n(.*?)(?=^###\s+"|\Z)',
+    re.MULTILINE | re.DOTALL,
+)
+_HEADING_RE = re.compile(r'^###\s+"([^"]+)"', re.MULTILINE)
+_COUNTER_RE = re.compile(r'^###\s+"([^"]+)".*?\bcounter:\s*(\d+)', re.MULTILINE)
+_EXCEPTIONS_RE = re.compile(r"^exceptions:\s*(.+)$", re.MULTILINE)
+_EXCEPT_RE = re.compile(r"^except(?:ions?)?:\s*(.+?)\s*$", re.MULTILINE)
+_REGEX_RE = re.compile(r"^regex:\s*(.+?)\s*$", re.MULTILINE)
+# A backreference changes meaning once its pattern is folded into a larger
+# alternation (group numbers shift), so such overrides disable the prefilter.
+_BACKREF_RE = re.compile(r"\\(?:[1-9]|g<)|\(\?P=")
 
 
-def load_exemptions() -> list[str]:
-    m = re.search(r"^exceptions:\s*(.+)$", _read_guide(), re.MULTILINE)
-    if not m:
-        return []
-    raw = m.group(1).strip()
+@dataclass(frozen=True)
+class GuideRules:
+    """Everything the matcher needs from one revision of the guide."""
+
+    stems: tuple[str, ...] = ()
+    exemptions: tuple[str, ...] = ()
+    per_stem_exemptions: dict[str, list[str]] = field(default_factory=dict)
+    overrides: dict[str, str] = field(default_factory=dict)
+    guidance: dict[str, str] = field(default_factory=dict)
+    counters: dict[str, int] = field(default_factory=dict)
+
+
+def _split_list(raw: str) -> list[str]:
+    raw = raw.strip()
     parts = re.split(r"[,;]", raw) if ("," in raw or ";" in raw) else [raw]
     return [p.strip() for p in parts if p.strip()]
 
 
-def load_per_stem_exemptions() -> dict[str, list[str]]:
+def _parse_exemptions(guide: str) -> list[str]:
+    m = _EXCEPTIONS_RE.search(guide)
+    if not m:
+        return []
+    return _split_list(m.group(1))
+
+
+def _parse_per_stem_exemptions(guide: str) -> dict[str, list[str]]:
     """Parse per-section `except:` lines from the canonical guide.
 
     Each `### "<stem>"` section may declare its own exemptions on a line
@@ -318,30 +347,18 @@ def load_per_stem_exemptions() -> dict[str, list[str]]:
     stem only — useful when a word is banned as a metaphor but legitimate
     as domain vocabulary.
     """
-    guide = _read_guide()
-    if not guide:
-        return {}
     out: dict[str, list[str]] = {}
-    section_pat = re.compile(
-        r'^###\s+"([^"]+)".*?\n(.*?)(?=^###\s+"|\Z)',
-        re.MULTILINE | re.DOTALL,
-    )
-    except_pat = re.compile(r"^except(?:ions?)?:\s*(.+?)\s*$", re.MULTILINE)
-    for m in section_pat.finditer(guide):
-        stem = m.group(1)
-        body = m.group(2)
-        em = except_pat.search(body)
+    for m in _SECTION_RE.finditer(guide):
+        em = _EXCEPT_RE.search(m.group(2))
         if not em:
             continue
-        raw = em.group(1).strip()
-        parts = re.split(r"[,;]", raw) if ("," in raw or ";" in raw) else [raw]
-        items = [p.strip() for p in parts if p.strip()]
+        items = _split_list(em.group(1))
         if items:
-            out[stem] = items
+            out[m.group(1)] = items
     return out
 
 
-def load_overrides() -> dict[str, str]:
+def _parse_overrides(guide: str) -> dict[str, str]:
     """Parse optional `regex: <pattern>` lines from the canonical guide.
 
     Each banned-word section may include a single `regex:` line under its
@@ -349,24 +366,142 @@ def load_overrides() -> dict[str, str]:
     silent-e algorithm for that stem (used when the default root would be
     too short and collide with unrelated common words).
     """
-    guide = _read_guide()
-    if not guide:
-        return {}
     out: dict[str, str] = {}
-    section_pat = re.compile(
-        r'^###\s+"([^"]+)".*?\n(.*?)(?=^###\s+"|\Z)',
-        re.MULTILINE | re.DOTALL,
-    )
-    regex_pat = re.compile(r"^regex:\s*(.+?)\s*$", re.MULTILINE)
-    for m in section_pat.finditer(guide):
-        stem = m.group(1)
-        body = m.group(2)
-        rm = regex_pat.search(body)
+    for m in _SECTION_RE.finditer(guide):
+        rm = _REGEX_RE.search(m.group(2))
         if rm:
-            out[stem] = rm.group(1)
+            out[m.group(1)] = rm.group(1)
+    return out
+
+
+def _parse_guidance(guide: str) -> dict[str, str]:
+    out: dict[str, str] = {}
+    for m in _SECTION_RE.finditer(guide):
+        _ = out.setdefault(m.group(1), m.group(2).strip())
     return out
 
 
+def _parse_guide(guide: str) -> GuideRules:
+    if not guide:
+        return GuideRules()
+    counters = cast("list[tuple[str, str]]", _COUNTER_RE.findall(guide))
+    return GuideRules(
+        stems=tuple(_HEADING_RE.findall(guide)),
+        exemptions=tuple(_parse_exemptions(guide)),
+        per_stem_exemptions=_parse_per_stem_exemptions(guide),
+        overrides=_parse_overrides(guide),
+        guidance=_parse_guidance(guide),
+        counters={stem: int(raw) for stem, raw in counters},
+    )
+
+
+def _rules_from_cache(raw: dict[str, object]) -> GuideRules | None:
+    try:
+        return GuideRules(
+            stems=tuple(cast("list[str]", raw["stems"])),
+            exemptions=tuple(cast("list[str]", raw["exemptions"])),
+            per_stem_exemptions=cast("dict[str, list[str]]", raw["per_stem_exemptions"]),
+            overrides=cast("dict[str, str]", raw["overrides"]),
+            guidance=cast("dict[str, str]", raw["guidance"]),
+            counters=cast("dict[str, int]", raw["counters"]),
+        )
+    except (KeyError, TypeError):
+        return None
+
+
+def _read_matcher_cache() -> dict[str, object]:
+    try:
+        raw: object = json.loads(MATCHER_CACHE.read_text())  # pyright: ignore[reportAny]
+    except (OSError, json.JSONDecodeError):
+        return {}
+    if not isinstance(raw, dict):
+        return {}
+    cache = cast("dict[str, object]", raw)
+    if cache.get("version") != MATCHER_CACHE_VERSION:
+        return {}
+    return cache
+
+
+def _write_matcher_cache(stat_key: tuple[int, int], digest: str, rules: GuideRules) -> None:
+    # Best effort: an unwritable cache only costs the next process a re-parse.
+    payload = {
+        "version": MATCHER_CACHE_VERSION,
+        "mtime_ns": stat_key[0],
+        "size": stat_key[1],
+        "sha256": digest,
+        "rules": asdict(rules),
+    }
+    tmp_path = MATCHER_CACHE.with_name(f".{MATCHER_CACHE.name}.{os.getpid()}.tmp")
+    try:
+        MATCHER_CACHE.parent.mkdir(parents=True, exist_ok=True)
+        _ = tmp_path.write_text(json.dumps(payload) + "\n")
+        _ = tmp_path.replace(MATCHER_CACHE)
+    except OSError:
+        pass
+
+
+def _load_rules(stat_key: tuple[int, int]) -> GuideRules:
+    cache = _read_matcher_cache()
+    cached_rules = cache.get("rules")
+    cached = (
+        _rules_from_cache(cast("dict[str, object]", cached_rules))
+        if isinstance(cached_rules, dict)
+        else None
+    )
+    if cached is not None and (cache.get("mtime_ns"), cache.get("size")) == stat_key:
+        return cached
+    guide = _read_guide()
+    digest = hashlib.sha256(guide.encode("utf-8", errors="surrogateescape")).hexdigest()
+    rules = cached if cached is not None and cache.get("sha256") == digest else _parse_guide(guide)
+    _write_matcher_cache(stat_key, digest, rules)
+    return rules
+
+
+def _guide_stat_key() -> tuple[int, int] | None:
+    try:
+        st = STYLE_GUIDE.stat()
+    except OSError:
+        return None
+    return (st.st_mtime_ns, st.st_size)
+
+
+_matcher_memo: "tuple[tuple[int, int] | None, CompiledMatcher] | None" = None
+
+
+def compiled_matcher() -> "CompiledMatcher":
+    """The matcher for the guide as it is on disk right now.
+
+    Costs one `stat` when the guide is unchanged since the last call in this
+    process; otherwise rebuilds from the on-disk cache (or a fresh parse).
+    """
+    global _matcher_memo
+    stat_key = _guide_stat_key()
+    if _matcher_memo is not None and _matcher_memo[0] == stat_key:
+        return _matcher_memo[1]
+    rules = GuideRules() if stat_key is None else _load_rules(stat_key)
+    matcher = CompiledMatcher(rules)
+    _matcher_memo = (stat_key, matcher)
+    return matcher
+
+
+def load_banned_words() -> list[str]:
+    return list(compiled_matcher().rules.stems)
+
+
+def load_exemptions() -> list[str]:
+    return list(compiled_matcher().rules.exemptions)
+
+
+def load_per_stem_exemptions() -> dict[str, list[str]]:
+    """Per-stem `except:` substrings; see `_parse_per_stem_exemptions`."""
+    return dict(compiled_matcher().rules.per_stem_exemptions)
+
+
+def load_overrides() -> dict[str, str]:
+    """Per-stem `regex:` overrides; see `_parse_overrides`."""
+    return dict(compiled_matcher().rules.overrides)
+
+
 def _is_phrase(stem: str) -> bool:
     return bool(re.search(r"\s", stem))
 
@@ -439,65 +574,93 @@ def get_stem_guidance(stem: str) -> str:
     Used by the messaging hook so the agent gets the substitutes and rule prose
     inline without needing to open the style guide on every violation.
     """
-    guide = _read_guide()
-    if not guide:
-        return ""
-    pattern = re.compile(
-        rf'^###\s+"{re.escape(stem)}".*?\n(.*?)(?=^###\s+"|\Z)',
-        re.MULTILINE | re.DOTALL,
-    )
-    m = pattern.search(guide)
-    if not m:
-        return ""
-    return m.group(1).strip()
+    return compiled_matcher().rules.guidance.get(stem, "")
+
+
+def _literal_patterns(items: Iterable[str]) -> list[re.Pattern[str]]:
+    return [re.compile(re.escape(item), re.IGNORECASE) for item in items]
+
+
+def _spans(patterns: Iterable[re.Pattern[str]], line: str) -> list[tuple[int, int]]:
+    return [(m.start(), m.end()) for pat in patterns for m in pat.finditer(line)]
+
+
+def _combined_pattern(patterns: list[re.Pattern[str]]) -> re.Pattern[str] | None:
+    """Fold every entry into one alternation, or None when that is unsafe.
+
+    Only used to reject lines: if no entry matches a line, neither does the
+    alternation, and a line the alternation does hit is rescanned per entry so
+    overlapping matches from different stems are all still reported.
+    """
+    if not patterns or any(_BACKREF_RE.search(p.pattern) for p in patterns):
+        return None
+    try:
+        return re.compile("|".join(f"(?:{p.pattern})" for p in patterns), re.IGNORECASE)
+    except re.error:
+        # e.g. an override carrying a global inline flag like `(?i)`, which is
+        # only legal at the very start of a pattern.
+        return None
+
+
+class CompiledMatcher:
+    """Every stem, phrase and override from one revision of the guide, compiled.
+
+    `scan` makes one prefilter pass per line; only lines the combined
+    alternation hits are scanned per entry, and exemption spans are computed
+    for those lines alone.
+    """
+
+    def __init__(self, rules: GuideRules) -> None:
+        self.rules = rules
+        self.patterns = [(s, _entry_pattern(s, rules.overrides.get(s))) for s in rules.stems]
+        self.prefilter = _combined_pattern([pat for _, pat in self.patterns])
+        self.exemptions = _literal_patterns(rules.exemptions)
+        self.per_stem_exemptions = {
+            stem: _literal_patterns(items)
+            for stem, items in rules.per_stem_exemptions.items()
+        }
+
+    def scan(self, text: str) -> list[Violation]:
+        out: list[Violation] = []
+        if not self.patterns:
+            return out
+        for line_no, line in enumerate(text.splitlines(), start=1):
+            if self.prefilter is not None and self.prefilter.search(line) is None:
+                continue
+            if ALLOW_MARKER_RE.search(line):
+                continue
+            global_spans: list[tuple[int, int]] | None = None
+            for stem, pat in self.patterns:
+                stem_spans: list[tuple[int, int]] | None = None
+                for m in pat.finditer(line):
+                    if global_spans is None:
+                        global_spans = _spans(self.exemptions, line)
+                    if stem_spans is None:
+                        stem_spans = _spans(self.per_stem_exemptions.get(stem, ()), line)
+                    if any(m.start() >= s and m.end() <= e for s, e in global_spans):
+                        continue
+                    if any(m.start() >= s and m.end() <= e for s, e in stem_spans):
+                        continue
+                    out.append(Violation(stem, m.group(0), line_no, line.strip()))
+        return out
 
 
 def find_violations(text: str) -> list[Violation]:
-    stems = load_banned_words()
-    exemptions = load_exemptions()
-    per_stem_exemptions = load_per_stem_exemptions()
-    overrides = load_overrides()
-    patterns = [(s, _entry_pattern(s, overrides.get(s))) for s in stems]
-
-    out: list[Violation] = []
-    for line_no, line in enumerate(text.splitlines(), start=1):
-        if ALLOW_MARKER_RE.search(line):
-            continue
-        global_exempt_spans: list[tuple[int, int]] = []
-        for ex in exemptions:
-            for em in re.finditer(re.escape(ex), line, re.IGNORECASE):
-                global_exempt_spans.append((em.start(), em.end()))
-
-        per_stem_spans: dict[str, list[tuple[int, int]]] = {}
-        for stem, ex_list in per_stem_exemptions.items():
-            spans: list[tuple[int, int]] = []
-            for ex in ex_list:
-                for em in re.finditer(re.escape(ex), line, re.IGNORECASE):
-                    spans.append((em.start(), em.end()))
-            if spans:
-                per_stem_spans[stem] = spans
-
-        for stem, pat in patterns:
-            stem_spans = per_stem_spans.get(stem, [])
-            for m in pat.finditer(line):
-                if any(m.start() >= s and m.end() <= e for s, e in global_exempt_spans):
-                    continue
-                if any(m.start() >= s and m.end() <= e for s, e in stem_spans):
-                    continue
-                out.append(Violation(stem, m.group(0), line_no, line.strip()))
-    return out
+    return compiled_matcher().scan(text)
 
 
-def _scan_diff(diff_text: str) -> int:
-    """Scan a unified diff on stdin, reporting only ADDED lines at their real
-    file path and new-file line number. Exit 1 if any violation, else 0.
+class AddedLine(NamedTuple):
+    path: str | None
+    new_line: int
+    text: str
 
-    A new (untracked) file rendered via `git diff --no-index /dev/null <file>`
-    appears as an all-additions hunk, so untracked files are scanned in full;
-    tracked files are scanned on their added lines only. Per-stem `except:`
-    exemptions and `allow-banned:` markers apply per line, same as a file scan.
+
+def added_lines(diff_text: str) -> list[AddedLine]:
+    """The ADDED lines of a unified diff, each at its real file path and
+    new-file line number. Removed lines are dropped; context lines only advance
+    the new-file counter.
     """
-    found = 0
+    out: list[AddedLine] = []
     path: str | None = None
     new_line = 0
     for raw in diff_text.splitlines():
@@ -519,10 +682,7 @@ def _scan_diff(diff_text: str) -> int:
             new_line = int(m.group(1)) if m else 0
             continue
         if raw.startswith("+"):
-            for v in find_violations(raw[1:]):
-                label = path or "<unknown>"
-                print(f"{label}:{new_line}: {v.stem}: {v.line}")
-                found += 1
+            out.append(AddedLine(path, new_line, raw[1:]))
             new_line += 1
         elif raw.startswith("-"):
             # Removed line: present only on the old side, so it does not advance
@@ -532,6 +692,36 @@ def _scan_diff(diff_text: str) -> int:
             # Context line (leading space) or inter-file blank: advances the
             # new-file counter without being scanned.
             new_line += 1
+    return out
+
+
+def find_violations_in_lines(lines: Sequence[AddedLine]) -> list[tuple[AddedLine, Violation]]:
+    """Batch scan: run the matcher once over every line and map each hit back.
+
+    The lines are joined into one buffer, so the guide is checked and the
+    matcher fetched once per batch instead of once per line. Each `text` must
+    be a single line (as `str.splitlines` produces) so buffer line N is
+    `lines[N - 1]`.
+    """
+    if not lines:
+        return []
+    buffer = "\n".join(line.text for line in lines)
+    return [(lines[v.line_no - 1], v) for v in find_violations(buffer)]
+
+
+def _scan_diff(diff_text: str) -> int:
+    """Scan a unified diff on stdin, reporting only ADDED lines at their real
+    file path and new-file line number. Exit 1 if any violation, else 0.
+
+    A new (untracked) file rendered via `git diff --no-index /dev/null <file>`
+    appears as an all-additions hunk, so untracked files are scanned in full;
+    tracked files are scanned on their added lines only. Per-stem `except:`
+    exemptions and `allow-banned:` markers apply per line, same as a file scan.
+    """
+    found = 0
+    for added, v in find_violations_in_lines(added_lines(diff_text)):
+        print(f"{added.path or '<unknown>'}:{added.new_line}: {v.stem}: {v.line}")
+        found += 1
     return 1 if found else 0
 
 
@@ -0,0 +1,440 @@
+#!/usr/bin/env python3
+"""Warm basedpyright language server for one project root.
+
+Usage:
+    python3 basedpyright_server.py <project-root>
+
+Spawned detached by `post-tool-use-basedpyright.py` in `warm` mode the first
+time a file under <project-root> is edited; nothing needs to start it by hand.
+It keeps `basedpyright-langserver --stdio` running with the root as its
+workspace, so later edits skip the cold program load that made the CLI trip the
+hook's 10 s timeout on larger packages.
+
+Each hook request sends the edited file's path and current text over a Unix
+socket. The server forwards it as `didOpen`, waits for the `publishDiagnostics`
+matching that document version, replies with the diagnostics for that file
+alone, and sends `didClose`. Nothing stays open between checks, so the
+language server reads other modules (and this one, when imported) from disk
+rather than from a stale editor buffer. The language server does not watch the
+disk itself in LSP mode, so before each check the server diffs the mtimes of
+the root's Python sources and reports what moved as `didChangeWatchedFiles`;
+a module edited since the last check is re-read before its importers are.
+
+One server per root, guarded by an flock on `<digest>.lock`; it exits after
+IDLE_SECONDS without a request or as soon as the language server dies.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import shutil
+import socket
+import socketserver
+import subprocess
+import sys
+import threading
+import time
+from pathlib import Path
+from typing import IO, cast
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - non-Unix fallback
+    fcntl = None  # type: ignore[assignment]
+
+STATE_DIR = Path("/tmp/claude/basedpyright")
+IDLE_SECONDS = 30 * 60
+# Per request. The first check after startup pays the full program load, so
+# this is generous; the hook gives up sooner and falls back to the CLI.
+DIAGNOSTICS_TIMEOUT_SECONDS = 60.0
+INITIALIZE_TIMEOUT_SECONDS = 30.0
+
+# LSP DiagnosticSeverity -> the severity strings `basedpyright --outputjson`
+# uses. Hints (4) are editor-only (unused-variable fading and the like) and are
+# never reported by the CLI, so they are dropped.
+SEVERITIES = {1: "error", 2: "warning", 3: "information"}
+
+SOURCE_SUFFIXES = (".py", ".pyi")
+# Directories never holding first-party sources; skipped by the mtime scan.
+SKIP_DIRS = frozenset({"__pycache__", "node_modules", "target"})
+# LSP FileChangeType.
+FILE_CREATED, FILE_CHANGED, FILE_DELETED = 1, 2, 3
+
+
+def root_digest(root: Path) -> str:
+    return hashlib.sha1(str(root).encode("utf-8")).hexdigest()[:16]
+
+
+def socket_path(root: Path) -> Path:
+    return STATE_DIR / f"{root_digest(root)}.sock"
+
+
+def find_langserver() -> str | None:
+    """Find the basedpyright-langserver executable, mirroring the hook's CLI lookup."""
+    path = shutil.which("basedpyright-langserver")
+    if path:
+        return path
+    home_path = Path.home() / ".local" / "bin" / "basedpyright-langserver"
+    return str(home_path) if home_path.exists() else None
+
+
+class LanguageServer:
+    """Minimal LSP client over a `basedpyright-langserver --stdio` child."""
+
+    def __init__(self, executable: str, root: Path) -> None:
+        self.root = root
+        self.proc = subprocess.Popen(
+            [executable, "--stdio"],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            cwd=str(root),
+        )
+        self._write_lock = threading.Lock()
+        self._cond = threading.Condition()
+        self._responses: dict[int, object] = {}
+        # uri -> (version, diagnostics, sequence number of the publish)
+        self._published: dict[str, tuple[int | None, list[dict[str, object]], int]] = {}
+        self._publish_seq = 0
+        self._next_id = 1
+        # Versions keep counting across close/reopen so a late publish for an
+        # earlier check can never match a later one.
+        self._versions: dict[str, int] = {}
+        # Set once the server tags a publish with a version; from then on an
+        # unversioned publish (the clear that follows `didClose`) answers nothing.
+        self._versioned = False
+        self._disk = scan_sources(root)
+        threading.Thread(target=self._read_loop, daemon=True).start()
+        _ = self._request(
+            "initialize",
+            {
+                "processId": os.getpid(),
+                "rootUri": root.as_uri(),
+                "workspaceFolders": [{"uri": root.as_uri(), "name": root.name}],
+                "capabilities": {
+                    "textDocument": {"publishDiagnostics": {"versionSupport": True}},
+                    "workspace": {"configuration": True, "workspaceFolders": True},
+                },
+            },
+            INITIALIZE_TIMEOUT_SECONDS,
+        )
+        self._notify("initialized", {})
+
+    def alive(self) -> bool:
+        return self.proc.poll() is None
+
+    def _send(self, message: dict[str, object]) -> None:
+        body = json.dumps(message).encode("utf-8")
+        stdin = cast(IO[bytes], self.proc.stdin)
+        with self._write_lock:
+            _ = stdin.write(f"Content-Length: {len(body)}\r\n\r\n".encode("ascii") + body)
+            stdin.flush()
+
+    def _notify(self, method: str, params: object) -> None:
+        self._send({"jsonrpc": "2.0", "method": method, "params": params})
+
+    def _request(self, method: str, params: object, timeout: float) -> object:
+        with self._cond:
+            request_id = self._next_id
+            self._next_id += 1
+        self._send({"jsonrpc": "2.0", "id": request_id, "method": method, "params": params})
+        deadline = time.monotonic() + timeout
+        with self._cond:
+            while request_id not in self._responses:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0 or not self.alive():
+                    raise TimeoutError(method)
+                _ = self._cond.wait(remaining)
+            return self._responses.pop(request_id)
+
+    def _read_message(self) -> dict[str, object] | None:
+        stdout = cast(IO[bytes], self.proc.stdout)
+        length = 0
+        while True:
+            header = stdout.readline()
+            if not header:
+                return None
+            if header in (b"\r\n", b"\n"):
+                break
+            name, _, value = header.decode("ascii", errors="replace").partition(":")
+            if name.strip().lower() == "content-length":
+                length = int(value.strip())
+        body = stdout.read(length)
+        if len(body) < length:
+            return None
+        return cast(dict[str, object], json.loads(body))
+
+    def _read_loop(self) -> None:
+        while True:
+            try:
+                message = self._read_message()
+            except (OSError, ValueError):
+                message = None
+            if message is None:
+                with self._cond:
+                    self._cond.notify_all()
+                return
+            self._dispatch(message)
+
+    def _dispatch(self, message: dict[str, object]) -> None:
+        method = message.get("method")
+        if "id" in message and isinstance(method, str):
+            self._answer_server_request(message["id"], method, message.get("params"))
+            return
+        if "id" in message:
+            with self._cond:
+                self._responses[cast(int, message["id"])] = message.get("result")
+                self._cond.notify_all()
+            return
+        if method == "textDocument/publishDiagnostics":
+            params = cast(dict[str, object], message.get("params") or {})
+            version = params.get("version")
+            with self._cond:
+                if isinstance(version, int):
+                    self._versioned = True
+                elif self._versioned:
+                    return
+                self._publish_seq += 1
+                self._published[str(params.get("uri"))] = (
+                    version if isinstance(version, int) else None,
+                    cast(list[dict[str, object]], params.get("diagnostics") or []),
+                    self._publish_seq,
+                )
+                self._cond.notify_all()
+
+    def _answer_server_request(self, request_id: object, method: str, params: object) -> None:
+        result: object = None
+        if method == "workspace/configuration":
+            # No client-side settings: the project's own pyrightconfig.json /
+            # pyproject.toml governs, exactly as it does for the CLI.
+            items = cast(dict[str, object], params or {}).get("items")
+            result = [None for _ in cast(list[object], items or [])]
+        elif method == "workspace/workspaceFolders":
+            result = [{"uri": self.root.as_uri(), "name": self.root.name}]
+        self._send({"jsonrpc": "2.0", "id": request_id, "result": result})
+
+    def check(self, path: Path, text: str, timeout: float) -> list[dict[str, object]] | None:
+        """Diagnostics for `path` with contents `text`, or None on timeout."""
+        uri = path.as_uri()
+        with self._cond:
+            version = self._versions.get(uri, 0) + 1
+            self._versions[uri] = version
+            seq_at_send = self._publish_seq
+        self._sync_disk()
+        self._notify(
+            "textDocument/didOpen",
+            {"textDocument": {"uri": uri, "languageId": "python", "version": version, "text": text}},
+        )
+        try:
+            return self._await_diagnostics(uri, version, seq_at_send, timeout)
+        finally:
+            self._notify("textDocument/didClose", {"textDocument": {"uri": uri}})
+
+    def _sync_disk(self) -> None:
+        """Report sources created, changed or deleted since the last check."""
+        disk = scan_sources(self.root)
+        changes: list[dict[str, object]] = [
+            {"uri": path.as_uri(), "type": FILE_CHANGED if path in self._disk else FILE_CREATED}
+            for path, mtime_ns in disk.items()
+            if self._disk.get(path) != mtime_ns
+        ]
+        changes.extend({"uri": path.as_uri(), "type": FILE_DELETED} for path in self._disk.keys() - disk.keys())
+        self._disk = disk
+        if changes:
+            self._notify("workspace/didChangeWatchedFiles", {"changes": changes})
+
+    def _await_diagnostics(
+        self, uri: str, version: int, seq_at_send: int, timeout: float
+    ) -> list[dict[str, object]] | None:
+        deadline = time.monotonic() + timeout
+        with self._cond:
+            while True:
+                published = self._published.get(uri)
+                if published is not None:
+                    got_version, diagnostics, seq = published
+                    if got_version == version or (got_version is None and seq > seq_at_send):
+                        return diagnostics
+                remaining = deadline - time.monotonic()
+                if remaining <= 0 or not self.alive():
+                    return None
+                _ = self._cond.wait(remaining)
+
+    def close(self) -> None:
+        try:
+            _ = self._request("shutdown", None, 5.0)
+            self._notify("exit", None)
+        except (OSError, TimeoutError):
+            pass
+        try:
+            _ = self.proc.wait(timeout=5)
+        except subprocess.TimeoutExpired:
+            self.proc.kill()
+
+
+def scan_sources(root: Path) -> dict[Path, int]:
+    """mtime_ns of every Python source under `root`, skipping hidden and build dirs."""
+    sources: dict[Path, int] = {}
+    for directory, dirnames, filenames in os.walk(root):
+        dirnames[:] = [name for name in dirnames if not name.startswith(".") and name not in SKIP_DIRS]
+        for filename in filenames:
+            if filename.endswith(SOURCE_SUFFIXES):
+                path = Path(directory, filename)
+                try:
+                    sources[path] = path.stat().st_mtime_ns
+                except OSError:
+                    continue
+    return sources
+
+
+def sources_digest(root: Path, exclude: Path | None = None) -> str:
+    """Hash of `scan_sources(root)`, optionally without one file's own stamp.
+
+    Moves whenever a Python source under the root is edited, added or removed,
+    so a result keyed on it goes stale when anything the file imports does.
+    """
+    digest = hashlib.sha256()
+    for path, mtime_ns in sorted(scan_sources(root).items()):
+        if path != exclude:
+            digest.update(f"{path}\0{mtime_ns}\n".encode("utf-8", errors="surrogateescape"))
+    return digest.hexdigest()
+
+
+def to_cli_diagnostic(path: Path, diagnostic: dict[str, object]) -> dict[str, object] | None:
+    """Reshape an LSP diagnostic into the `--outputjson` `generalDiagnostics` form."""
+    severity = SEVERITIES.get(cast(int, diagnostic.get("severity", 1)))
+    if severity is None:
+        return None
+    out: dict[str, object] = {
+        "file": str(path),
+        "severity": severity,
+        "message": diagnostic.get("message", ""),
+        "range": diagnostic.get("range", {}),
+    }
+    code = diagnostic.get("code")
+    if isinstance(code, str):
+        out["rule"] = code
+    return out
+
+
+class CheckServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    daemon_threads = True
+
+    def __init__(self, path: Path, langserver: LanguageServer) -> None:
+        self.langserver = langserver
+        # Document versions must be sent in order, so checks are serialized.
+        self.check_lock = threading.Lock()
+        self.last_request = time.monotonic()
+        super().__init__(str(path), CheckHandler)
+
+
+class CheckHandler(socketserver.StreamRequestHandler):
+    server: CheckServer  # pyright: ignore[reportIncompatibleVariableOverride]
+
+    def handle(self) -> None:
+        self.server.last_request = time.monotonic()
+        try:
+            request = cast(dict[str, object], json.loads(self.rfile.read()))
+            path = Path(str(request["file"]))
+            text = str(request["text"])
+        except (KeyError, TypeError, ValueError):
+            return
+        with self.server.check_lock:
+            diagnostics = self.server.langserver.check(path, text, DIAGNOSTICS_TIMEOUT_SECONDS)
+        if diagnostics is None:
+            reply: dict[str, object] = {"error": "timeout"}
+        else:
+            converted = (to_cli_diagnostic(path, d) for d in diagnostics)
+            reply = {"generalDiagnostics": [d for d in converted if d is not None]}
+        try:
+            self.wfile.write(json.dumps(reply).encode("utf-8"))
+        except OSError:
+            pass
+        self.server.last_request = time.monotonic()
+
+
+def _watchdog(server: CheckServer) -> None:
+    while True:
+        time.sleep(5)
+        idle = time.monotonic() - server.last_request
+        if idle > IDLE_SECONDS or not server.langserver.alive():
+            server.shutdown()
+            return
+
+
+def serve(root: Path) -> int:
+    executable = find_langserver()
+    if executable is None:
+        return 1
+    STATE_DIR.mkdir(parents=True, exist_ok=True)
+    lock_path = STATE_DIR / f"{root_digest(root)}.lock"
+    with lock_path.open("a+") as lock_file:
+        if fcntl is not None:
+            try:
+                fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+            except OSError:
+                # Another server already owns this root.
+                return 0
+        path = socket_path(root)
+        path.unlink(missing_ok=True)
+        langserver = LanguageServer(executable, root)
+        server = CheckServer(path, langserver)
+        os.chmod(path, 0o600)
+        threading.Thread(target=_watchdog, args=(server,), daemon=True).start()
+        try:
+            server.serve_forever()
+        finally:
+            server.server_close()
+            path.unlink(missing_ok=True)
+            langserver.close()
+    return 0
+
+
+def request_check(root: Path, path: Path, text: str, timeout: float) -> list[dict[str, object]] | None:
+    """Ask the warm server for `root` to check `path`.
+
+    Raises OSError when no server is listening, so the caller can start one.
+    Returns None when the server did not answer in time.
+    """
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        sock.connect(str(socket_path(root)))
+    except OSError:
+        sock.close()
+        raise
+    chunks: list[bytes] = []
+    try:
+        sock.settimeout(timeout)
+        sock.sendall(json.dumps({"file": str(path), "text": text}).encode("utf-8"))
+        sock.shutdown(socket.SHUT_WR)
+        while chunk := sock.recv(65536):
+            chunks.append(chunk)
+        reply = cast(dict[str, object], json.loads(b"".join(chunks)))
+    except (OSError, ValueError):
+        return None
+    finally:
+        sock.close()
+    diagnostics = reply.get("generalDiagnostics")
+    return cast(list[dict[str, object]], diagnostics) if isinstance(diagnostics, list) else None
+
+
+def start_server(root: Path) -> None:
+    """Launch a detached server for `root`; returns immediately."""
+    try:
+        _ = subprocess.Popen(
+            [sys.executable, str(Path(__file__).resolve()), str(root)],
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            start_new_session=True,
+        )
+    except OSError:
+        pass
+
+
+if __name__ == "__main__":
+    if len(sys.argv) != 2:
+        print("usage: basedpyright_server.py <project-root>", file=sys.stderr)
+        sys.exit(2)
+    sys.exit(serve(Path(sys.argv[1]).resolve()))
@@ -10,11 +10,12 @@ never drift onto different thresholds.
 
 from __future__ import annotations
 
+import hashlib
 import json
 import os
 import re
 from pathlib import Path
-from typing import TypedDict, cast
+from typing import BinaryIO, TypedDict, cast
 
 # Auto-compaction does NOT wait for the window. Reconstructed from the 2.1.220
 # binary (`Hds`/`Sfo`/`CSe`, still `W9`/`Bye`/`SQo` in 2.1.233), the trigger is
@@ -102,10 +103,20 @@ RESPONSE_TOKENS_CAP = 25_000
 BASE64_RUN = re.compile(r"[A-Za-z0-9+/=]{4096,}")
 IMAGE_TOKENS = 1_600
 
-# Bytes of transcript tail to scan for the most recent usage record.
+# Bytes of transcript tail to scan for the most recent usage record when a
+# transcript has no cursor yet (first call, or after truncation/rotation).
 TAIL_BYTES = 512 * 1024
 TAIL_BYTES_RETRY = 4 * 1024 * 1024
 
+# Per-transcript cursors for the incremental reader. The transcript only ever
+# grows by appending, so once a cursor exists each call reads just the bytes
+# written since the last one -- hook cost tracks new output, not window size.
+CURSOR_DIR = Path("/tmp/claude/context-usage")
+# Bytes just before the cursor, re-read on every call. A file that was
+# rewritten in place and happens to be at least as long as before would pass
+# the size check; these bytes will not match, and the cursor is rebuilt.
+CURSOR_CHECK_BYTES = 64
+
 # A compaction writes two adjacent entries: a `system` record carrying
 # `compactMetadata` and the `user` record holding the summary itself. Either one
 # marks the point where the previous context stopped existing, and the backward
@@ -163,6 +174,18 @@ class Reading(TypedDict):
     model: str | None
 
 
+class Cursor(TypedDict):
+    device: int
+    inode: int
+    # Byte offset just past the last complete line consumed.
+    offset: int
+    # Hex of the CURSOR_CHECK_BYTES ending at `offset`.
+    check: str
+    # Newest usage record so far, with `pending_bytes` covering every complete
+    # line after it. None before the first record or after a compaction.
+    reading: Reading | None
+
+
 class Measurement(TypedDict):
     tokens: int
     model: str | None
@@ -284,19 +307,6 @@ def resolve_transcript(payload: HookInput) -> Path | None:
     return main if main.is_file() else None
 
 
-def read_tail(path: Path, size: int) -> list[str]:
-    """Return complete lines from the last `size` bytes of a file."""
-    with path.open("rb") as handle:
-        _ = handle.seek(0, os.SEEK_END)
-        end = handle.tell()
-        start = max(0, end - size)
-        _ = handle.seek(start)
-        chunk = handle.read(end - start)
-    lines = chunk.decode("utf-8", errors="replace").splitlines()
-    # The first line is probably truncated unless we read from byte 0.
-    return lines if start == 0 else lines[1:]
-
-
 def pending_line_bytes(text: str) -> int:
     """A pending line's contribution, with base64 media priced as images."""
     if len(text) < 4096:
@@ -305,6 +315,156 @@ def pending_line_bytes(text: str) -> int:
     return len(stripped) + 1 + images * IMAGE_TOKENS * int(PENDING_BYTES_PER_TOKEN)
 
 
+def usage_reading(line: str) -> Reading | None:
+    """The reading a transcript line carries, if it is a billed assistant turn."""
+    if '"usage"' not in line or '"assistant"' not in line:
+        return None
+    try:
+        entry = cast(TranscriptEntry, json.loads(line))
+    except ValueError:
+        return None
+    if entry.get("type") != "assistant":
+        return None
+    message = entry.get("message")
+    if message is None:
+        return None
+    usage = message.get("usage")
+    if usage is None:
+        return None
+    tokens = (
+        usage.get("input_tokens", 0)
+        + usage.get("cache_creation_input_tokens", 0)
+        + usage.get("cache_read_input_tokens", 0)
+    )
+    if tokens <= 0:
+        return None
+    return {
+        "tokens": tokens,
+        "pending_bytes": 0,
+        "is_sidechain": entry.get("isSidechain", False),
+        "model": message.get("model"),
+    }
+
+
+def advance(reading: Reading | None, line: str) -> Reading | None:
+    """Fold one more transcript line into the reading that preceded it.
+
+    A compaction marker discards everything before it (see `latest_reading`),
+    a usage record starts a fresh reading, and anything else is pending.
+    """
+    if any(marker in line for marker in COMPACT_MARKERS):
+        return None
+    fresh = usage_reading(line)
+    if fresh is not None:
+        return fresh
+    if reading is None:
+        return None
+    return {**reading, "pending_bytes": reading["pending_bytes"] + pending_line_bytes(line)}
+
+
+def cursor_path(path: Path) -> Path:
+    digest = hashlib.sha1(str(path.resolve()).encode("utf-8")).hexdigest()[:16]
+    return CURSOR_DIR / f"{digest}.json"
+
+
+def load_cursor(path: Path) -> Cursor | None:
+    try:
+        raw = cast(dict[str, object], json.loads(cursor_path(path).read_text(encoding="utf-8")))
+    except (OSError, ValueError):
+        return None
+    if not isinstance(raw, dict):
+        return None
+    ints = (raw.get("device"), raw.get("inode"), raw.get("offset"))
+    if not all(isinstance(value, int) for value in ints):
+        return None
+    if not isinstance(raw.get("check"), str):
+        return None
+    if not isinstance(raw.get("reading"), (dict, type(None))):
+        return None
+    return cast(Cursor, cast(object, raw))
+
+
+def save_cursor(path: Path, cursor: Cursor) -> None:
+    target = cursor_path(path)
+    tmp = target.with_name(f".{target.name}.{os.getpid()}.tmp")
+    try:
+        target.parent.mkdir(parents=True, exist_ok=True)
+        _ = tmp.write_text(json.dumps(cursor), encoding="utf-8")
+        _ = tmp.replace(target)
+    except OSError:
+        # Without a saved cursor the next call just seeds from the tail again.
+        pass
+
+
+def check_bytes(handle: BinaryIO, offset: int) -> str:
+    start = max(0, offset - CURSOR_CHECK_BYTES)
+    _ = handle.seek(start)
+    return handle.read(offset - start).hex()
+
+
+def consume(cursor: Cursor, chunk: bytes) -> bytes:
+    """Fold every complete line of `chunk` into `cursor`; return the remainder.
+
+    `chunk` must start at `cursor["offset"]`. The trailing partial line (a write
+    still in flight) is left out of the cursor so the next call sees it whole.
+    """
+    end = chunk.rfind(b"\n") + 1
+    reading = cursor["reading"]
+    for raw in chunk[:end].split(b"\n")[:-1]:
+        reading = advance(reading, raw.decode("utf-8", errors="replace"))
+    cursor["reading"] = reading
+    if end:
+        previous = bytes.fromhex(cursor["check"])
+        cursor["check"] = (previous + chunk[:end])[-CURSOR_CHECK_BYTES:].hex()
+        cursor["offset"] += end
+    return chunk[end:]
+
+
+def seed_cursor(handle: BinaryIO, stat: os.stat_result) -> tuple[Cursor, bytes]:
+    """A cursor built from the transcript tail, plus the unconsumed remainder.
+
+    Reads the last TAIL_BYTES, widened to TAIL_BYTES_RETRY when that holds
+    neither a usage record nor a compaction marker.
+    """
+    size = stat.st_size
+    for window in (TAIL_BYTES, TAIL_BYTES_RETRY):
+        start = max(0, size - window)
+        _ = handle.seek(start)
+        chunk = handle.read(size - start)
+        if start > 0:
+            # The first line is probably truncated unless we read from byte 0.
+            newline = chunk.find(b"\n")
+            if newline < 0:
+                start, chunk = size, b""
+            else:
+                start, chunk = start + newline + 1, chunk[newline + 1 :]
+        cursor: Cursor = {
+            "device": stat.st_dev,
+            "inode": stat.st_ino,
+            "offset": start,
+            "check": check_bytes(handle, start),
+            "reading": None,
+        }
+        seen_marker = any(marker.encode() in chunk for marker in COMPACT_MARKERS)
+        rest = consume(cursor, chunk)
+        if cursor["reading"] is not None or seen_marker or start == 0 or size <= window:
+            return cursor, rest
+    return cursor, rest
+
+
+def cursor_valid(cursor: Cursor, stat: os.stat_result, handle: BinaryIO) -> bool:
+    """True when the transcript is still the file the cursor was built from.
+
+    A different inode means rotation, a size below the offset means truncation,
+    and a mismatch in the bytes before the offset means an in-place rewrite.
+    """
+    if (cursor["device"], cursor["inode"]) != (stat.st_dev, stat.st_ino):
+        return False
+    if stat.st_size < cursor["offset"]:
+        return False
+    return check_bytes(handle, cursor["offset"]) == cursor["check"]
+
+
 def latest_reading(path: Path) -> Reading | None:
     """Tokens in the context window as of the most recent assistant turn.
 
@@ -327,41 +487,31 @@ def latest_reading(path: Path) -> Reading | None:
     and project files that reload with it, which is the direction this file
     refuses to err in everywhere else. Staying silent costs exactly one tool
     call, because the next assistant turn writes a real post-compaction record.
+
+    The transcript is read incrementally: a cursor under CURSOR_DIR remembers
+    the offset, the reading and its pending bytes, so each call folds in only
+    the lines appended since. A missing or invalid cursor is rebuilt from the
+    tail window.
     """
-    for size in (TAIL_BYTES, TAIL_BYTES_RETRY):
-        lines = read_tail(path, size)
-        for offset, line in enumerate(reversed(lines)):
-            if any(marker in line for marker in COMPACT_MARKERS):
-                return None
-            if '"usage"' not in line or '"assistant"' not in line:
-                continue
-            try:
-                entry = cast(TranscriptEntry, json.loads(line))
-            except ValueError:
-                continue
-            if entry.get("type") != "assistant":
-                continue
-            message = entry.get("message")
-            if message is None:
-                continue
-            usage = message.get("usage")
-            if usage is None:
-                continue
-            tokens = (
-                usage.get("input_tokens", 0)
-                + usage.get("cache_creation_input_tokens", 0)
-                + usage.get("cache_read_input_tokens", 0)
-            )
-            if tokens <= 0:
-                continue
-            after = lines[len(lines) - offset :]
-            return {
-                "tokens": tokens,
-                "pending_bytes": sum(pending_line_bytes(text) for text in after),
-                "is_sidechain": entry.get("isSidechain", False),
-                "model": message.get("model"),
-            }
-    return None
+    try:
+        handle = path.open("rb")
+    except OSError:
+        return None
+    with handle:
+        stat = os.fstat(handle.fileno())
+        cursor = load_cursor(path)
+        if cursor is None or not cursor_valid(cursor, stat, handle):
+            cursor, rest = seed_cursor(handle, stat)
+        else:
+            _ = handle.seek(cursor["offset"])
+            rest = consume(cursor, handle.read(stat.st_size - cursor["offset"]))
+    save_cursor(path, cursor)
+    reading = cursor["reading"]
+    if rest:
+        # A line still being written counts now but is not committed, so the
+        # next call re-reads it once it is complete.
+        reading = advance(reading, rest.decode("utf-8", errors="replace"))
+    return reading
 
 
 def response_bytes(payload: HookInput) -> int:
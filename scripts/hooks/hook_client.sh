@@ -0,0 +1,82 @@
+#!/usr/bin/env bash
+# Hook shim: run a hook script through the warm hook daemon when one is up.
+#
+# Usage (settings.json):
+#     ~/.claude/scripts/hooks/hook_client.sh <hook-script.py>
+#
+# Every hook used to pay a cold interpreter plus its library imports and config
+# reads on each tool call. `hook_daemon.py` keeps those libraries loaded; this
+# shim forwards the hook's stdin, environment and cwd over the daemon's Unix
+# socket with `nc -U` and replays the hook's stdout, stderr and exit code, so a
+# routed hook costs a bash start instead of a Python one.
+#
+# Request:  <hook>\n<cwd>\n<stdin byte length>\n<`env -0`>\0<stdin>
+# Reply:    ok\n<exit code>\n<stderr byte length>\n<stderr><stdout>
+#
+# The daemon sends `ok` as soon as it accepts. Without it (no socket, nothing
+# listening, no nc) the hook runs directly, exactly as if invoked without the
+# shim, so routing a hook through it is always safe. After `ok` the hook is
+# never re-run here: a hook with side effects (counter bumps, block markers)
+# must not run twice.
+
+set -u
+shopt -s lastpipe
+
+HOOKS_DIR="${BASH_SOURCE[0]%/*}"
+SOCKET_PATH="/tmp/claude/hook-daemon.sock"
+PYTHON="/opt/homebrew/bin/python3"
+[[ -x "$PYTHON" ]] || PYTHON="python3"
+# Long enough for the slowest routed hook (basedpyright's own 10 s timeout)
+# plus slack. On expiry the hook reports nothing rather than blocking the tool.
+REQUEST_TIMEOUT_SECONDS=30
+
+hook="${1:-}"
+# Only bare file names, so the socket can never be pointed outside this dir.
+if [[ -z "$hook" || "$hook" == */* || "$hook" != *.py || ! -f "$HOOKS_DIR/$hook" ]]; then
+    echo "hook_client: no hook script '$hook' in $HOOKS_DIR" >&2
+    exit 2
+fi
+
+if [[ ! -S "$SOCKET_PATH" ]] || ! command -v nc >/dev/null; then
+    exec "$PYTHON" "$HOOKS_DIR/$hook"
+fi
+
+# byte_length <string> <var>
+byte_length() {
+    local LC_ALL=C
+    printf -v "$2" '%d' "${#1}"
+}
+
+# read_bytes <count> <var>
+read_bytes() {
+    local LC_ALL=C
+    IFS= read -r -N "$1" "$2"
+}
+
+payload="$(cat; printf x)"
+payload="${payload%x}"
+byte_length "$payload" payload_bytes
+
+taken=false
+code=0
+{
+    printf '%s\n%s\n%s\n' "$hook" "$PWD" "$payload_bytes"
+    env -0
+    printf '\0%s' "$payload"
+} | nc -U -w "$REQUEST_TIMEOUT_SECONDS" "$SOCKET_PATH" 2>/dev/null | {
+    if IFS= read -r ack && [[ "$ack" == ok ]]; then
+        taken=true
+        IFS= read -r code || code=0
+        IFS= read -r err_bytes || err_bytes=0
+        err=""
+        (( err_bytes > 0 )) && read_bytes "$err_bytes" err
+        printf '%s' "$err" >&2
+        cat
+    fi
+}
+
+if [[ "$taken" != true ]]; then
+    exec "$PYTHON" "$HOOKS_DIR/$hook" < <(printf '%s' "$payload")
+fi
+[[ "$code" =~ ^[0-9]+$ ]] || code=0
+exit "$code"
@@ -0,0 +1,270 @@
+#!/usr/bin/env python3
+"""Optional long-lived hook server behind `hook_client.sh`.
+
+Usage:
+    python3 hook_daemon.py serve     # run in the foreground (launchd does this)
+    python3 hook_daemon.py status    # exit 0 when a daemon answers
+    python3 hook_daemon.py stop      # SIGTERM the running daemon (launchd's
+                                     # KeepAlive restarts it; `launchctl bootout`
+                                     # to remove it for good)
+
+Install with launchd:
+    ln -s ~/.claude/scripts/hooks/com.natemccoy.claude-hook-daemon.plist ~/Library/LaunchAgents/
+    launchctl bootstrap gui/$(id -u) ~/Library/LaunchAgents/com.natemccoy.claude-hook-daemon.plist
+
+The parent process imports `banned_words_lib`, `context_usage` and
+`delegate_run` once, builds the banned-word matcher, and pre-compiles every
+hook script. Each request is served by a forked child, so it starts with all of
+that warm, and no hook can leak `os.environ`, cwd or stdio changes into the next
+one or stall a concurrent hook (basedpyright can take seconds; context usage
+runs alongside it on every edit).
+
+Before each fork the parent re-stats the hook sources and the style guide, so
+editing a library or the guide takes effect on the next request without a
+restart.
+
+The wire format (see `hook_client.sh`) is length-framed plain bytes rather than
+JSON so the client can stay a bash + `nc -U` shim.
+"""
+
+from __future__ import annotations
+
+import builtins
+import contextlib
+import importlib
+import io
+import os
+import signal
+import socket
+import socketserver
+import sys
+import traceback
+from pathlib import Path
+from types import CodeType
+
+HOOKS_DIR = Path(__file__).resolve().parent
+SOCKET_PATH = Path("/tmp/claude/hook-daemon.sock")
+sys.path.insert(0, str(HOOKS_DIR))
+
+WARM_MODULES = ("banned_words_lib", "context_usage", "delegate_run")
+
+# Compiled hook scripts keyed by path, with the mtime they were compiled at.
+_compiled: dict[Path, tuple[int, CodeType]] = {}
+# mtime of every hooks-dir module the parent has imported.
+_module_mtimes: dict[str, int] = {}
+
+
+def resolve_hook(name: str) -> Path | None:
+    """The hook script called `name` in this directory, or None.
+
+    Only bare file names are accepted so a request cannot point the daemon at
+    a script outside `scripts/hooks/`.
+    """
+    if not name or Path(name).name != name or not name.endswith(".py"):
+        return None
+    path = HOOKS_DIR / name
+    return path if path.is_file() else None
+
+
+def exit_code(exc: SystemExit) -> int:
+    """Map a SystemExit the way the interpreter would on exit."""
+    if exc.code is None:
+        return 0
+    if isinstance(exc.code, int):
+        return exc.code
+    print(exc.code, file=sys.stderr)
+    return 1
+
+
+def _mtime_ns(path: Path) -> int | None:
+    try:
+        return path.stat().st_mtime_ns
+    except OSError:
+        return None
+
+
+def _drop_stale_modules() -> None:
+    for name, loaded_at in list(_module_mtimes.items()):
+        if _mtime_ns(HOOKS_DIR / f"{name}.py") != loaded_at:
+            _ = sys.modules.pop(name, None)
+            del _module_mtimes[name]
+
+
+def _compile_hooks() -> None:
+    for path in HOOKS_DIR.glob("*.py"):
+        mtime = _mtime_ns(path)
+        if mtime is None:
+            continue
+        cached = _compiled.get(path)
+        if cached is not None and cached[0] == mtime:
+            continue
+        try:
+            _compiled[path] = (mtime, compile(path.read_bytes(), str(path), "exec"))
+        except (OSError, SyntaxError):
+            _ = _compiled.pop(path, None)
+
+
+def refresh() -> None:
+    """Bring the parent's warm state up to date with what is on disk."""
+    _drop_stale_modules()
+    for name in WARM_MODULES:
+        if name in sys.modules:
+            continue
+        mtime = _mtime_ns(HOOKS_DIR / f"{name}.py")
+        try:
+            _ = importlib.import_module(name)
+        except Exception:
+            continue
+        if mtime is not None:
+            _module_mtimes[name] = mtime
+    banned_words_lib = sys.modules.get("banned_words_lib")
+    if banned_words_lib is not None:
+        with contextlib.suppress(Exception):
+            _ = banned_words_lib.compiled_matcher()
+    _compile_hooks()
+
+
+def run_hook(hook: Path, payload: str, env: dict[str, str], cwd: str) -> tuple[str, str, int]:
+    """Execute `hook` as `__main__` in this (forked) process and capture it."""
+    os.environ.clear()
+    os.environ.update(env)
+    with contextlib.suppress(OSError):
+        os.chdir(cwd)
+    stdout = io.StringIO()
+    stderr = io.StringIO()
+    sys.stdin = io.StringIO(payload)
+    sys.stdout = stdout
+    sys.stderr = stderr
+    sys.argv = [str(hook)]
+    cached = _compiled.get(hook)
+    code = 0
+    try:
+        program = cached[1] if cached is not None else compile(hook.read_bytes(), str(hook), "exec")
+        exec(program, {"__name__": "__main__", "__file__": str(hook), "__builtins__": builtins})
+    except SystemExit as exc:
+        code = exit_code(exc)
+    except Exception:
+        traceback.print_exc()
+        code = 1
+    finally:
+        sys.stdout = sys.__stdout__
+        sys.stderr = sys.__stderr__
+    return stdout.getvalue(), stderr.getvalue(), code
+
+
+def _read_env(rfile: io.BufferedIOBase) -> dict[str, str]:
+    """`env -0` entries up to the empty entry that ends the block."""
+    env: dict[str, str] = {}
+    entry = bytearray()
+    while byte := rfile.read(1):
+        if byte != b"\0":
+            entry += byte
+            continue
+        if not entry:
+            break
+        name, _, value = entry.decode("utf-8", errors="surrogateescape").partition("=")
+        env[name] = value
+        entry.clear()
+    return env
+
+
+class HookHandler(socketserver.StreamRequestHandler):
+    def handle(self) -> None:
+        # Taken: from here on the client must not run the hook itself.
+        self._send(b"ok\n")
+        name = self.rfile.readline().decode("utf-8", errors="replace").rstrip("\n")
+        if name == "ping":
+            self._send(f"{os.getppid()}\n".encode())
+            return
+        cwd = self.rfile.readline().decode("utf-8", errors="surrogateescape").rstrip("\n")
+        try:
+            payload_bytes = int(self.rfile.readline())
+        except ValueError:
+            return
+        env = _read_env(self.rfile)
+        payload = self.rfile.read(payload_bytes).decode("utf-8", errors="replace")
+        hook = resolve_hook(name)
+        if hook is None:
+            self._reply(2, f"hook_daemon: unknown hook {name!r}\n", "")
+            return
+        stdout, stderr, code = run_hook(hook, payload, env or dict(os.environ), cwd or str(Path.home()))
+        self._reply(code, stderr, stdout)
+
+    def _reply(self, code: int, stderr: str, stdout: str) -> None:
+        err = stderr.encode("utf-8", errors="replace")
+        self._send(f"{code}\n{len(err)}\n".encode() + err + stdout.encode("utf-8", errors="replace"))
+
+    def _send(self, data: bytes) -> None:
+        with contextlib.suppress(OSError):
+            self.wfile.write(data)
+            self.wfile.flush()
+
+
+class HookServer(socketserver.ForkingMixIn, socketserver.UnixStreamServer):
+    def process_request(self, request: socket.socket, client_address: object) -> None:  # pyright: ignore[reportIncompatibleMethodOverride]
+        # Refresh in the parent so every child inherits the result and the work
+        # is done once per change rather than once per request.
+        refresh()
+        super().process_request(request, client_address)
+
+
+def _ping() -> int | None:
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        sock.settimeout(2.0)
+        sock.connect(str(SOCKET_PATH))
+        sock.sendall(b"ping\n")
+        reply = sock.makefile("rb")
+        if reply.readline() != b"ok\n":
+            return None
+        return int(reply.readline())
+    except (OSError, ValueError):
+        return None
+    finally:
+        sock.close()
+
+
+def serve() -> int:
+    if _ping() is not None:
+        print(f"hook_daemon: already running on {SOCKET_PATH}", file=sys.stderr)
+        return 1
+    SOCKET_PATH.parent.mkdir(parents=True, exist_ok=True)
+    # Nothing answered the ping, so any socket file left here is debris.
+    SOCKET_PATH.unlink(missing_ok=True)
+    refresh()
+    server = HookServer(str(SOCKET_PATH), HookHandler)
+    os.chmod(SOCKET_PATH, 0o600)
+    _ = signal.signal(signal.SIGTERM, lambda *_: sys.exit(0))
+    try:
+        server.serve_forever()
+    finally:
+        server.server_close()
+        SOCKET_PATH.unlink(missing_ok=True)
+    return 0
+
+
+def main() -> int:
+    command = sys.argv[1] if len(sys.argv) > 1 else ""
+    if command == "serve":
+        return serve()
+    if command == "status":
+        pid = _ping()
+        if pid is None:
+            print("hook_daemon: not running")
+            return 1
+        print(f"hook_daemon: running (pid {pid}) on {SOCKET_PATH}")
+        return 0
+    if command == "stop":
+        pid = _ping()
+        if pid is None:
+            print("hook_daemon: not running")
+            return 0
+        os.kill(pid, signal.SIGTERM)
+        print(f"hook_daemon: stopped pid {pid}")
+        return 0
+    print("usage: hook_daemon.py serve|status|stop", file=sys.stderr)
+    return 2
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -47,43 +47,28 @@ while [[ $# -gt 0 ]]; do
   esac
 done
 
-global_style_dir="$HOME/rust/nate_style/rust"
-repo_root=""
-repo_style_dir=""
-
+# File discovery (shared guide, repo docs/style, workspace member style dirs,
+# bevy gating, auto-fix and --scope filtering, --shuffle) lives in
+# style_files.py so style_history.py can resolve the same list without a fork.
+style_files_py="${0:A:h}/style_files.py"
+declare -a resolve_args=(--scope "$scope")
 if [[ -n "$project_root" ]]; then
-  project_root="$(cd "$project_root" && pwd -P)"
-  repo_root="$(git -C "$project_root" rev-parse --show-toplevel 2>/dev/null || true)"
-  if [[ -z "$repo_root" ]]; then
-    repo_root="$project_root"
-  fi
-else
-  repo_root="$(git rev-parse --show-toplevel 2>/dev/null || true)"
+  resolve_args+=(--project-root "$project_root")
 fi
-
-if [[ -n "$repo_root" ]]; then
-  repo_style_dir="$repo_root/docs/style"
+if [[ "$shuffle" == true ]]; then
+  resolve_args+=(--shuffle)
 fi
 
-# Workspace member style dirs: $repo_root/docs/<member>/style/
-declare -a member_style_dirs=()
-if [[ -n "$repo_root" && -d "$repo_root/docs" ]]; then
-  while IFS= read -r d; do
-    [[ -z "$d" ]] && continue
-    member_style_dirs+=("$d")
-  done < <(find "$repo_root/docs" -mindepth 2 -maxdepth 2 -type d -name style -print 2>/dev/null | LC_ALL=C sort)
+if [[ "$list_files" == true ]]; then
+  exec python3 "$style_files_py" --list-files "${resolve_args[@]}"
 fi
 
-# ── Bevy detection ──────────────────────────────────────────────
-# Check if any Cargo.toml in the repo depends on bevy.
-is_bevy=false
-if [[ -n "$repo_root" ]]; then
-  if grep -rq '^\s*bevy\s*=' "$repo_root/Cargo.toml" 2>/dev/null; then
-    is_bevy=true
-  fi
-fi
+# Sets repo_root, is_bevy, skipped_{bevy,auto_fix,review}, member_style_dirs
+# and the {global,repo,member}_style_files / style_files arrays.
+declare -a style_files=() global_style_files=() repo_style_files=() member_style_files=() member_style_dirs=()
+eval "$(python3 "$style_files_py" --emit-zsh "${resolve_args[@]}")"
 
-# Check frontmatter tags for the bevy tag. Returns 0 if tagged bevy.
+# Check frontmatter tags for a tag. Returns 0 if tagged.
 has_tag() {
   local file="$1"
   local tag="$2"
@@ -103,62 +88,6 @@ has_tag() {
   ' tag="$tag" "$file" 2>/dev/null
 }
 
-# Check frontmatter tags for the bevy tag. Returns 0 if tagged bevy.
-has_bevy_tag() {
-  has_tag "$1" bevy
-}
-
-# Read a top-level scalar frontmatter value (e.g. `mechanism: clippy`).
-# Prints the value to stdout, or empty string if absent.
-frontmatter_value() {
-  local file="$1"
-  local key="$2"
-
-  awk '
-    NR==1 && /^---$/ { in_fm=1; next }
-    in_fm && /^---$/ { exit }
-    in_fm {
-      # Match `key: value` at top level (no leading whitespace).
-      if ($0 ~ "^"key":[[:space:]]") {
-        value=$0
-        sub("^"key":[[:space:]]+", "", value)
-        sub(/[[:space:]]+$/, "", value)
-        # Strip surrounding quotes if any.
-        if (value ~ /^".*"$/ || value ~ /^'\''.*'\''$/) {
-          value = substr(value, 2, length(value) - 2)
-        }
-        print value
-        exit
-      }
-    }
-  ' key="$key" "$file" 2>/dev/null
-}
-
-# Returns 0 if the file is enforced by tooling that auto-fixes (no LLM needed).
-# Skipped by the loader so /rust_style does not waste context on rules
-# clippy/mend/rustfmt apply mechanically.
-is_auto_fix() {
-  local file="$1"
-  local mech mode
-  mech="$(frontmatter_value "$file" mechanism)"
-  mode="$(frontmatter_value "$file" mode)"
-  case "$mech" in
-    clippy|mend|rustfmt)
-      [[ "$mode" == "auto" ]] && return 0
-      ;;
-  esac
-  return 1
-}
-
-# Returns 0 if the file is tagged `scope: review` — a rule about where code
-# lives (module boundaries, file placement, Cargo.toml deps) rather than what
-# to type. Skipped under `--scope edit` so a coding agent does not carry
-# structural-audit rules it cannot act on mid-edit. Review callers pass no
-# --scope and still get everything.
-is_review_only() {
-  [[ "$(frontmatter_value "$1" scope)" == "review" ]]
-}
-
 # Emit one wikilink stem per line from a file's `see_also:` frontmatter entry.
 # Supports single-line `see_also: "[[stem]]"` and multi-line list forms:
 #   see_also:
@@ -209,74 +138,6 @@ extract_see_also() {
   ' "$1"
 }
 
-# ── Collect style files ─────────────────────────────────────────
-declare -a style_files=()
-declare -a global_style_files=()
-declare -a repo_style_files=()
-declare -a member_style_files=()
-declare -a non_negotiable_files=()
-skipped_bevy=0
-skipped_auto_fix=0
-skipped_review=0
-
-if [[ -d "$global_style_dir" ]]; then
-  while IFS= read -r file; do
-    if [[ "$is_bevy" == false ]] && has_bevy_tag "$file"; then
-      skipped_bevy=$((skipped_bevy + 1))
-      continue
-    fi
-    if is_auto_fix "$file"; then
-      skipped_auto_fix=$((skipped_auto_fix + 1))
-      continue
-    fi
-    if [[ "$scope" == edit ]] && is_review_only "$file"; then
-      skipped_review=$((skipped_review + 1))
-      continue
-    fi
-    global_style_files+=("$file")
-    if has_tag "$file" non-negotiable; then
-      non_negotiable_files+=("$file")
-    fi
-    style_files+=("$file")
-  done < <(find "$global_style_dir" -maxdepth 1 -type f -name '*.md' -print | LC_ALL=C sort)
-fi
-
-if [[ -n "$repo_style_dir" && -d "$repo_style_dir" ]]; then
-  while IFS= read -r file; do
-    if is_auto_fix "$file"; then
-      skipped_auto_fix=$((skipped_auto_fix + 1))
-      continue
-    fi
-    if [[ "$scope" == edit ]] && is_review_only "$file"; then
-      skipped_review=$((skipped_review + 1))
-      continue
-    fi
-    if has_tag "$file" non-negotiable; then
-      non_negotiable_files+=("$file")
-    fi
-    repo_style_files+=("$file")
-    style_files+=("$file")
-  done < <(find "$repo_style_dir" -maxdepth 1 -type f -name '*.md' -print | LC_ALL=C sort)
-fi
-
-for dir in "${member_style_dirs[@]}"; do
-  while IFS= read -r file; do
-    if is_auto_fix "$file"; then
-      skipped_auto_fix=$((skipped_auto_fix + 1))
-      continue
-    fi
-    if [[ "$scope" == edit ]] && is_review_only "$file"; then
-      skipped_review=$((skipped_review + 1))
-      continue
-    fi
-    if has_tag "$file" non-negotiable; then
-      non_negotiable_files+=("$file")
-    fi
-    member_style_files+=("$file")
-    style_files+=("$file")
-  done < <(find "$dir" -maxdepth 1 -type f -name '*.md' -print | LC_ALL=C sort)
-done
-
 typeset -A file_non_negotiable=()
 typeset -A file_see_also=()  # file -> newline-separated wikilink stems
 typeset -A stem_to_file=()   # wikilink stem -> resolved file path
@@ -292,34 +153,6 @@ for file in "${style_files[@]}"; do
   fi
 done
 
-# ── Shuffle if requested ────────────────────────────────────────
-# Non-negotiable files pin to the top in stable order; everything else shuffles.
-if [[ "$shuffle" == true && ${#style_files[@]} -gt 1 ]]; then
-  pinned=()
-  shuffle_pool=()
-  for file in "${style_files[@]}"; do
-    if [[ -n "${file_non_negotiable[$file]:-}" ]]; then
-      pinned+=("$file")
-    else
-      shuffle_pool+=("$file")
-    fi
-  done
-
-  shuffled_pool=()
-  while IFS= read -r entry; do
-    shuffled_pool+=("$entry")
-  done < <(printf '%s\n' "${shuffle_pool[@]}" | sort -R)
-
-  style_files=("${pinned[@]}" "${shuffled_pool[@]}")
-fi
-
-if [[ "$list_files" == true ]]; then
-  if [[ ${#style_files[@]} -gt 0 ]]; then
-    printf '%s\n' "${style_files[@]}"
-  fi
-  exit 0
-fi
-
 # ── Helpers ─────────────────────────────────────────────────────
 # Strip frontmatter, and under `--scope edit` also drop body-level `regex:`
 # lines. Those are matcher patterns for banned_words_lib.py (which parses
@@ -382,7 +215,7 @@ total_files="${#style_files[@]}"
 global_files="${#global_style_files[@]}"
 repo_files="${#repo_style_files[@]}"
 member_files="${#member_style_files[@]}"
-non_negotiable_count="${#non_negotiable_files[@]}"
+non_negotiable_count="${#file_non_negotiable}"
 
 bevy_note=""
 if [[ "$is_bevy" == true ]]; then
@@ -0,0 +1,286 @@
+#!/usr/bin/env python3
+"""Resolve which Rust style files apply to a project.
+
+Usage:
+    python3 style_files.py --list-files [--shuffle] [--scope edit|all] [--project-root PATH]
+    python3 style_files.py --emit-zsh [--shuffle] [--scope edit|all] [--project-root PATH]
+
+This is the one implementation of the loader's resolution rules:
+
+- the shared guide in `~/rust/nate_style/rust/*.md`, minus `bevy`-tagged rules
+  unless the repo's root Cargo.toml depends on bevy;
+- the repo's own `docs/style/*.md`;
+- workspace member dirs `docs/<member>/style/*.md`;
+- in every group, rules a tool auto-fixes (`mechanism: clippy|mend|rustfmt`
+  with `mode: auto`) are dropped, and `scope: review` rules are dropped under
+  `--scope edit`.
+
+`load-rust-style.sh` calls it for the file list and renders the guide from the
+result; `style_history.py` imports it directly so listing units costs no shell
+fork. `--emit-zsh` prints the resolved groups as zsh assignments for the loader
+to `eval`.
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import random
+import re
+import shlex
+import sys
+from dataclasses import dataclass
+from pathlib import Path
+
+GLOBAL_STYLE_DIR = Path.home() / "rust" / "nate_style" / "rust"
+
+AUTO_FIX_MECHANISMS = frozenset({"clippy", "mend", "rustfmt"})
+
+_BEVY_DEPENDENCY_RE = re.compile(r"^\s*bevy\s*=", re.MULTILINE)
+_LIST_ITEM_RE = re.compile(r"\s*-\s*")
+
+
+@dataclass(frozen=True)
+class StyleFiles:
+    """The style files one project is judged against, grouped by origin."""
+
+    repo_root: Path | None
+    global_files: tuple[Path, ...]
+    repo_files: tuple[Path, ...]
+    member_files: tuple[Path, ...]
+    member_dirs: tuple[Path, ...]
+    is_bevy: bool
+    skipped_bevy: int
+    skipped_auto_fix: int
+    skipped_review: int
+
+    @property
+    def files(self) -> tuple[Path, ...]:
+        return self.global_files + self.repo_files + self.member_files
+
+
+def frontmatter_lines(path: Path) -> list[str]:
+    """Lines between the opening `---` and the closing one (or EOF)."""
+    try:
+        text = path.read_text()
+    except (OSError, UnicodeDecodeError):
+        return []
+    lines = text.split("\n")
+    if lines[0] != "---":
+        return []
+    body: list[str] = []
+    for line in lines[1:]:
+        if line == "---":
+            break
+        body.append(line)
+    return body
+
+
+def has_tag(frontmatter: list[str], tag: str) -> bool:
+    """True when any frontmatter list item is exactly `tag`."""
+    for line in frontmatter:
+        match = _LIST_ITEM_RE.match(line)
+        if match is not None and line[match.end() :] == tag:
+            return True
+    return False
+
+
+def frontmatter_value(frontmatter: list[str], key: str) -> str:
+    """A top-level scalar (`key: value`) with surrounding quotes stripped."""
+    pattern = re.compile(rf"^{re.escape(key)}:\s+")
+    for line in frontmatter:
+        match = pattern.match(line)
+        if match is None:
+            continue
+        value = line[match.end() :].rstrip()
+        if len(value) >= 2 and value[0] == value[-1] and value[0] in "\"'":
+            value = value[1:-1]
+        return value
+    return ""
+
+
+def is_auto_fix(frontmatter: list[str]) -> bool:
+    return (
+        frontmatter_value(frontmatter, "mechanism") in AUTO_FIX_MECHANISMS
+        and frontmatter_value(frontmatter, "mode") == "auto"
+    )
+
+
+def is_review_only(frontmatter: list[str]) -> bool:
+    return frontmatter_value(frontmatter, "scope") == "review"
+
+
+def find_repo_root(start: Path) -> Path | None:
+    """The enclosing git work tree, found by walking up to a `.git` entry.
+
+    `.git` may be a directory or, in worktrees and submodules, a file — either
+    marks the top level, as `git rev-parse --show-toplevel` would report it.
+    """
+    for candidate in (start, *start.parents):
+        if (candidate / ".git").exists():
+            return candidate
+    return None
+
+
+def depends_on_bevy(repo_root: Path) -> bool:
+    try:
+        manifest = (repo_root / "Cargo.toml").read_text()
+    except (OSError, UnicodeDecodeError):
+        return False
+    return _BEVY_DEPENDENCY_RE.search(manifest) is not None
+
+
+def _markdown_files(directory: Path) -> list[Path]:
+    try:
+        with os.scandir(directory) as entries:
+            paths = [
+                entry.path
+                for entry in entries
+                if entry.name.endswith(".md") and entry.is_file(follow_symlinks=False)
+            ]
+    except OSError:
+        return []
+    return [Path(path) for path in sorted(paths)]
+
+
+def _member_style_dirs(repo_root: Path) -> list[Path]:
+    docs = repo_root / "docs"
+    found: list[str] = []
+    try:
+        with os.scandir(docs) as members:
+            member_paths = [entry.path for entry in members if entry.is_dir(follow_symlinks=False)]
+    except OSError:
+        return []
+    for member in member_paths:
+        try:
+            with os.scandir(member) as entries:
+                found.extend(
+                    entry.path
+                    for entry in entries
+                    if entry.name == "style" and entry.is_dir(follow_symlinks=False)
+                )
+        except OSError:
+            continue
+    return [Path(path) for path in sorted(found)]
+
+
+_resolved: dict[tuple[Path | None, str], StyleFiles] = {}
+
+
+def resolve(project_root: Path | None = None, scope: str = "all") -> StyleFiles:
+    """Style files for `project_root` (or the cwd's repo), memoized per process."""
+    if project_root is not None:
+        project_root = project_root.resolve()
+    key = (project_root, scope)
+    cached = _resolved.get(key)
+    if cached is not None:
+        return cached
+
+    if project_root is not None:
+        repo_root = find_repo_root(project_root) or project_root
+    else:
+        repo_root = find_repo_root(Path.cwd().resolve())
+    is_bevy = repo_root is not None and depends_on_bevy(repo_root)
+    skipped_bevy = 0
+    skipped_auto_fix = 0
+    skipped_review = 0
+
+    def keep(path: Path, *, bevy_gated: bool) -> bool:
+        nonlocal skipped_bevy, skipped_auto_fix, skipped_review
+        frontmatter = frontmatter_lines(path)
+        if bevy_gated and not is_bevy and has_tag(frontmatter, "bevy"):
+            skipped_bevy += 1
+            return False
+        if is_auto_fix(frontmatter):
+            skipped_auto_fix += 1
+            return False
+        if scope == "edit" and is_review_only(frontmatter):
+            skipped_review += 1
+            return False
+        return True
+
+    global_files = [path for path in _markdown_files(GLOBAL_STYLE_DIR) if keep(path, bevy_gated=True)]
+    repo_files: list[Path] = []
+    member_dirs: list[Path] = []
+    member_files: list[Path] = []
+    if repo_root is not None:
+        repo_files = [path for path in _markdown_files(repo_root / "docs" / "style") if keep(path, bevy_gated=False)]
+        member_dirs = _member_style_dirs(repo_root)
+        for directory in member_dirs:
+            member_files.extend(path for path in _markdown_files(directory) if keep(path, bevy_gated=False))
+
+    resolved = StyleFiles(
+        repo_root=repo_root,
+        global_files=tuple(global_files),
+        repo_files=tuple(repo_files),
+        member_files=tuple(member_files),
+        member_dirs=tuple(member_dirs),
+        is_bevy=is_bevy,
+        skipped_bevy=skipped_bevy,
+        skipped_auto_fix=skipped_auto_fix,
+        skipped_review=skipped_review,
+    )
+    _resolved[key] = resolved
+    return resolved
+
+
+def shuffled(files: tuple[Path, ...]) -> list[Path]:
+    """Non-negotiable files pinned to the top in stable order; the rest shuffled."""
+    pinned: list[Path] = []
+    pool: list[Path] = []
+    for path in files:
+        (pinned if has_tag(frontmatter_lines(path), "non-negotiable") else pool).append(path)
+    random.shuffle(pool)
+    return pinned + pool
+
+
+def _zsh_array(name: str, values: list[Path] | tuple[Path, ...]) -> str:
+    return f"{name}=({' '.join(shlex.quote(str(value)) for value in values)})"
+
+
+def emit_zsh(resolved: StyleFiles, style_files: list[Path]) -> str:
+    repo_root = str(resolved.repo_root) if resolved.repo_root is not None else ""
+    return "\n".join(
+        [
+            f"repo_root={shlex.quote(repo_root)}",
+            f"is_bevy={'true' if resolved.is_bevy else 'false'}",
+            f"skipped_bevy={resolved.skipped_bevy}",
+            f"skipped_auto_fix={resolved.skipped_auto_fix}",
+            f"skipped_review={resolved.skipped_review}",
+            _zsh_array("member_style_dirs", resolved.member_dirs),
+            _zsh_array("global_style_files", resolved.global_files),
+            _zsh_array("repo_style_files", resolved.repo_files),
+            _zsh_array("member_style_files", resolved.member_files),
+            _zsh_array("style_files", style_files),
+        ]
+    )
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    output = parser.add_mutually_exclusive_group(required=True)
+    _ = output.add_argument("--list-files", action="store_true")
+    _ = output.add_argument("--emit-zsh", action="store_true")
+    _ = parser.add_argument("--shuffle", action="store_true")
+    _ = parser.add_argument("--scope", choices=("edit", "all"), default="all")
+    _ = parser.add_argument("--project-root", type=Path)
+    return parser.parse_args()
+
+
+def main() -> int:
+    args = parse_args()
+    project_root = args.project_root if isinstance(args.project_root, Path) else None  # pyright: ignore[reportAny]
+    if project_root is not None and not project_root.is_dir():
+        print(f"error: --project-root is not a directory: {project_root}", file=sys.stderr)
+        return 2
+    resolved = resolve(project_root, str(args.scope))  # pyright: ignore[reportAny]
+    style_files = shuffled(resolved.files) if args.shuffle else list(resolved.files)  # pyright: ignore[reportAny]
+    if args.emit_zsh:  # pyright: ignore[reportAny]
+        print(emit_zsh(resolved, style_files))
+    elif style_files:
+        print("\n".join(str(path) for path in style_files))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())